@@ -1,20 +1,29 @@
 """Accept all tracked changes in a DOCX file using LibreOffice.
 
 Requires LibreOffice (soffice) to be installed.
+
+Usage:
+    python accept_changes.py input.docx output.docx
+    python accept_changes.py a.docx b.docx ... --output-dir DIR [--jobs N]
+
+With --output-dir, every input is written to DIR under its own name, and
+the documents are processed in parallel on a SofficePool.
 """
 
 import argparse
 import logging
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from office.soffice import get_soffice_env
+from office.soffice import SofficePool, get_soffice_env
 
 logger = logging.getLogger(__name__)
 
 LIBREOFFICE_PROFILE = "/tmp/libreoffice_docx_profile"
 MACRO_DIR = f"{LIBREOFFICE_PROFILE}/user/basic/Standard"
+MACRO_URL = "vnd.sun.star.script:Standard.Module1.AcceptAllTrackedChanges?language=Basic&location=application"
 
 ACCEPT_CHANGES_MACRO = """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE script:module PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "module.dtd">
@@ -36,6 +45,7 @@ ACCEPT_CHANGES_MACRO = """<?xml version="1.0" encoding="UTF-8"?>
 def accept_changes(
     input_file: str,
     output_file: str,
+    pool: SofficePool | None = None,
 ) -> tuple[None, str]:
     input_path = Path(input_file)
     output_path = Path(output_file)
@@ -52,32 +62,37 @@ def accept_changes(
     except Exception as e:
         return None, f"Error: Failed to copy input file to output location: {e}"
 
-    if not _setup_libreoffice_macro():
+    if pool is None and not _setup_libreoffice_macro():
         return None, "Error: Failed to setup LibreOffice macro"
 
-    cmd = [
-        "soffice",
-        "--headless",
-        f"-env:UserInstallation=file://{LIBREOFFICE_PROFILE}",
-        "--norestore",
-        "vnd.sun.star.script:Standard.Module1.AcceptAllTrackedChanges?language=Basic&location=application",
-        str(output_path.absolute()),
-    ]
-
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30,
-            check=False,
-            env=get_soffice_env(),
-        )
+        if pool is not None:
+            result = pool.run(
+                [MACRO_URL, str(output_path.absolute())], setup=_install_macro
+            )
+        else:
+            result = subprocess.run(
+                [
+                    "soffice",
+                    "--headless",
+                    f"-env:UserInstallation=file://{LIBREOFFICE_PROFILE}",
+                    "--norestore",
+                    MACRO_URL,
+                    str(output_path.absolute()),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                check=False,
+                env=get_soffice_env(),
+            )
     except subprocess.TimeoutExpired:
         return (
             None,
             f"Successfully accepted all tracked changes: {input_file} -> {output_file}",
         )
+    except OSError as e:
+        return None, f"Error: LibreOffice failed: {e}"
 
     if result.returncode != 0:
         return None, f"Error: LibreOffice failed: {result.stderr}"
@@ -88,6 +103,32 @@ def accept_changes(
     )
 
 
+def accept_changes_many(
+    input_files: list[str], output_dir: str, jobs: int = 2
+) -> list[str]:
+    """Accept changes in each input, writing output_dir/<name>; one message each."""
+    outputs = [Path(output_dir) / Path(f).name for f in input_files]
+    if len(set(outputs)) != len(outputs):
+        names = sorted({o.name for o in outputs if outputs.count(o) > 1})
+        return [f"Error: Inputs share an output name: {', '.join(names)}"]
+
+    workers = max(1, min(jobs, len(input_files)))
+    with SofficePool(workers=workers) as pool, ThreadPoolExecutor(workers) as executor:
+        results = executor.map(
+            lambda pair: accept_changes(pair[0], str(pair[1]), pool=pool)[1],
+            zip(input_files, outputs),
+        )
+        return list(results)
+
+
+def _install_macro(profile: Path):
+    macro_file = profile / "user" / "basic" / "Standard" / "Module1.xba"
+    if macro_file.exists() and "AcceptAllTrackedChanges" in macro_file.read_text():
+        return
+    macro_file.parent.mkdir(parents=True, exist_ok=True)
+    macro_file.write_text(ACCEPT_CHANGES_MACRO)
+
+
 def _setup_libreoffice_macro() -> bool:
     macro_dir = Path(MACRO_DIR)
     macro_file = macro_dir / "Module1.xba"
@@ -122,14 +163,32 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Accept all tracked changes in a DOCX file"
     )
-    parser.add_argument("input_file", help="Input DOCX file with tracked changes")
     parser.add_argument(
-        "output_file", help="Output DOCX file (clean, no tracked changes)"
+        "files",
+        nargs="+",
+        help="Input and output DOCX file, or several inputs with --output-dir",
+    )
+    parser.add_argument(
+        "--output-dir", help="Directory for the clean copies of several inputs"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=2,
+        help="Parallel soffice workers with --output-dir (default: 2)",
     )
     args = parser.parse_args()
 
-    _, message = accept_changes(args.input_file, args.output_file)
-    print(message)
+    if args.output_dir is not None:
+        messages = accept_changes_many(args.files, args.output_dir, args.jobs)
+    elif len(args.files) == 2:
+        messages = [accept_changes(*args.files)[1]]
+    else:
+        parser.error("give an input and an output file, or use --output-dir")
+
+    for message in messages:
+        print(message)
 
-    if "Error" in message:
+    if any("Error" in message for message in messages):
         raise SystemExit(1)
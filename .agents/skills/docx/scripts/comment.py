@@ -3,6 +3,12 @@
 Usage:
     python comment.py unpacked/ 0 "Comment text"
     python comment.py unpacked/ 1 "Reply text" --parent 0
+    python comment.py unpacked/ --batch comments.json
+
+A batch file is a JSON list such as
+    [{"id": 0, "text": "Comment"}, {"id": 1, "text": "Reply", "parent": 0}]
+with optional "author" and "initials" per entry. Each part is read and
+written once for the whole batch, and nothing is written if any entry fails.
 
 Text should be pre-escaped XML (e.g., &amp; for &, &#x2019; for smart quotes).
 
@@ -14,11 +20,15 @@ After running, add markers to document.xml:
 """
 
 import argparse
+import json
+import os
 import random
 import shutil
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from xml.parsers.expat import ExpatError
 
 import defusedxml.minidom
 
@@ -83,30 +93,26 @@ def _encode_smart_quotes(text: str) -> str:
     return text
 
 
-def _append_xml(xml_path: Path, root_tag: str, content: str) -> None:
-    dom = defusedxml.minidom.parseString(xml_path.read_text(encoding="utf-8"))
+def _append_xml(dom, root_tag: str, content: str) -> None:
     root = dom.getElementsByTagName(root_tag)[0]
     ns_attrs = " ".join(f'xmlns:{k}="{v}"' for k, v in NS.items())
     wrapper_dom = defusedxml.minidom.parseString(f"<root {ns_attrs}>{content}</root>")
     for child in wrapper_dom.documentElement.childNodes:  
         if child.nodeType == child.ELEMENT_NODE:
             root.appendChild(dom.importNode(child, True))
-    output = _encode_smart_quotes(dom.toxml(encoding="UTF-8").decode("utf-8"))
-    xml_path.write_text(output, encoding="utf-8")
 
 
-def _find_para_id(comments_path: Path, comment_id: int) -> str | None:
-    dom = defusedxml.minidom.parseString(comments_path.read_text(encoding="utf-8"))
+def _index_para_ids(dom) -> dict[str, str]:
+    para_ids = {}
     for c in dom.getElementsByTagName("w:comment"):
-        if c.getAttribute("w:id") == str(comment_id):
-            for p in c.getElementsByTagName("w:p"):
-                if pid := p.getAttribute("w14:paraId"):
-                    return pid
-    return None
+        for p in c.getElementsByTagName("w:p"):
+            if pid := p.getAttribute("w14:paraId"):
+                para_ids.setdefault(c.getAttribute("w:id"), pid)
+                break
+    return para_ids
 
 
-def _get_next_rid(rels_path: Path) -> int:
-    dom = defusedxml.minidom.parseString(rels_path.read_text(encoding="utf-8"))
+def _get_next_rid(dom) -> int:
     max_rid = 0
     for rel in dom.getElementsByTagName("Relationship"):
         rid = rel.getAttribute("Id")
@@ -118,33 +124,26 @@ def _get_next_rid(rels_path: Path) -> int:
     return max_rid + 1
 
 
-def _has_relationship(rels_path: Path, target: str) -> bool:
-    dom = defusedxml.minidom.parseString(rels_path.read_text(encoding="utf-8"))
+def _has_relationship(dom, target: str) -> bool:
     for rel in dom.getElementsByTagName("Relationship"):
         if rel.getAttribute("Target") == target:
             return True
     return False
 
 
-def _has_content_type(ct_path: Path, part_name: str) -> bool:
-    dom = defusedxml.minidom.parseString(ct_path.read_text(encoding="utf-8"))
+def _has_content_type(dom, part_name: str) -> bool:
     for override in dom.getElementsByTagName("Override"):
         if override.getAttribute("PartName") == part_name:
             return True
     return False
 
 
-def _ensure_comment_relationships(unpacked_dir: Path) -> None:
-    rels_path = unpacked_dir / "word" / "_rels" / "document.xml.rels"
-    if not rels_path.exists():
-        return
-
-    if _has_relationship(rels_path, "comments.xml"):
-        return  
+def _ensure_comment_relationships(dom) -> bool:
+    if _has_relationship(dom, "comments.xml"):
+        return False
 
-    dom = defusedxml.minidom.parseString(rels_path.read_text(encoding="utf-8"))
     root = dom.documentElement
-    next_rid = _get_next_rid(rels_path)
+    next_rid = _get_next_rid(dom)
 
     rels = [
         (
@@ -173,18 +172,13 @@ def _ensure_comment_relationships(unpacked_dir: Path) -> None:
         root.appendChild(rel)  
         next_rid += 1
 
-    rels_path.write_bytes(dom.toxml(encoding="UTF-8"))
+    return True
 
 
-def _ensure_comment_content_types(unpacked_dir: Path) -> None:
-    ct_path = unpacked_dir / "[Content_Types].xml"
-    if not ct_path.exists():
-        return
+def _ensure_comment_content_types(dom) -> bool:
+    if _has_content_type(dom, "/word/comments.xml"):
+        return False
 
-    if _has_content_type(ct_path, "/word/comments.xml"):
-        return  
-
-    dom = defusedxml.minidom.parseString(ct_path.read_text(encoding="utf-8"))
     root = dom.documentElement
 
     overrides = [
@@ -212,7 +206,146 @@ def _ensure_comment_content_types(unpacked_dir: Path) -> None:
         override.setAttribute("ContentType", content_type)
         root.appendChild(override)  
 
-    ct_path.write_bytes(dom.toxml(encoding="UTF-8"))
+    return True
+
+
+class CommentParts:
+    """The comment parts of one unpacked DOCX, parsed once and written once.
+
+    Every part is read on first use and kept as a DOM. save() writes all
+    changed parts to a staging directory beside the unpacked one first and
+    restores the originals if any replace fails, so a batch is applied
+    entirely or not at all.
+    """
+
+    STAGING_PREFIX = ".comment-staging-"
+
+    def __init__(self, unpacked_dir: str):
+        self.root = Path(unpacked_dir)
+        self.word = self.root / "word"
+        self._doms = {}
+        self._dirty = {}
+        self._para_ids = None
+
+    def _load(self, path: Path, template: str | None = None):
+        if path not in self._doms:
+            source = path if path.exists() or template is None else TEMPLATE_DIR / template
+            self._doms[path] = defusedxml.minidom.parseString(
+                source.read_text(encoding="utf-8")
+            )
+            if source != path:
+                self._dirty[path] = True
+        return self._doms[path]
+
+    def _ensure_part_registered(self) -> None:
+        rels_path = self.word / "_rels" / "document.xml.rels"
+        if rels_path.exists() and _ensure_comment_relationships(self._load(rels_path)):
+            self._dirty.setdefault(rels_path, False)
+
+        ct_path = self.root / "[Content_Types].xml"
+        if ct_path.exists() and _ensure_comment_content_types(self._load(ct_path)):
+            self._dirty.setdefault(ct_path, False)
+
+    def _append(self, name: str, root_tag: str, content: str) -> None:
+        path = self.word / name
+        _append_xml(self._load(path, name), root_tag, content)
+        self._dirty[path] = True
+
+    def add(
+        self,
+        comment_id: int,
+        text: str,
+        author: str = "Claude",
+        initials: str = "C",
+        parent_id: int | None = None,
+    ) -> str:
+        para_id, durable_id = _generate_hex_id(), _generate_hex_id()
+        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        comments = self.word / "comments.xml"
+        if comments not in self._doms:
+            if not comments.exists():
+                self._ensure_part_registered()
+            self._para_ids = _index_para_ids(self._load(comments, "comments.xml"))
+        self._append(
+            "comments.xml",
+            "w:comments",
+            COMMENT_XML.format(
+                id=comment_id,
+                author=author,
+                date=ts,
+                initials=initials,
+                para_id=para_id,
+                text=text,  
+            ),
+        )
+        self._para_ids.setdefault(str(comment_id), para_id)
+
+        if parent_id is not None:
+            parent_para = self._para_ids.get(str(parent_id))
+            if not parent_para:
+                raise ValueError(f"Parent comment {parent_id} not found")
+            self._append(
+                "commentsExtended.xml",
+                "w15:commentsEx",
+                f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para}" w15:done="0"/>',
+            )
+        else:
+            self._append(
+                "commentsExtended.xml",
+                "w15:commentsEx",
+                f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>',
+            )
+
+        self._append(
+            "commentsIds.xml",
+            "w16cid:commentsIds",
+            f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>',
+        )
+        self._append(
+            "commentsExtensible.xml",
+            "w16cex:commentsExtensible",
+            f'<w16cex:commentExtensible w16cex:durableId="{durable_id}" w16cex:dateUtc="{ts}"/>',
+        )
+        return para_id
+
+    def save(self) -> None:
+        # Staged next to the unpacked directory, not inside it, so pack.py never
+        # zips a leftover; same parent keeps os.replace on one filesystem
+        parent = self.root.resolve().parent
+        prefix = f".{self.root.resolve().name}{self.STAGING_PREFIX}"
+
+        # A run killed mid-save leaves its staging directory behind
+        for stale in parent.glob(prefix + "*"):
+            shutil.rmtree(stale, ignore_errors=True)
+
+        staging = Path(tempfile.mkdtemp(prefix=prefix, dir=parent))
+        try:
+            staged = []
+            for path, encode_quotes in self._dirty.items():
+                output = self._doms[path].toxml(encoding="UTF-8")
+                if encode_quotes:
+                    output = _encode_smart_quotes(output.decode("utf-8")).encode("utf-8")
+                temp_path = staging / path.name
+                temp_path.write_bytes(output)
+                staged.append((path, temp_path))
+
+            backups = []
+            try:
+                for path, temp_path in staged:
+                    backups.append((path, path.read_bytes() if path.exists() else None))
+                    os.replace(temp_path, path)
+            except Exception:
+                for path, original in backups:
+                    if original is None:
+                        path.unlink(missing_ok=True)
+                    else:
+                        path.write_bytes(original)
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self._dirty = {}
 
 
 def add_comment(
@@ -227,79 +360,92 @@ def add_comment(
     if not word.exists():
         return "", f"Error: {word} not found"
 
-    para_id, durable_id = _generate_hex_id(), _generate_hex_id()
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-    comments = word / "comments.xml"
-    first_comment = not comments.exists()
-    if first_comment:
-        shutil.copy(TEMPLATE_DIR / "comments.xml", comments)
-        _ensure_comment_relationships(Path(unpacked_dir))
-        _ensure_comment_content_types(Path(unpacked_dir))
-    _append_xml(
-        comments,
-        "w:comments",
-        COMMENT_XML.format(
-            id=comment_id,
-            author=author,
-            date=ts,
-            initials=initials,
-            para_id=para_id,
-            text=text,  
-        ),
-    )
+    parts = CommentParts(unpacked_dir)
+    try:
+        para_id = parts.add(comment_id, text, author, initials, parent_id)
+        parts.save()
+    except (ValueError, ExpatError) as e:
+        return "", f"Error: {e}"
 
-    ext = word / "commentsExtended.xml"
-    if not ext.exists():
-        shutil.copy(TEMPLATE_DIR / "commentsExtended.xml", ext)
-    if parent_id is not None:
-        parent_para = _find_para_id(comments, parent_id)
-        if not parent_para:
-            return "", f"Error: Parent comment {parent_id} not found"
-        _append_xml(
-            ext,
-            "w15:commentsEx",
-            f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para}" w15:done="0"/>',
-        )
-    else:
-        _append_xml(
-            ext,
-            "w15:commentsEx",
-            f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>',
-        )
+    action = "reply" if parent_id is not None else "comment"
+    return para_id, f"Added {action} {comment_id} (para_id={para_id})"
 
-    ids = word / "commentsIds.xml"
-    if not ids.exists():
-        shutil.copy(TEMPLATE_DIR / "commentsIds.xml", ids)
-    _append_xml(
-        ids,
-        "w16cid:commentsIds",
-        f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>',
-    )
 
-    extensible = word / "commentsExtensible.xml"
-    if not extensible.exists():
-        shutil.copy(TEMPLATE_DIR / "commentsExtensible.xml", extensible)
-    _append_xml(
-        extensible,
-        "w16cex:commentsExtensible",
-        f'<w16cex:commentExtensible w16cex:durableId="{durable_id}" w16cex:dateUtc="{ts}"/>',
-    )
+def add_comments(unpacked_dir: str, comments: list[dict]) -> tuple[list[str], str]:
+    """Add a batch of comments and replies, all or nothing.
 
-    action = "reply" if parent_id is not None else "comment"
-    return para_id, f"Added {action} {comment_id} (para_id={para_id})"
+    Each entry needs "id" and "text"; "author", "initials" and "parent" are
+    optional. A reply may refer to a comment earlier in the same batch.
+    """
+    word = Path(unpacked_dir) / "word"
+    if not word.exists():
+        return [], f"Error: {word} not found"
+
+    parts = CommentParts(unpacked_dir)
+    para_ids = []
+    replies = 0
+    try:
+        for n, entry in enumerate(comments):
+            if not isinstance(entry, dict) or "id" not in entry or "text" not in entry:
+                raise ValueError(f"entry {n} needs at least 'id' and 'text'")
+            try:
+                para_ids.append(
+                    parts.add(
+                        int(entry["id"]),
+                        str(entry["text"]),
+                        entry.get("author", "Claude"),
+                        entry.get("initials", "C"),
+                        None if entry.get("parent") is None else int(entry["parent"]),
+                    )
+                )
+            except (TypeError, ValueError, ExpatError) as e:
+                raise ValueError(f"entry {n} (comment {entry['id']}): {e}") from e
+            replies += entry.get("parent") is not None
+        parts.save()
+    except (ValueError, OSError) as e:
+        return [], f"Error: {e}. No comments were added"
+
+    return para_ids, f"Added {len(para_ids) - replies} comments and {replies} replies"
 
 
 if __name__ == "__main__":
     p = argparse.ArgumentParser(description="Add comments to DOCX documents")
     p.add_argument("unpacked_dir", help="Unpacked DOCX directory")
-    p.add_argument("comment_id", type=int, help="Comment ID (must be unique)")
-    p.add_argument("text", help="Comment text")
+    p.add_argument("comment_id", type=int, nargs="?", help="Comment ID (must be unique)")
+    p.add_argument("text", nargs="?", help="Comment text")
     p.add_argument("--author", default="Claude", help="Author name")
     p.add_argument("--initials", default="C", help="Author initials")
     p.add_argument("--parent", type=int, help="Parent comment ID (for replies)")
+    p.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="JSON list of comments to add at once ('-' for stdin)",
+    )
     args = p.parse_args()
 
+    if args.batch:
+        if args.comment_id is not None or args.text is not None:
+            p.error("--batch cannot be combined with comment_id/text")
+        try:
+            if args.batch == "-":
+                entries = json.load(sys.stdin)
+            else:
+                with open(args.batch, encoding="utf-8") as f:
+                    entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not read {args.batch}: {e}")
+            sys.exit(1)
+        if not isinstance(entries, list):
+            print(f"Error: {args.batch} must contain a JSON list of comments")
+            sys.exit(1)
+
+        _, msg = add_comments(args.unpacked_dir, entries)
+        print(msg)
+        sys.exit(1 if "Error" in msg else 0)
+
+    if args.comment_id is None or args.text is None:
+        p.error("comment_id and text are required unless --batch is given")
+
     para_id, msg = add_comment(
         args.unpacked_dir,
         args.comment_id,
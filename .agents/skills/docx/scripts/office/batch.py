@@ -0,0 +1,247 @@
+"""Run unpack -> validate -> pack over many Office files.
+
+Each file is unpacked to a scratch directory, validated with auto-repair
+against the input as the original (as pack.py does), and packed again into
+the output directory. Files are spread over a process pool; each worker
+process lives for the whole batch, so lxml, the validators and every
+compiled XSD schema are loaded once per worker rather than once per file.
+
+One JSON record per file is written to --records (stdout by default) as
+soon as the file finishes: per-stage wall time, unpack's own stage
+breakdown, and for failures the stage that failed and its output.
+
+Usage:
+    python batch.py <input>... --output-dir DIR [--manifest FILE] [--jobs N] [--records FILE]
+
+Inputs may be Office files or directories (searched recursively for
+.docx/.pptx/.xlsx). A manifest lists one input path per line; blank lines
+and lines starting with # are ignored.
+
+Examples:
+    python batch.py incoming/ --output-dir packed/ --jobs 8 --records metrics.jsonl
+    python batch.py --manifest tonight.txt --output-dir packed/
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from helpers.simplify_redlines import infer_author
+from pack import _run_validation, pack
+from unpack import unpack
+
+OFFICE_SUFFIXES = {".docx", ".pptx", ".xlsx"}
+
+STAGES = ("unpack", "validate", "pack")
+
+
+def collect_inputs(
+    paths: list[str], output_dir: Path, manifest: str | None = None
+) -> list[tuple[Path, Path]]:
+    """Pair each input file with its output path, keeping directory layout.
+
+    Raises ValueError if two inputs would be written to the same output
+    path, e.g. explicit files with the same name from different folders.
+    """
+    entries = list(paths)
+    if manifest:
+        lines = Path(manifest).read_text(encoding="utf-8").splitlines()
+        entries.extend(
+            line.strip()
+            for line in lines
+            if line.strip() and not line.lstrip().startswith("#")
+        )
+
+    jobs = []
+    for entry in entries:
+        path = Path(entry)
+        if path.is_dir():
+            for file in sorted(path.rglob("*")):
+                if file.is_file() and file.suffix.lower() in OFFICE_SUFFIXES:
+                    jobs.append((file, output_dir / file.relative_to(path)))
+        else:
+            jobs.append((path, output_dir / path.name))
+
+    sources: dict[Path, list[Path]] = {}
+    for input_file, output_file in jobs:
+        sources.setdefault(output_file, []).append(input_file)
+    clashes = [
+        f"{output_file} <- {', '.join(map(str, inputs))}"
+        for output_file, inputs in sources.items()
+        if len(inputs) > 1
+    ]
+    if clashes:
+        raise ValueError(
+            "inputs would overwrite each other:\n  " + "\n  ".join(clashes)
+        )
+    return jobs
+
+
+def process_file(input_file: Path, output_file: Path, work_root: Path) -> dict:
+    record = {
+        "input": str(input_file),
+        "output": str(output_file),
+        "ok": False,
+        "stages": {},
+    }
+    unpacked_dir = Path(tempfile.mkdtemp(dir=work_root))
+    try:
+        timings: dict[str, float] = {}
+        (_, message), output = _run_stage(
+            record, "unpack", unpack, str(input_file), str(unpacked_dir), timings=timings
+        )
+        record["unpack_timings"] = {k: round(v, 6) for k, v in timings.items()}
+        if message.startswith("Error"):
+            return _fail(record, "unpack", message, output)
+
+        suffix = input_file.suffix.lower()
+        (success, validation_output), output = _run_stage(
+            record, "validate", _run_validation,
+            unpacked_dir, input_file, suffix, infer_author, cache=False,
+        )
+        if not success:
+            return _fail(record, "validate", validation_output or "", output)
+
+        (_, message), output = _run_stage(
+            record, "pack", pack, str(unpacked_dir), str(output_file), validate=False
+        )
+        if message.startswith("Error"):
+            return _fail(record, "pack", message, output)
+
+    except _StageError as e:
+        return _fail(record, e.stage, f"{type(e.error).__name__}: {e.error}", e.output)
+    finally:
+        shutil.rmtree(unpacked_dir, ignore_errors=True)
+
+    record["ok"] = True
+    return record
+
+
+class _StageError(Exception):
+    def __init__(self, stage, error, output):
+        super().__init__(stage)
+        self.stage = stage
+        self.error = error
+        self.output = output
+
+
+def _run_stage(record, stage, func, *args, **kwargs):
+    """Call func with its printed output captured; return (result, output)."""
+    captured = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(captured), contextlib.redirect_stderr(captured):
+            result = func(*args, **kwargs)
+    except Exception as e:
+        raise _StageError(stage, e, captured.getvalue()) from e
+    finally:
+        record["stages"][stage] = round(time.perf_counter() - start, 6)
+    return result, captured.getvalue()
+
+
+def _fail(record, stage, error, output):
+    record["failed_stage"] = stage
+    record["error"] = error.strip()
+    if output.strip():
+        record["output"] = output.strip()
+    return record
+
+
+def run_batch(
+    jobs: list[tuple[Path, Path]], workers: int, records, work_dir: str | None = None
+) -> dict:
+    totals = {"files": 0, "failed": 0, "stages": dict.fromkeys(STAGES, 0.0)}
+    start = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(prefix="office_batch_", dir=work_dir) as work_root:
+        work_root = Path(work_root)
+        for record in _records(jobs, workers, work_root):
+            totals["files"] += 1
+            totals["failed"] += not record["ok"]
+            for stage, seconds in record["stages"].items():
+                totals["stages"][stage] += seconds
+            records.write(json.dumps(record) + "\n")
+            records.flush()
+
+    totals["elapsed"] = time.perf_counter() - start
+    return totals
+
+
+def _records(jobs, workers, work_root):
+    if workers == 1 or len(jobs) < 2:
+        for input_file, output_file in jobs:
+            yield process_file(input_file, output_file, work_root)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(process_file, input_file, output_file, work_root)
+            for input_file, output_file in jobs
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _print_summary(totals: dict) -> None:
+    files, elapsed = totals["files"], totals["elapsed"]
+    rate = files / elapsed if elapsed else 0.0
+    print(
+        f"Processed {files} file(s), {totals['failed']} failed, "
+        f"in {elapsed:.2f}s ({rate:.1f} files/s)",
+        file=sys.stderr,
+    )
+    for stage, seconds in totals["stages"].items():
+        print(f"  {stage}: {seconds:.3f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Unpack, validate and pack many Office files"
+    )
+    parser.add_argument(
+        "inputs", nargs="*", help="Office files or directories containing them"
+    )
+    parser.add_argument("--manifest", help="File listing one input path per line")
+    parser.add_argument(
+        "--output-dir", required=True, help="Directory for the packed files"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--records",
+        default="-",
+        help="JSONL file for per-file stage records (default: stdout)",
+    )
+    parser.add_argument(
+        "--work-dir", help="Scratch directory for unpacked files (default: system temp)"
+    )
+    args = parser.parse_args()
+
+    try:
+        jobs = collect_inputs(args.inputs, Path(args.output_dir), args.manifest)
+    except ValueError as e:
+        parser.error(str(e))
+    if not jobs:
+        parser.error("no input files given")
+
+    if args.records == "-":
+        totals = run_batch(jobs, max(1, args.jobs), sys.stdout, args.work_dir)
+    else:
+        with open(args.records, "w", encoding="utf-8") as records:
+            totals = run_batch(jobs, max(1, args.jobs), records, args.work_dir)
+
+    _print_summary(totals)
+    sys.exit(1 if totals["failed"] else 0)
@@ -0,0 +1,158 @@
+"""Compare the minidom and streaming XML formatters on a large part.
+
+Each run happens in a fresh subprocess so peak RSS reflects only that
+formatter. Pass an existing XML part or let the script generate a synthetic
+document.xml of the requested size.
+
+Usage:
+    python benchmark.py [--input document.xml] [--paragraphs 100000] [--repeat 3]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PARAGRAPH = (
+    '<w:p w:rsidR="00A1B2C3" w:rsidRDefault="00A1B2C3"><w:pPr><w:pStyle w:val="Normal"/>'
+    '</w:pPr><w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">Paragraph {n} with '
+    "some &amp; text </w:t></w:r><w:r><w:t>and a second run.</w:t></w:r></w:p>"
+)
+
+
+def generate_document(path: Path, paragraphs: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+        f.write(
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+            'wordprocessingml/2006/main"><w:body>'
+        )
+        for n in range(paragraphs):
+            f.write(PARAGRAPH.format(n=n))
+        f.write("</w:body></w:document>")
+
+
+def _minidom_pretty(src: Path, dest: Path) -> None:
+    import defusedxml.minidom
+
+    dom = defusedxml.minidom.parseString(src.read_bytes().decode("utf-8"))
+    dest.write_bytes(dom.toprettyxml(indent="  ", encoding="utf-8"))
+
+
+def _minidom_condense(src: Path, dest: Path) -> None:
+    import defusedxml.minidom
+
+    with open(src, encoding="utf-8") as f:
+        dom = defusedxml.minidom.parse(f)
+    for element in dom.getElementsByTagName("*"):
+        if element.tagName.endswith(":t"):
+            continue
+        for child in list(element.childNodes):
+            if (
+                child.nodeType == child.TEXT_NODE
+                and child.nodeValue
+                and child.nodeValue.strip() == ""
+            ) or child.nodeType == child.COMMENT_NODE:
+                element.removeChild(child)
+    dest.write_bytes(dom.toxml(encoding="UTF-8"))
+
+
+def _streaming_pretty(src: Path, dest: Path) -> None:
+    from helpers.xml_format import write_pretty_xml
+
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        write_pretty_xml(s, d)
+
+
+def _streaming_condense(src: Path, dest: Path) -> None:
+    from helpers.xml_format import write_condensed_xml
+
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        write_condensed_xml(s, d)
+
+
+RUNNERS = {
+    "minidom-pretty": _minidom_pretty,
+    "streaming-pretty": _streaming_pretty,
+    "minidom-condense": _minidom_condense,
+    "streaming-condense": _streaming_condense,
+}
+
+
+def _run_child(name: str, src: Path, dest: Path) -> None:
+    start = time.perf_counter()
+    RUNNERS[name](src, dest)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"seconds": elapsed, "peak_kb": peak_kb}))
+
+
+def _measure(name: str, src: Path, dest: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", name, str(src), str(dest)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent,
+    )
+    return json.loads(result.stdout)
+
+
+def run_benchmark(src: Path, repeat: int) -> bool:
+    size_mb = src.stat().st_size / (1 << 20)
+    print(f"Input: {src} ({size_mb:.1f} MB)")
+
+    identical = True
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for mode in ("pretty", "condense"):
+            outputs = {}
+            for impl in ("minidom", "streaming"):
+                name = f"{impl}-{mode}"
+                dest = Path(temp_dir) / f"{name}.xml"
+                runs = [_measure(name, src, dest) for _ in range(repeat)]
+                best = min(r["seconds"] for r in runs)
+                peak = max(r["peak_kb"] for r in runs) / 1024
+                print(f"  {name:20s} {best:8.2f}s  peak RSS {peak:8.1f} MB")
+                outputs[impl] = dest.read_bytes()
+
+            if outputs["minidom"] != outputs["streaming"]:
+                print(f"  MISMATCH: {mode} output differs between implementations")
+                identical = False
+
+    return identical
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        sys.path.insert(0, str(Path(__file__).parent))
+        _run_child(sys.argv[2], Path(sys.argv[3]), Path(sys.argv[4]))
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark minidom vs streaming XML formatting"
+    )
+    parser.add_argument("--input", help="XML part to format (default: synthetic)")
+    parser.add_argument(
+        "--paragraphs",
+        type=int,
+        default=100000,
+        help="Paragraphs in the synthetic document (default: 100000)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per formatter (default: 3)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.input:
+            src = Path(args.input)
+        else:
+            src = Path(temp_dir) / "document.xml"
+            generate_document(src, args.paragraphs)
+        ok = run_benchmark(src, args.repeat)
+
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,160 @@
+"""Compare tree-rewriting and single-pass tracked-change text extraction.
+
+The tree-rewriting version is the RedliningValidator algorithm it replaced: parse
+the whole part, strip the author's insertions, unwrap their deletions with
+list.index() lookups, then walk the tree again for paragraph text. Both must
+produce the same paragraphs.
+
+Usage:
+    python benchmark_redlining.py [--input document.xml] [--paragraphs 1000] [--words 400] [--repeat 3]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from validators import RedliningValidator
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+AUTHOR = "Claude"
+AUTHORS = (AUTHOR, "Alice", "Bob")
+
+
+def _run(text: str, deleted: bool = False) -> str:
+    tag = "w:delText" if deleted else "w:t"
+    return f'<w:r><w:rPr><w:b/></w:rPr><{tag} xml:space="preserve">{text} </{tag}></w:r>'
+
+
+def _tracked(tag: str, author: str, n: int, body: str) -> str:
+    return (
+        f'<w:{tag} w:id="{n}" w:author="{author}" w:date="2024-01-01T00:00:00Z">'
+        f"{body}</w:{tag}>"
+    )
+
+
+def generate_document(path: Path, paragraphs: int, words: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    n = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+        f.write(f'<w:document xmlns:w="{W}"><w:body>')
+        for p in range(paragraphs):
+            parts = []
+            for word in range(rng.randint(words // 2, words)):
+                n += 1
+                choice = rng.random()
+                text = f"p{p}w{word}"
+                if choice < 0.5:
+                    parts.append(_run(text))
+                elif choice < 0.75:
+                    parts.append(_tracked("ins", rng.choice(AUTHORS), n, _run(text)))
+                else:
+                    parts.append(
+                        _tracked("del", rng.choice(AUTHORS), n, _run(text, deleted=True))
+                    )
+            f.write("<w:p>" + "".join(parts) + "</w:p>")
+        f.write("</w:body></w:document>")
+
+
+def tree_paragraphs(source, author: str) -> list[str]:
+    root = ET.parse(source).getroot()
+    ins_tag, del_tag = f"{{{W}}}ins", f"{{{W}}}del"
+    author_attr = f"{{{W}}}author"
+
+    for parent in root.iter():
+        to_remove = [
+            child
+            for child in parent
+            if child.tag == ins_tag and child.get(author_attr) == author
+        ]
+        for elem in to_remove:
+            parent.remove(elem)
+
+    for parent in root.iter():
+        to_process = [
+            (child, list(parent).index(child))
+            for child in parent
+            if child.tag == del_tag and child.get(author_attr) == author
+        ]
+        for del_elem, del_index in reversed(to_process):
+            for elem in del_elem.iter():
+                if elem.tag == f"{{{W}}}delText":
+                    elem.tag = f"{{{W}}}t"
+            for child in reversed(list(del_elem)):
+                parent.insert(del_index, child)
+            parent.remove(del_elem)
+
+    paragraphs = []
+    for p_elem in root.findall(f".//{{{W}}}p"):
+        text = "".join(t.text for t in p_elem.findall(f".//{{{W}}}t") if t.text)
+        if text:
+            paragraphs.append(text)
+    return paragraphs
+
+
+def single_pass_paragraphs(source, author: str) -> list[str]:
+    validator = RedliningValidator(".", ".", author=author)
+    return validator._extract_paragraphs(source)
+
+
+def _best_time(func, src: Path, repeat: int):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(src, AUTHOR)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_benchmark(src: Path, repeat: int) -> bool:
+    size_mb = src.stat().st_size / (1 << 20)
+    print(f"Input: {src} ({size_mb:.1f} MB), author {AUTHOR!r}")
+
+    tree_time, tree_result = _best_time(tree_paragraphs, src, repeat)
+    pass_time, pass_result = _best_time(single_pass_paragraphs, src, repeat)
+    print(f"  {'tree':11s} {tree_time:8.3f}s")
+    print(f"  {'single-pass':11s} {pass_time:8.3f}s  ({tree_time / pass_time:.1f}x)")
+
+    if tree_result != pass_result:
+        print("  MISMATCH: paragraph text differs between implementations")
+        return False
+    print(f"  {len(pass_result)} paragraphs, identical text")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark tracked-change text extraction for RedliningValidator"
+    )
+    parser.add_argument("--input", help="document.xml to read (default: synthetic)")
+    parser.add_argument(
+        "--paragraphs",
+        type=int,
+        default=1000,
+        help="Paragraphs in the synthetic document (default: 1000)",
+    )
+    parser.add_argument(
+        "--words",
+        type=int,
+        default=400,
+        help="Maximum runs per synthetic paragraph (default: 400)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per implementation (default: 3)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.input:
+            src = Path(args.input)
+        else:
+            src = Path(temp_dir) / "document.xml"
+            generate_document(src, args.paragraphs, args.words)
+        ok = run_benchmark(src, args.repeat)
+
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,169 @@
+"""Check SofficePool against a shell-script stand-in for soffice.
+
+The stand-in takes soffice's arguments and acts on the first job argument
+after them: "ok" prints its profile, "slow" sleeps a second first, "hang"
+starts a child process and waits forever, and "crash" kills itself with
+SIGSEGV. --terminate_after_init creates the profile and counts the call.
+The checks cover profile reuse, parallel workers on separate profiles,
+timeouts killing the whole process group, and the profile reset after a
+crash. No LibreOffice install is needed.
+
+Usage:
+    python check_soffice_pool.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from soffice import SofficePool
+
+FAKE_SOFFICE = """#!/bin/sh
+profile=
+for arg in "$@"; do
+    case "$arg" in
+        -env:UserInstallation=file://*) profile="${arg#-env:UserInstallation=file://}" ;;
+        --headless|--norestore) ;;
+        *) job="$arg"; break ;;
+    esac
+done
+shift $(($# - 1))
+case "$job" in
+    --terminate_after_init)
+        mkdir -p "$profile/user"
+        echo init >> "$profile/inits"
+        ;;
+    ok)
+        echo "$profile"
+        ;;
+    slow)
+        sleep 1
+        echo "$profile"
+        ;;
+    hang)
+        touch "$profile/user/.lock"
+        sleep 300 > /dev/null 2>&1 &
+        echo $! > "$1"
+        wait
+        ;;
+    crash)
+        touch "$profile/stale"
+        kill -SEGV $$
+        ;;
+esac
+"""
+
+
+def _alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def _inits(profile: Path) -> int:
+    path = profile / "inits"
+    return len(path.read_text().splitlines()) if path.exists() else 0
+
+
+def check_reuse(fake: str, root: Path) -> list[str]:
+    errors = []
+    with SofficePool(workers=1, soffice=fake, profile_root=root) as pool:
+        results = [pool.run(["ok"]) for _ in range(3)]
+    if any(r.returncode != 0 for r in results):
+        errors.append("reuse: a job failed")
+    if _inits(root / "worker0") != 1:
+        errors.append(f"reuse: profile initialised {_inits(root / 'worker0')} times, expected 1")
+    return errors
+
+
+def check_parallel(fake: str, root: Path) -> list[str]:
+    errors = []
+    with SofficePool(workers=2, soffice=fake, profile_root=root) as pool:
+        pool.run(["ok"])
+        pool.run(["ok"])
+        start = time.perf_counter()
+        futures = [pool.submit(["slow"]) for _ in range(2)]
+        profiles = {f.result().stdout.strip() for f in futures}
+        elapsed = time.perf_counter() - start
+    if len(profiles) != 2:
+        errors.append(f"parallel: jobs shared a profile: {profiles}")
+    if elapsed >= 1.9:
+        errors.append(f"parallel: two 1s jobs took {elapsed:.1f}s")
+    return errors
+
+
+def check_timeout(fake: str, root: Path) -> list[str]:
+    errors = []
+    pid_file = root / "child.pid"
+    with SofficePool(workers=1, soffice=fake, profile_root=root) as pool:
+        start = time.perf_counter()
+        try:
+            pool.run(["hang", str(pid_file)], timeout=1)
+        except subprocess.TimeoutExpired:
+            pass
+        else:
+            errors.append("timeout: the hung job did not raise TimeoutExpired")
+        if time.perf_counter() - start >= 10:
+            errors.append("timeout: the hung job was not stopped at its timeout")
+        if pid_file.exists():
+            pid = int(pid_file.read_text())
+            for _ in range(50):
+                if not _alive(pid):
+                    break
+                time.sleep(0.1)
+            else:
+                errors.append(f"timeout: child process {pid} outlived the kill")
+                os.kill(pid, 9)
+        else:
+            errors.append("timeout: the stand-in never started its child")
+        if (root / "worker0" / "user" / ".lock").exists():
+            errors.append("timeout: the profile lock file was left behind")
+        if pool.run(["ok"]).returncode != 0:
+            errors.append("timeout: the worker failed the next job")
+        if pool.restarts != 0:
+            errors.append("timeout: a timeout reset the profile")
+    return errors
+
+
+def check_crash(fake: str, root: Path) -> list[str]:
+    errors = []
+    profile = root / "worker0"
+    with SofficePool(workers=1, soffice=fake, profile_root=root) as pool:
+        result = pool.run(["crash"])
+        if result.returncode >= 0:
+            errors.append(f"crash: return code {result.returncode}, expected a signal")
+        if pool.restarts != 1:
+            errors.append(f"crash: restarts is {pool.restarts}, expected 1")
+        if pool.run(["ok"]).returncode != 0:
+            errors.append("crash: the worker failed the next job")
+        if (profile / "stale").exists():
+            errors.append("crash: the crashed profile was not rebuilt")
+        if _inits(profile) != 1:
+            errors.append("crash: the rebuilt profile was not initialised")
+    return errors
+
+
+def run_checks() -> bool:
+    checks = [check_reuse, check_parallel, check_timeout, check_crash]
+    ok = True
+    with tempfile.TemporaryDirectory() as temp_dir:
+        fake = Path(temp_dir) / "soffice"
+        fake.write_text(FAKE_SOFFICE)
+        fake.chmod(0o755)
+        for check in checks:
+            root = Path(temp_dir) / check.__name__
+            errors = check(str(fake), root)
+            print(f"  {check.__name__:15s} {'FAILED' if errors else 'ok'}")
+            for error in errors:
+                print(f"    {error}")
+            ok = ok and not errors
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_checks() else 1)
@@ -6,11 +6,17 @@ Works on runs in paragraphs and inside tracked changes (<w:ins>, <w:del>).
 Also:
 - Removes rsid attributes from runs (revision metadata that doesn't affect rendering)
 - Removes proofErr elements (spell/grammar markers that block merging)
+
+All three happen in a single streaming pass. Only the run being merged into
+and the run after it are held in memory; everything else is written through
+as it is parsed. The output matches minidom's toxml() of the merged DOM.
 """
 
+import io
+import time
 from pathlib import Path
 
-import defusedxml.minidom
+from helpers.xml_format import XmlFilter, _escape, write_xml
 
 
 def merge_runs(input_dir: str) -> tuple[int, str]:
@@ -19,181 +25,338 @@ def merge_runs(input_dir: str) -> tuple[int, str]:
     if not doc_xml.exists():
         return 0, f"Error: {doc_xml} not found"
 
+    merged_xml = doc_xml.with_name(doc_xml.name + ".merged")
     try:
-        dom = defusedxml.minidom.parseString(doc_xml.read_text(encoding="utf-8"))
-        root = dom.documentElement
-
-        _remove_elements(root, "proofErr")
-        _strip_run_rsid_attrs(root)
-
-        containers = {run.parentNode for run in _find_elements(root, "r")}
-
-        merge_count = 0
-        for container in containers:
-            merge_count += _merge_runs_in(container)
-
-        doc_xml.write_bytes(dom.toxml(encoding="UTF-8"))
-        return merge_count, f"Merged {merge_count} runs"
+        start = time.perf_counter()
+        merger = RunMerger()
+        with open(doc_xml, "rb") as src, open(merged_xml, "wb") as dest:
+            write_xml(src, dest, [merger])
+        merged_xml.replace(doc_xml)
+        elapsed = time.perf_counter() - start
+        return merger.merge_count, f"Merged {merger.merge_count} runs in {elapsed:.2f}s"
 
     except Exception as e:
+        merged_xml.unlink(missing_ok=True)
         return 0, f"Error: {e}"
 
 
-
-
-def _find_elements(root, tag: str) -> list:
-    results = []
-
-    def traverse(node):
-        if node.nodeType == node.ELEMENT_NODE:
-            name = node.localName or node.tagName
-            if name == tag or name.endswith(f":{tag}"):
-                results.append(node)
-            for child in node.childNodes:
-                traverse(child)
-
-    traverse(root)
-    return results
-
-
-def _get_child(parent, tag: str):
-    for child in parent.childNodes:
-        if child.nodeType == child.ELEMENT_NODE:
-            name = child.localName or child.tagName
-            if name == tag or name.endswith(f":{tag}"):
+def merge_runs_xml(content: bytes) -> tuple[bytes, int]:
+    output = io.BytesIO()
+    merger = RunMerger()
+    write_xml(io.BytesIO(content), output, [merger])
+    return output.getvalue(), merger.merge_count
+
+
+def _is_tag(name: str, tag: str) -> bool:
+    return name == tag or name.endswith(f":{tag}")
+
+
+class _Node:
+    __slots__ = ("kind", "name", "attrs", "children", "data")
+
+    def __init__(self, kind, name=None, attrs=None, data=None):
+        self.kind = kind
+        self.name = name
+        self.attrs = attrs
+        self.children = [] if kind == "element" else None
+        self.data = data
+
+
+class _ContainerFrame:
+    __slots__ = ("pending", "between")
+
+    def __init__(self):
+        self.pending = None
+        self.between = []
+
+
+class RunMerger(XmlFilter):
+    def __init__(self):
+        super().__init__()
+        self.merge_count = 0
+        self._skip_depth = 0
+        self._frames = [_ContainerFrame()]
+        self._capture = []
+        self._cdata = None
+        self._text_break = False
+
+    # ── SAX events ────────────────────────────────────────────────────────
+
+    def startElement(self, name, attrs):
+        if self._skip_depth:
+            self._skip_depth += 1
+            return
+        if _is_tag(name, "proofErr"):
+            self._skip_depth = 1
+            return
+
+        attrs = dict(attrs.items())
+        is_run = _is_tag(name, "r")
+        if is_run:
+            attrs = {k: v for k, v in attrs.items() if "rsid" not in k.lower()}
+
+        if self._capture or is_run:
+            node = _Node("element", name, attrs)
+            if self._capture:
+                self._capture[-1].children.append(node)
+            self._capture.append(node)
+            return
+
+        self._flush(self._frames[-1])
+        self.downstream.startElement(name, attrs)
+        self._frames.append(_ContainerFrame())
+
+    def endElement(self, name):
+        if self._skip_depth:
+            self._skip_depth -= 1
+            self._text_break = not self._skip_depth
+            return
+
+        if self._capture:
+            node = self._capture.pop()
+            if not self._capture:
+                self._finish_run(node)
+            return
+
+        self._flush(self._frames.pop())
+        self.downstream.endElement(name)
+
+    def characters(self, content):
+        if self._skip_depth:
+            return
+        if self._cdata is not None:
+            self._cdata.data += content
+        else:
+            self._add_node("text", content)
+
+    def processingInstruction(self, target, data):
+        if not self._skip_depth:
+            self._add_node("pi", (target, data))
+
+    def comment(self, content):
+        if not self._skip_depth:
+            self._add_node("comment", content)
+
+    def startCDATA(self):
+        if self._skip_depth:
+            return
+        if self._capture or self._frames[-1].pending is not None:
+            self._cdata = _Node("cdata", data="")
+            self._held_children().append(self._cdata)
+        else:
+            self.downstream.startCDATA()
+
+    def endCDATA(self):
+        if self._skip_depth:
+            return
+        if self._cdata is not None:
+            self._cdata = None
+        else:
+            self.downstream.endCDATA()
+
+    # ── Buffering ─────────────────────────────────────────────────────────
+
+    def _held_children(self):
+        if self._capture:
+            return self._capture[-1].children
+        return self._frames[-1].between
+
+    def _add_node(self, kind, data):
+        if not (self._capture or self._frames[-1].pending is not None):
+            self._text_break = False
+            self._replay(_Node(kind, data=data))
+            return
+
+        # Text on either side of a removed proofErr stays two nodes, as in a DOM
+        children = self._held_children()
+        if (
+            kind == "text"
+            and not self._text_break
+            and children
+            and children[-1].kind == "text"
+        ):
+            children[-1].data += data
+        else:
+            children.append(_Node(kind, data=data))
+        self._text_break = False
+
+    def _finish_run(self, run):
+        self._merge_tree(run)
+
+        frame = self._frames[-1]
+        if frame.pending is None:
+            frame.pending = run
+        elif self._can_merge(frame.pending, run):
+            self._merge_run_content(frame.pending, run)
+            self.merge_count += 1
+        else:
+            self._flush(frame)
+            frame.pending = run
+
+    def _flush(self, frame):
+        if frame.pending is None:
+            return
+        self._consolidate_text(frame.pending)
+        self._replay(frame.pending)
+        for node in frame.between:
+            self._replay(node)
+        frame.pending = None
+        frame.between = []
+
+    def _replay(self, node):
+        kind = node.kind
+        if kind == "element":
+            self.downstream.startElement(node.name, node.attrs)
+            for child in node.children:
+                self._replay(child)
+            self.downstream.endElement(node.name)
+        elif kind == "text":
+            self.downstream.characters(node.data)
+        elif kind == "comment":
+            self.downstream.comment(node.data)
+        elif kind == "pi":
+            self.downstream.processingInstruction(*node.data)
+        else:
+            self.downstream.startCDATA()
+            self.downstream.characters(node.data)
+            self.downstream.endCDATA()
+
+    # ── Merging (on held subtrees) ────────────────────────────────────────
+
+    def _merge_tree(self, node):
+        for child in node.children:
+            if child.kind == "element":
+                self._merge_tree(child)
+
+        children = node.children
+        i = self._next_run_index(children, 0)
+        while i is not None:
+            run = children[i]
+            while True:
+                j = self._next_element_index(children, i + 1)
+                if (
+                    j is not None
+                    and _is_tag(children[j].name, "r")
+                    and self._can_merge(run, children[j])
+                ):
+                    self._merge_run_content(run, children.pop(j))
+                    self.merge_count += 1
+                else:
+                    break
+
+            self._consolidate_text(run)
+            i = self._next_run_index(children, i + 1)
+
+    @staticmethod
+    def _next_element_index(children, start):
+        for i in range(start, len(children)):
+            if children[i].kind == "element":
+                return i
+        return None
+
+    @staticmethod
+    def _next_run_index(children, start):
+        for i in range(start, len(children)):
+            if children[i].kind == "element" and _is_tag(children[i].name, "r"):
+                return i
+        return None
+
+    @staticmethod
+    def _get_child(parent, tag):
+        for child in parent.children:
+            if child.kind == "element" and _is_tag(child.name, tag):
                 return child
-    return None
-
+        return None
 
-def _get_children(parent, tag: str) -> list:
-    results = []
-    for child in parent.childNodes:
-        if child.nodeType == child.ELEMENT_NODE:
-            name = child.localName or child.tagName
-            if name == tag or name.endswith(f":{tag}"):
-                results.append(child)
-    return results
+    def _can_merge(self, run1, run2) -> bool:
+        rpr1 = self._get_child(run1, "rPr")
+        rpr2 = self._get_child(run2, "rPr")
 
-
-def _is_adjacent(elem1, elem2) -> bool:
-    node = elem1.nextSibling
-    while node:
-        if node == elem2:
-            return True
-        if node.nodeType == node.ELEMENT_NODE:
-            return False
-        if node.nodeType == node.TEXT_NODE and node.data.strip():
+        if (rpr1 is None) != (rpr2 is None):
             return False
-        node = node.nextSibling
-    return False
-
-
-
-
-def _remove_elements(root, tag: str):
-    for elem in _find_elements(root, tag):
-        if elem.parentNode:
-            elem.parentNode.removeChild(elem)
-
-
-def _strip_run_rsid_attrs(root):
-    for run in _find_elements(root, "r"):
-        for attr in list(run.attributes.values()):
-            if "rsid" in attr.name.lower():
-                run.removeAttribute(attr.name)
-
-
-
-
-def _merge_runs_in(container) -> int:
-    merge_count = 0
-    run = _first_child_run(container)
-
-    while run:
-        while True:
-            next_elem = _next_element_sibling(run)
-            if next_elem and _is_run(next_elem) and _can_merge(run, next_elem):
-                _merge_run_content(run, next_elem)
-                container.removeChild(next_elem)
-                merge_count += 1
-            else:
-                break
-
-        _consolidate_text(run)
-        run = _next_sibling_run(run)
-
-    return merge_count
-
-
-def _first_child_run(container):
-    for child in container.childNodes:
-        if child.nodeType == child.ELEMENT_NODE and _is_run(child):
-            return child
-    return None
-
-
-def _next_element_sibling(node):
-    sibling = node.nextSibling
-    while sibling:
-        if sibling.nodeType == sibling.ELEMENT_NODE:
-            return sibling
-        sibling = sibling.nextSibling
-    return None
-
-
-def _next_sibling_run(node):
-    sibling = node.nextSibling
-    while sibling:
-        if sibling.nodeType == sibling.ELEMENT_NODE:
-            if _is_run(sibling):
-                return sibling
-        sibling = sibling.nextSibling
-    return None
-
-
-def _is_run(node) -> bool:
-    name = node.localName or node.tagName
-    return name == "r" or name.endswith(":r")
-
-
-def _can_merge(run1, run2) -> bool:
-    rpr1 = _get_child(run1, "rPr")
-    rpr2 = _get_child(run2, "rPr")
-
-    if (rpr1 is None) != (rpr2 is None):
+        if rpr1 is None:
+            return True
+        return _serialize(rpr1) == _serialize(rpr2)
+
+    @staticmethod
+    def _merge_run_content(target, source):
+        for child in source.children:
+            if child.kind == "element" and not _is_tag(child.name, "rPr"):
+                target.children.append(child)
+
+    @staticmethod
+    def _is_adjacent(children, prev, curr) -> bool:
+        start = next(i for i, node in enumerate(children) if node is prev) + 1
+        for node in children[start:]:
+            if node is curr:
+                return True
+            if node.kind == "element":
+                return False
+            if node.kind == "text" and node.data.strip():
+                return False
         return False
-    if rpr1 is None:
-        return True
-    return rpr1.toxml() == rpr2.toxml()  
-
-
-def _merge_run_content(target, source):
-    for child in list(source.childNodes):
-        if child.nodeType == child.ELEMENT_NODE:
-            name = child.localName or child.tagName
-            if name != "rPr" and not name.endswith(":rPr"):
-                target.appendChild(child)
-
-
-def _consolidate_text(run):
-    t_elements = _get_children(run, "t")
-
-    for i in range(len(t_elements) - 1, 0, -1):
-        curr, prev = t_elements[i], t_elements[i - 1]
-
-        if _is_adjacent(prev, curr):
-            prev_text = prev.firstChild.data if prev.firstChild else ""
-            curr_text = curr.firstChild.data if curr.firstChild else ""
-            merged = prev_text + curr_text
-
-            if prev.firstChild:
-                prev.firstChild.data = merged
-            else:
-                prev.appendChild(run.ownerDocument.createTextNode(merged))
-
-            if merged.startswith(" ") or merged.endswith(" "):
-                prev.setAttribute("xml:space", "preserve")
-            elif prev.hasAttribute("xml:space"):
-                prev.removeAttribute("xml:space")
 
-            run.removeChild(curr)
+    def _consolidate_text(self, run):
+        t_elements = [
+            child
+            for child in run.children
+            if child.kind == "element" and _is_tag(child.name, "t")
+        ]
+
+        for i in range(len(t_elements) - 1, 0, -1):
+            curr, prev = t_elements[i], t_elements[i - 1]
+
+            if self._is_adjacent(run.children, prev, curr):
+                prev_text = _first_child_data(prev)
+                curr_text = _first_child_data(curr)
+                merged = prev_text + curr_text
+
+                if prev.children:
+                    _set_data(prev.children[0], merged)
+                else:
+                    prev.children.append(_Node("text", data=merged))
+
+                if merged.startswith(" ") or merged.endswith(" "):
+                    prev.attrs["xml:space"] = "preserve"
+                else:
+                    prev.attrs.pop("xml:space", None)
+
+                run.children = [node for node in run.children if node is not curr]
+
+
+def _first_child_data(elem) -> str:
+    if not elem.children:
+        return ""
+    first = elem.children[0]
+    if first.kind == "element":
+        raise ValueError(f"<{elem.name}> starts with an element, not text")
+    if first.kind == "pi":
+        return first.data[1]
+    return first.data
+
+
+def _set_data(node, data: str):
+    if node.kind == "pi":
+        node.data = (node.data[0], data)
+    else:
+        node.data = data
+
+
+def _serialize(node) -> str:
+    kind = node.kind
+    if kind == "text":
+        return _escape(node.data)
+    if kind == "cdata":
+        return f"<![CDATA[{node.data}]]>"
+    if kind == "comment":
+        return f"<!--{node.data}-->"
+    if kind == "pi":
+        return f"<?{node.data[0]} {node.data[1]}?>"
+
+    declared = [a for a in node.attrs if a == "xmlns" or a.startswith("xmlns:")]
+    ordered = declared + [a for a in node.attrs if a not in declared]
+    attrs = "".join(f' {a}="{_escape(node.attrs[a])}"' for a in ordered)
+    if not node.children:
+        return f"<{node.name}{attrs}/>"
+    children = "".join(_serialize(child) for child in node.children)
+    return f"<{node.name}{attrs}>{children}</{node.name}>"
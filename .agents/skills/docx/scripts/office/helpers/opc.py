@@ -0,0 +1,209 @@
+"""Index of an unpacked OPC package: parts, relationships and content types.
+
+Part names are package-relative POSIX paths without a leading slash
+("word/document.xml"); the package itself is the source "". The directory is
+walked once, and each .rels file and [Content_Types].xml is parsed at most
+once, on first use, so callers that only need one part's relationships do not
+pay for the rest of the package.
+
+Targets resolve the way the validators always have: "/x" from the package
+root, anything in a file named .rels from the root, everything else relative
+to the directory that holds the _rels folder. Targets starting with "http" or
+"mailto:" are not resolved.
+"""
+
+import posixpath
+from collections import namedtuple
+from pathlib import Path
+
+import lxml.etree
+
+CONTENT_TYPES = "[Content_Types].xml"
+
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+Relationship = namedtuple("Relationship", "id type target target_mode part line")
+
+ContentTypes = namedtuple("ContentTypes", "defaults overrides")
+
+
+def _parse(path):
+    return lxml.etree.parse(str(path))
+
+
+def rels_part_for(source: str) -> str:
+    directory, name = posixpath.split(source)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+class _RelsEntry:
+    __slots__ = ("relationships", "by_id", "error")
+
+    def __init__(self, relationships=(), error=None):
+        self.relationships = list(relationships)
+        self.by_id = {rel.id: rel for rel in self.relationships if rel.id}
+        self.error = error
+
+
+class PackageGraph:
+    def __init__(self, root, parse=None):
+        self.root = Path(root)
+        self._parse = parse or _parse
+        self._files = None
+        self._parts = None
+        self._rels = {}
+        self._content_types = None
+        self._sources = None
+
+    # ── Parts ─────────────────────────────────────────────────────────────
+
+    @property
+    def files(self) -> list[Path]:
+        """Every file in the package, in Path.rglob order."""
+        if self._files is None:
+            self._files = [f for f in self.root.rglob("*") if f.is_file()]
+        return self._files
+
+    @property
+    def parts(self) -> dict[str, Path]:
+        if self._parts is None:
+            self._parts = {f.relative_to(self.root).as_posix(): f for f in self.files}
+        return self._parts
+
+    def exists(self, part: str) -> bool:
+        if self._parts is not None:
+            return part in self._parts
+        return (self.root / part).is_file()
+
+    def rels_files(self) -> list[Path]:
+        return [f for f in self.files if f.name.endswith(".rels")]
+
+    # ── Relationships ─────────────────────────────────────────────────────
+
+    def _entry(self, rels_part: str) -> _RelsEntry:
+        entry = self._rels.get(rels_part)
+        if entry is None:
+            path = self.root / rels_part
+            if not self.exists(rels_part):
+                entry = _RelsEntry()
+            else:
+                try:
+                    entry = _RelsEntry(self._read_rels(rels_part, path))
+                except Exception as e:
+                    entry = _RelsEntry(error=e)
+            self._rels[rels_part] = entry
+        return entry
+
+    def _read_rels(self, rels_part: str, path: Path) -> list[Relationship]:
+        root = self._parse(path).getroot()
+        relationships = []
+        for rel in root.iterfind(f".//{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"):
+            target = rel.get("Target")
+            relationships.append(
+                Relationship(
+                    rel.get("Id"),
+                    rel.get("Type", ""),
+                    target,
+                    rel.get("TargetMode"),
+                    self._resolve(rels_part, target),
+                    rel.sourceline,
+                )
+            )
+        return relationships
+
+    @staticmethod
+    def _resolve(rels_part: str, target: str | None) -> str | None:
+        if not target or target.startswith(("http", "mailto:")):
+            return None
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        elif posixpath.basename(rels_part) == ".rels":
+            path = target
+        else:
+            base = posixpath.dirname(posixpath.dirname(rels_part))
+            path = posixpath.join(base, target)
+        return posixpath.normpath(path)
+
+    def rels_error(self, rels_part: str) -> Exception | None:
+        """The parse error for a .rels file, or None if it parsed."""
+        return self._entry(rels_part).error
+
+    def rels_relationships(self, rels_part: str) -> list[Relationship]:
+        return self._entry(rels_part).relationships
+
+    def relationships(self, source: str) -> list[Relationship]:
+        """Relationships of a source part, in document order."""
+        return self._entry(rels_part_for(source)).relationships
+
+    def relationship(self, source: str, rid: str) -> Relationship | None:
+        return self._entry(rels_part_for(source)).by_id.get(rid)
+
+    def resolve(self, source: str, rid: str) -> str | None:
+        """The part a source's relationship points to, if it is in the package."""
+        rel = self.relationship(source, rid)
+        if rel is None or rel.part is None or not self.exists(rel.part):
+            return None
+        return rel.part
+
+    def related(self, source: str, rel_type: str) -> list[Relationship]:
+        """Relationships whose type URI ends with rel_type ("slideLayout")."""
+        return [
+            rel
+            for rel in self.relationships(source)
+            if rel.type.rsplit("/", 1)[-1] == rel_type
+        ]
+
+    def sources(self, part: str) -> list[tuple[str, Relationship]]:
+        """(rels part, relationship) pairs that target `part`."""
+        if self._sources is None:
+            self._sources = {}
+            for rels_file in self.rels_files():
+                rels_part = rels_file.relative_to(self.root).as_posix()
+                for rel in self.rels_relationships(rels_part):
+                    if rel.part is not None:
+                        self._sources.setdefault(rel.part, []).append((rels_part, rel))
+        return self._sources.get(part, [])
+
+    # ── Content types ─────────────────────────────────────────────────────
+
+    @property
+    def content_types(self) -> ContentTypes:
+        """Default (by lower-case extension) and Override (by part) types.
+
+        Raises FileNotFoundError without [Content_Types].xml and re-raises
+        its parse error on every access.
+        """
+        if self._content_types is None:
+            try:
+                self._content_types = self._read_content_types()
+            except Exception as e:
+                self._content_types = e
+        if isinstance(self._content_types, Exception):
+            raise self._content_types
+        return self._content_types
+
+    def _read_content_types(self) -> ContentTypes:
+        if not self.exists(CONTENT_TYPES):
+            raise FileNotFoundError(f"{CONTENT_TYPES} not found in {self.root}")
+
+        root = self._parse(self.root / CONTENT_TYPES).getroot()
+        defaults, overrides = {}, {}
+        for default in root.iterfind(f".//{{{CONTENT_TYPES_NAMESPACE}}}Default"):
+            extension = default.get("Extension")
+            if extension is not None:
+                defaults[extension.lower()] = default.get("ContentType")
+        for override in root.iterfind(f".//{{{CONTENT_TYPES_NAMESPACE}}}Override"):
+            part_name = override.get("PartName")
+            if part_name is not None:
+                overrides[part_name.lstrip("/")] = override.get("ContentType")
+        return ContentTypes(defaults, overrides)
+
+    def content_type(self, part: str) -> str | None:
+        content_types = self.content_types
+        if part in content_types.overrides:
+            return content_types.overrides[part]
+        extension = posixpath.splitext(part)[1].lstrip(".").lower()
+        return content_types.defaults.get(extension)
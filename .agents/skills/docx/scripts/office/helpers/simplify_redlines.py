@@ -8,16 +8,27 @@ Rules:
 - Only merges w:ins with w:ins, w:del with w:del (same element type)
 - Only merges if same author (ignores timestamp differences)
 - Only merges if truly adjacent (only whitespace between them)
+
+The same streaming pass counts tracked changes per author (RevisionIndex).
+Indexes are cached per file, so infer_author and RedliningValidator reuse the
+one built while unpacking or by the first of them to run.
 """
 
-import xml.etree.ElementTree as ET
+import io
+import time
+import xml.sax
+import xml.sax.handler
 import zipfile
 from pathlib import Path
 
-import defusedxml.minidom
+import defusedxml.sax
+
+from helpers.xml_format import XmlFilter, write_xml
 
 WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
+_INDEX_CACHE: dict[tuple, "RevisionIndex"] = {}
+
 
 def simplify_redlines(input_dir: str) -> tuple[int, str]:
     doc_xml = Path(input_dir) / "word" / "document.xml"
@@ -25,102 +36,326 @@ def simplify_redlines(input_dir: str) -> tuple[int, str]:
     if not doc_xml.exists():
         return 0, f"Error: {doc_xml} not found"
 
+    simplified_xml = doc_xml.with_name(doc_xml.name + ".simplified")
     try:
-        dom = defusedxml.minidom.parseString(doc_xml.read_text(encoding="utf-8"))
-        root = dom.documentElement
+        start = time.perf_counter()
+        simplifier = RedlineSimplifier()
+        with open(doc_xml, "rb") as src, open(simplified_xml, "wb") as dest:
+            write_xml(src, dest, [simplifier])
+        simplified_xml.replace(doc_xml)
+        elapsed = time.perf_counter() - start
 
-        merge_count = 0
+        merge_count = simplifier.merge_count
+        return merge_count, f"Simplified {merge_count} tracked changes in {elapsed:.2f}s"
 
-        containers = _find_elements(root, "p") + _find_elements(root, "tc")
+    except Exception as e:
+        simplified_xml.unlink(missing_ok=True)
+        return 0, f"Error: {e}"
 
-        for container in containers:
-            merge_count += _merge_tracked_changes_in(container, "ins")
-            merge_count += _merge_tracked_changes_in(container, "del")
 
-        doc_xml.write_bytes(dom.toxml(encoding="UTF-8"))
-        return merge_count, f"Simplified {merge_count} tracked changes"
+def simplify_redlines_xml(content: bytes) -> tuple[bytes, int, "RevisionIndex"]:
+    output = io.BytesIO()
+    simplifier = RedlineSimplifier()
+    write_xml(io.BytesIO(content), output, [simplifier])
+    return output.getvalue(), simplifier.merge_count, simplifier.index
 
-    except Exception as e:
-        return 0, f"Error: {e}"
 
+def _is_tag(name: str, tag: str) -> bool:
+    return name == tag or name.endswith(f":{tag}")
+
+
+def _get_author(attrs) -> str:
+    author = attrs.get("w:author")
+    if not author:
+        for name, value in attrs.items():
+            if _is_tag(name, "author"):
+                return value
+    return author or ""
+
+
+class RevisionIndex:
+    def __init__(self):
+        self.insertions: dict[str, int] = {}
+        self.deletions: dict[str, int] = {}
+
+    def add(self, tag: str, author: str):
+        counts = self.insertions if tag == "ins" else self.deletions
+        counts[author] = counts.get(author, 0) + 1
+
+    def authors(self) -> dict[str, int]:
+        authors = dict(self.insertions)
+        for author, count in self.deletions.items():
+            authors[author] = authors.get(author, 0) + count
+        return authors
+
+    def count(self, author: str) -> int:
+        return self.insertions.get(author, 0) + self.deletions.get(author, 0)
+
+
+class _RevisionIndexer(xml.sax.handler.ContentHandler):
+    """Counts w:ins/w:del by w:author, resolving prefixes like ElementTree."""
+
+    def __init__(self):
+        super().__init__()
+        self.index = RevisionIndex()
+        self._scopes = [{"xml": "http://www.w3.org/XML/1998/namespace"}]
+
+    def startElement(self, name, attrs):
+        scope = self._scopes[-1]
+        declared = [a for a in attrs.keys() if a == "xmlns" or a.startswith("xmlns:")]
+        if declared:
+            scope = dict(scope)
+            for attr in declared:
+                scope[attr[6:]] = attrs[attr]
+        self._scopes.append(scope)
+
+        prefix, _, local = name.rpartition(":")
+        if local not in ("ins", "del") or scope.get(prefix) != WORD_NS:
+            return
+
+        for attr, value in attrs.items():
+            attr_prefix, _, attr_local = attr.rpartition(":")
+            if attr_prefix and attr_local == "author" and scope.get(attr_prefix) == WORD_NS:
+                if value:
+                    self.index.add(local, value)
+                return
+
+    def endElement(self, name):
+        self._scopes.pop()
+
+
+class _Node:
+    __slots__ = ("kind", "name", "attrs", "children", "data")
+
+    def __init__(self, kind, name=None, attrs=None, data=None):
+        self.kind = kind
+        self.name = name
+        self.attrs = attrs
+        self.children = [] if kind == "element" else None
+        self.data = data
+
+
+class _ContainerFrame:
+    __slots__ = ("is_container", "pending", "between")
+
+    def __init__(self, is_container):
+        self.is_container = is_container
+        self.pending = None
+        self.between = []
+
+
+class RedlineSimplifier(XmlFilter):
+    def __init__(self):
+        super().__init__()
+        self.merge_count = 0
+        self._indexer = _RevisionIndexer()
+        self.index = self._indexer.index
+        self._frames = [_ContainerFrame(False)]
+        self._capture = []
+        self._cdata = None
+
+    # ── SAX events ────────────────────────────────────────────────────────
+
+    def startElement(self, name, attrs):
+        self._indexer.startElement(name, attrs)
+        attrs = dict(attrs.items())
+        frame = self._frames[-1]
+
+        if self._capture or (frame.is_container and _tracked_tag(name)):
+            node = _Node("element", name, attrs)
+            if self._capture:
+                self._capture[-1].children.append(node)
+            self._capture.append(node)
+            return
+
+        self._flush(frame)
+        self.downstream.startElement(name, attrs)
+        self._frames.append(_ContainerFrame(_is_container(name)))
+
+    def endElement(self, name):
+        self._indexer.endElement(name)
+
+        if self._capture:
+            node = self._capture.pop()
+            if not self._capture:
+                self._finish_tracked(node)
+            return
+
+        self._flush(self._frames.pop())
+        self.downstream.endElement(name)
+
+    def characters(self, content):
+        if self._cdata is not None:
+            self._cdata.data += content
+        else:
+            self._add_node("text", content)
+
+    def processingInstruction(self, target, data):
+        self._add_node("pi", (target, data))
+
+    def comment(self, content):
+        self._add_node("comment", content)
+
+    def startCDATA(self):
+        if self._capture or self._frames[-1].pending is not None:
+            self._cdata = _Node("cdata", data="")
+            self._held_children().append(self._cdata)
+        else:
+            self.downstream.startCDATA()
+
+    def endCDATA(self):
+        if self._cdata is not None:
+            self._cdata = None
+        else:
+            self.downstream.endCDATA()
+
+    # ── Buffering ─────────────────────────────────────────────────────────
 
-def _merge_tracked_changes_in(container, tag: str) -> int:
-    merge_count = 0
+    def _held_children(self):
+        if self._capture:
+            return self._capture[-1].children
+        return self._frames[-1].between
 
-    tracked = [
-        child
-        for child in container.childNodes
-        if child.nodeType == child.ELEMENT_NODE and _is_element(child, tag)
-    ]
+    def _add_node(self, kind, data):
+        if not (self._capture or self._frames[-1].pending is not None):
+            self._replay(_Node(kind, data=data))
+            return
 
-    if len(tracked) < 2:
-        return 0
+        children = self._held_children()
+        if kind == "text" and children and children[-1].kind == "text":
+            children[-1].data += data
+        else:
+            children.append(_Node(kind, data=data))
 
-    i = 0
-    while i < len(tracked) - 1:
-        curr = tracked[i]
-        next_elem = tracked[i + 1]
+    def _finish_tracked(self, elem):
+        self._merge_tree(elem)
 
-        if _can_merge_tracked(curr, next_elem):
-            _merge_tracked_content(curr, next_elem)
-            container.removeChild(next_elem)
-            tracked.pop(i + 1)
-            merge_count += 1
+        frame = self._frames[-1]
+        if frame.pending is None:
+            frame.pending = elem
+        elif _only_whitespace(frame.between) and self._can_merge(frame.pending, elem):
+            frame.pending.children.extend(elem.children)
+            self.merge_count += 1
         else:
+            self._flush(frame)
+            frame.pending = elem
+
+    def _flush(self, frame):
+        if frame.pending is None:
+            return
+        self._replay(frame.pending)
+        for node in frame.between:
+            self._replay(node)
+        frame.pending = None
+        frame.between = []
+
+    def _replay(self, node):
+        kind = node.kind
+        if kind == "element":
+            self.downstream.startElement(node.name, node.attrs)
+            for child in node.children:
+                self._replay(child)
+            self.downstream.endElement(node.name)
+        elif kind == "text":
+            self.downstream.characters(node.data)
+        elif kind == "comment":
+            self.downstream.comment(node.data)
+        elif kind == "pi":
+            self.downstream.processingInstruction(*node.data)
+        else:
+            self.downstream.startCDATA()
+            self.downstream.characters(node.data)
+            self.downstream.endCDATA()
+
+    # ── Merging (on held subtrees) ────────────────────────────────────────
+
+    def _merge_tree(self, node):
+        for child in node.children:
+            if child.kind == "element":
+                self._merge_tree(child)
+
+        if not _is_container(node.name):
+            return
+
+        children = node.children
+        i = 0
+        while i < len(children):
+            curr = children[i]
+            if curr.kind == "element" and _tracked_tag(curr.name):
+                j = i + 1
+                while j < len(children) and children[j].kind != "element":
+                    j += 1
+                if (
+                    j < len(children)
+                    and _only_whitespace(children[i + 1 : j])
+                    and self._can_merge(curr, children[j])
+                ):
+                    curr.children.extend(children.pop(j).children)
+                    self.merge_count += 1
+                    continue
             i += 1
 
-    return merge_count
+    @staticmethod
+    def _can_merge(elem1, elem2) -> bool:
+        tag = _tracked_tag(elem1.name)
+        return (
+            tag is not None
+            and _tracked_tag(elem2.name) == tag
+            and _get_author(elem1.attrs) == _get_author(elem2.attrs)
+        )
 
 
-def _is_element(node, tag: str) -> bool:
-    name = node.localName or node.tagName
-    return name == tag or name.endswith(f":{tag}")
+def _tracked_tag(name: str) -> str | None:
+    for tag in ("ins", "del"):
+        if _is_tag(name, tag):
+            return tag
+    return None
 
 
-def _get_author(elem) -> str:
-    author = elem.getAttribute("w:author")
-    if not author:
-        for attr in elem.attributes.values():
-            if attr.localName == "author" or attr.name.endswith(":author"):
-                return attr.value
-    return author
+def _only_whitespace(nodes) -> bool:
+    return not any(node.kind == "text" and node.data.strip() for node in nodes)
 
 
-def _can_merge_tracked(elem1, elem2) -> bool:
-    if _get_author(elem1) != _get_author(elem2):
-        return False
+def _is_container(name: str) -> bool:
+    return _is_tag(name, "p") or _is_tag(name, "tc")
 
-    node = elem1.nextSibling
-    while node and node != elem2:
-        if node.nodeType == node.ELEMENT_NODE:
-            return False
-        if node.nodeType == node.TEXT_NODE and node.data.strip():
-            return False
-        node = node.nextSibling
 
-    return True
+def _index_key(path: Path, member: str | None = None) -> tuple:
+    stat = path.stat()
+    return (str(path.resolve()), member, stat.st_mtime_ns, stat.st_size)
 
 
-def _merge_tracked_content(target, source):
-    while source.firstChild:
-        child = source.firstChild
-        source.removeChild(child)
-        target.appendChild(child)
+def _build_index(source) -> RevisionIndex:
+    indexer = _RevisionIndexer()
+    parser = defusedxml.sax.make_parser()
+    parser.setContentHandler(indexer)
+    parser.parse(source)
+    return indexer.index
 
 
-def _find_elements(root, tag: str) -> list:
-    results = []
+def revision_index(doc_xml_path: Path) -> RevisionIndex:
+    doc_xml_path = Path(doc_xml_path)
+    key = _index_key(doc_xml_path)
+    if key not in _INDEX_CACHE:
+        with open(doc_xml_path, "rb") as f:
+            _INDEX_CACHE[key] = _build_index(f)
+    return _INDEX_CACHE[key]
 
-    def traverse(node):
-        if node.nodeType == node.ELEMENT_NODE:
-            name = node.localName or node.tagName
-            if name == tag or name.endswith(f":{tag}"):
-                results.append(node)
-            for child in node.childNodes:
-                traverse(child)
 
-    traverse(root)
-    return results
+def docx_revision_index(docx_path: Path) -> RevisionIndex:
+    docx_path = Path(docx_path)
+    key = _index_key(docx_path, "word/document.xml")
+    if key not in _INDEX_CACHE:
+        with zipfile.ZipFile(docx_path, "r") as zf:
+            if "word/document.xml" not in zf.namelist():
+                return RevisionIndex()
+            with zf.open("word/document.xml") as f:
+                _INDEX_CACHE[key] = _build_index(f)
+    return _INDEX_CACHE[key]
+
+
+def cache_docx_revision_index(docx_path: Path, index: RevisionIndex):
+    _INDEX_CACHE[_index_key(Path(docx_path), "word/document.xml")] = index
 
 
 def get_tracked_change_authors(doc_xml_path: Path) -> dict[str, int]:
@@ -128,44 +363,15 @@ def get_tracked_change_authors(doc_xml_path: Path) -> dict[str, int]:
         return {}
 
     try:
-        tree = ET.parse(doc_xml_path)
-        root = tree.getroot()
-    except ET.ParseError:
+        return revision_index(doc_xml_path).authors()
+    except (xml.sax.SAXException, ValueError):
         return {}
 
-    namespaces = {"w": WORD_NS}
-    author_attr = f"{{{WORD_NS}}}author"
-
-    authors: dict[str, int] = {}
-    for tag in ["ins", "del"]:
-        for elem in root.findall(f".//w:{tag}", namespaces):
-            author = elem.get(author_attr)
-            if author:
-                authors[author] = authors.get(author, 0) + 1
-
-    return authors
-
 
 def _get_authors_from_docx(docx_path: Path) -> dict[str, int]:
     try:
-        with zipfile.ZipFile(docx_path, "r") as zf:
-            if "word/document.xml" not in zf.namelist():
-                return {}
-            with zf.open("word/document.xml") as f:
-                tree = ET.parse(f)
-                root = tree.getroot()
-
-                namespaces = {"w": WORD_NS}
-                author_attr = f"{{{WORD_NS}}}author"
-
-                authors: dict[str, int] = {}
-                for tag in ["ins", "del"]:
-                    for elem in root.findall(f".//w:{tag}", namespaces):
-                        author = elem.get(author_attr)
-                        if author:
-                            authors[author] = authors.get(author, 0) + 1
-                return authors
-    except (zipfile.BadZipFile, ET.ParseError):
+        return docx_revision_index(docx_path).authors()
+    except (zipfile.BadZipFile, xml.sax.SAXException, ValueError):
         return {}
 
 
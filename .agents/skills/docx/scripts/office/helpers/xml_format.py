@@ -0,0 +1,277 @@
+"""Streaming XML pretty-printer and condenser for Office parts.
+
+Produces the same bytes as minidom's toprettyxml() (unpack) and the
+whitespace/comment-stripping toxml() round trip (pack), without building a
+DOM. Parsing goes through defusedxml's SAX reader, so the same entity and
+external-reference protections apply.
+
+Only the current element path and the text node being read are held in
+memory, which keeps large parts like a 40 MB document.xml within a bounded
+footprint. DOCTYPE declarations are rejected, since OPC does not allow them in
+package parts.
+
+write_xml() re-serializes like minidom's toxml(encoding="UTF-8") and accepts a
+chain of XmlFilter handlers, so DOCX transforms (run merging, redline
+simplification) can run on the event stream instead of on a DOM.
+"""
+
+import io
+import xml.sax.handler
+
+import defusedxml.sax
+
+_EMPTY, _SINGLE, _BLOCK = range(3)
+
+_FLUSH_SIZE = 1 << 16
+
+
+def pretty_print_xml(content: bytes, indent: str = "  ") -> bytes:
+    output = io.BytesIO()
+    write_pretty_xml(io.BytesIO(content), output, indent=indent)
+    return output.getvalue()
+
+
+def condense_xml(content: bytes) -> bytes:
+    output = io.BytesIO()
+    write_condensed_xml(io.BytesIO(content), output)
+    return output.getvalue()
+
+
+def write_pretty_xml(source, dest, indent: str = "  ") -> None:
+    _format(source, dest, _XmlFormatter(dest, "utf-8", indent, "\n", condense=False))
+
+
+def write_condensed_xml(source, dest) -> None:
+    _format(source, dest, _XmlFormatter(dest, "UTF-8", "", "", condense=True))
+
+
+def write_xml(source, dest, filters=()) -> None:
+    formatter = _XmlFormatter(dest, "UTF-8", "", "", condense=False)
+    handler = formatter
+    for xml_filter in reversed(filters):
+        xml_filter.downstream = handler
+        handler = xml_filter
+    _format(source, dest, formatter, handler)
+
+
+def _format(source, dest, formatter, handler=None) -> None:
+    handler = handler or formatter
+    parser = defusedxml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.setProperty(xml.sax.handler.property_lexical_handler, handler)
+    parser.parse(source)
+    formatter.flush()
+
+
+class XmlFilter(xml.sax.handler.ContentHandler):
+    """Pass-through handler; subclasses override events to rewrite the stream."""
+
+    downstream = None
+
+    def startElement(self, name, attrs):
+        self.downstream.startElement(name, attrs)
+
+    def endElement(self, name):
+        self.downstream.endElement(name)
+
+    def characters(self, content):
+        self.downstream.characters(content)
+
+    def processingInstruction(self, target, data):
+        self.downstream.processingInstruction(target, data)
+
+    def comment(self, content):
+        self.downstream.comment(content)
+
+    def startCDATA(self):
+        self.downstream.startCDATA()
+
+    def endCDATA(self):
+        self.downstream.endCDATA()
+
+    def startDTD(self, name, public_id, system_id):
+        self.downstream.startDTD(name, public_id, system_id)
+
+    def endDTD(self):
+        self.downstream.endDTD()
+
+    def startEntity(self, name):
+        self.downstream.startEntity(name)
+
+    def endEntity(self, name):
+        self.downstream.endEntity(name)
+
+
+def _escape(data: str) -> str:
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+class _Frame:
+    __slots__ = ("name", "state", "single", "prefixes")
+
+    def __init__(self, name, prefixes):
+        self.name = name
+        self.state = _EMPTY
+        self.single = None
+        self.prefixes = prefixes
+
+
+class _XmlFormatter(xml.sax.handler.ContentHandler):
+    def __init__(self, dest, encoding, indent, newl, condense):
+        super().__init__()
+        self._dest = dest
+        self._indent = indent
+        self._newl = newl
+        self._condense = condense
+        self._stack = []
+        self._text = []
+        self._in_cdata = False
+        self._cdata = None
+        self._out = [f'<?xml version="1.0" encoding="{encoding}"?>{newl}']
+        self._out_size = 0
+
+    def _write(self, data: str) -> None:
+        self._out.append(data)
+        self._out_size += len(data)
+        if self._out_size >= _FLUSH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        self._dest.write("".join(self._out).encode("utf-8"))
+        self._out = []
+        self._out_size = 0
+
+    def _child_indent(self) -> str:
+        return self._indent * len(self._stack)
+
+    def _open_block(self, frame) -> None:
+        if frame.state == _BLOCK:
+            return
+        self._write(">" + self._newl)
+        if frame.state == _SINGLE:
+            self._write_node(frame.single)
+            frame.single = None
+        frame.state = _BLOCK
+
+    def _write_node(self, node) -> None:
+        kind, data = node
+        if kind == "text":
+            self._write(_escape(self._child_indent() + data + self._newl))
+        elif kind == "cdata":
+            self._write(f"<![CDATA[{data}]]>")
+        else:
+            self._write(f"{self._child_indent()}{data}{self._newl}")
+
+    def _add_child(self, kind: str, data: str) -> None:
+        if not self._stack:
+            if kind not in ("text", "cdata"):
+                self._write(f"{data}{self._newl}")
+            return
+
+        frame = self._stack[-1]
+        if frame.state == _EMPTY and kind in ("text", "cdata"):
+            frame.state = _SINGLE
+            frame.single = (kind, data)
+            return
+
+        self._open_block(frame)
+        self._write_node((kind, data))
+
+    def _flush_text(self) -> None:
+        if not self._text:
+            return
+        data = "".join(self._text)
+        self._text = []
+
+        if (
+            self._condense
+            and not data.strip()
+            and not self._stack[-1].name.endswith(":t")
+        ):
+            return
+        self._add_child("text", data)
+
+    def _check_prefixes(self, name, attrs, prefixes) -> None:
+        names = [name] + [a for a in attrs if not a.startswith("xmlns")]
+        for qname in names:
+            prefix, sep, _ = qname.partition(":")
+            if sep and prefix != "xml" and prefix not in prefixes:
+                raise ValueError(f"unbound prefix: {qname}")
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+
+        prefixes = self._stack[-1].prefixes if self._stack else frozenset()
+        declared = [a for a in attrs.keys() if a == "xmlns" or a.startswith("xmlns:")]
+        if declared:
+            prefixes = prefixes | {a[6:] for a in declared if a != "xmlns"}
+        self._check_prefixes(name, attrs.keys(), prefixes)
+
+        if self._stack:
+            self._open_block(self._stack[-1])
+
+        parts = [self._child_indent(), "<", name]
+        ordered = declared + [a for a in attrs.keys() if a not in declared]
+        for attr in ordered:
+            parts.append(f' {attr}="{_escape(attrs[attr])}"')
+        self._write("".join(parts))
+
+        self._stack.append(_Frame(name, prefixes))
+
+    def endElement(self, name):
+        self._flush_text()
+        frame = self._stack.pop()
+
+        if frame.state == _EMPTY:
+            self._write("/>" + self._newl)
+        elif frame.state == _SINGLE:
+            kind, data = frame.single
+            inner = _escape(data) if kind == "text" else f"<![CDATA[{data}]]>"
+            self._write(f">{inner}</{frame.name}>{self._newl}")
+        else:
+            self._write(f"{self._child_indent()}</{frame.name}>{self._newl}")
+
+    def characters(self, content):
+        if self._in_cdata:
+            self._cdata.append(content)
+        elif self._stack:
+            self._text.append(content)
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        self._add_child("pi", f"<?{target} {data}?>")
+
+    def comment(self, content):
+        self._flush_text()
+        if self._condense and self._stack and not self._stack[-1].name.endswith(":t"):
+            return
+        self._add_child("comment", f"<!--{content}-->")
+
+    def startCDATA(self):
+        self._in_cdata = True
+        self._cdata = []
+
+    def endCDATA(self):
+        # An empty section adds no node, so minidom merges the text around it
+        self._in_cdata = False
+        if self._cdata:
+            self._flush_text()
+            self._add_child("cdata", "".join(self._cdata))
+        self._cdata = None
+
+    def startDTD(self, name, public_id, system_id):
+        raise ValueError("DOCTYPE declarations are not supported in Office parts")
+
+    def endDTD(self):
+        pass
+
+    def startEntity(self, name):
+        pass
+
+    def endEntity(self, name):
+        pass
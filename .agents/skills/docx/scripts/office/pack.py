@@ -11,16 +11,42 @@ Examples:
 """
 
 import argparse
+import os
 import sys
-import shutil
-import tempfile
 import zipfile
 from pathlib import Path
 
-import defusedxml.minidom
-
+from helpers.xml_format import write_condensed_xml
 from validators import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
 
+CONTENT_TYPES = "[Content_Types].xml"
+
+# Already-compressed media and embedded packages gain nothing from deflate
+STORED_SUFFIXES = {
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".webp",
+    ".wdp",
+    ".jxr",
+    ".mp3",
+    ".m4a",
+    ".wma",
+    ".mp4",
+    ".m4v",
+    ".mov",
+    ".avi",
+    ".wmv",
+    ".zip",
+    ".docx",
+    ".xlsx",
+    ".pptx",
+    ".odt",
+    ".ods",
+    ".odp",
+}
+
 def pack(
     input_directory: str,
     output_file: str,
@@ -49,21 +75,45 @@ def pack(
             if not success:
                 return None, f"Error: Validation failed for {input_dir}"
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_output = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with zipfile.ZipFile(temp_output, "w", zipfile.ZIP_DEFLATED) as zf:
+            for part, arcname in _package_parts(input_dir):
+                _write_part(zf, part, arcname)
+        os.replace(temp_output, output_path)
+    except BaseException:
+        temp_output.unlink(missing_ok=True)
+        raise
 
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                _condense_xml(xml_file)
+    return None, f"Successfully packed {input_dir} to {output_file}"
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
 
-    return None, f"Successfully packed {input_dir} to {output_file}"
+def _package_parts(input_dir: Path) -> list[tuple[Path, str]]:
+    parts = [
+        (f, f.relative_to(input_dir).as_posix())
+        for f in input_dir.rglob("*")
+        if f.is_file()
+    ]
+    # OPC consumers expect [Content_Types].xml as the first member
+    parts.sort(key=lambda part: (part[1] != CONTENT_TYPES, part[1]))
+    return parts
+
+
+def _write_part(zf: zipfile.ZipFile, part: Path, arcname: str) -> None:
+    if part.name.endswith((".xml", ".rels")):
+        try:
+            with open(part, "rb") as src, zf.open(arcname, "w") as dest:
+                write_condensed_xml(src, dest)
+        except Exception as e:
+            print(f"ERROR: Failed to parse {part.name}: {e}", file=sys.stderr)
+            raise
+        return
+
+    if part.suffix.lower() in STORED_SUFFIXES:
+        zf.write(part, arcname, compress_type=zipfile.ZIP_STORED)
+    else:
+        zf.write(part, arcname)
 
 
 def _run_validation(
@@ -71,6 +121,7 @@ def _run_validation(
     original_file: Path,
     suffix: str,
     infer_author_func=None,
+    cache: bool = True,
 ) -> tuple[bool, str | None]:
     output_lines = []
     validators = []
@@ -84,11 +135,11 @@ def _run_validation(
                 print(f"Warning: {e} Using default author 'Claude'.", file=sys.stderr)
 
         validators = [
-            DOCXSchemaValidator(unpacked_dir, original_file),
+            DOCXSchemaValidator(unpacked_dir, original_file, cache=cache),
             RedliningValidator(unpacked_dir, original_file, author=author),
         ]
     elif suffix == ".pptx":
-        validators = [PPTXSchemaValidator(unpacked_dir, original_file)]
+        validators = [PPTXSchemaValidator(unpacked_dir, original_file, cache=cache)]
 
     if not validators:
         return True, None
@@ -105,29 +156,6 @@ def _run_validation(
     return success, "\n".join(output_lines) if output_lines else None
 
 
-def _condense_xml(xml_file: Path) -> None:
-    try:
-        with open(xml_file, encoding="utf-8") as f:
-            dom = defusedxml.minidom.parse(f)
-
-        for element in dom.getElementsByTagName("*"):
-            if element.tagName.endswith(":t"):
-                continue
-
-            for child in list(element.childNodes):
-                if (
-                    child.nodeType == child.TEXT_NODE
-                    and child.nodeValue
-                    and child.nodeValue.strip() == ""
-                ) or child.nodeType == child.COMMENT_NODE:
-                    element.removeChild(child)
-
-        xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
-    except Exception as e:
-        print(f"ERROR: Failed to parse {xml_file.name}: {e}", file=sys.stderr)
-        raise
-
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Pack a directory into a DOCX, PPTX, or XLSX file"
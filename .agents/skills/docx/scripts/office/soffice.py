@@ -12,22 +12,33 @@ Usage:
     # Option 2 – get env dict for your own subprocess calls
     env = get_soffice_env()
     subprocess.run(["soffice", ...], env=env)
+
+    # Option 3 – many documents: run jobs in parallel on pre-initialized profiles
+    with SofficePool(workers=4) as pool:
+        pool.convert("input.docx", "out/", "pdf")
 """
 
+import functools
 import os
+import queue
+import shutil
+import signal
 import socket
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Callable
 
 
 def get_soffice_env() -> dict:
     env = os.environ.copy()
     env["SAL_USE_VCLPLUGIN"] = "svp"
 
-    if _needs_shim():
-        shim = _ensure_shim()
-        env["LD_PRELOAD"] = str(shim)
+    preload = _shim_preload()
+    if preload:
+        env["LD_PRELOAD"] = preload
 
     return env
 
@@ -37,10 +48,200 @@ def run_soffice(args: list[str], **kwargs) -> subprocess.CompletedProcess:
     return subprocess.run(["soffice"] + args, env=env, **kwargs)
 
 
+class SofficePool:
+    """Runs soffice jobs on a fixed set of workers, one user profile each.
+
+    Each worker creates its profile once, with --terminate_after_init, and
+    reuses it for every job it takes from the queue. This saves the
+    first-run profile setup on every job after the first. It is not a warm
+    instance: every job still starts a new soffice process and pays its
+    process startup. Workers never share a profile, so jobs run in parallel
+    without fighting over its lock. A job that outlives its timeout has its
+    process group killed; a job killed by a signal (a crash) also gets its
+    worker's profile rebuilt before the next job.
+
+    `soffice` may name any executable that accepts soffice's arguments, which
+    lets the pool run against a stand-in script.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 30,
+        soffice: str = "soffice",
+        profile_root: str | Path | None = None,
+        init_timeout: float = 60,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.timeout = timeout
+        self.soffice = soffice
+        self.init_timeout = init_timeout
+        self.restarts = 0
+
+        self._owns_root = profile_root is None
+        self._root = Path(
+            tempfile.mkdtemp(prefix="soffice_pool_") if profile_root is None
+            else profile_root
+        )
+        self._jobs: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._threads = []
+        for n in range(workers):
+            worker = _PoolWorker(self, self._root / f"worker{n}")
+            thread = threading.Thread(
+                target=self._serve, args=(worker,), name=f"soffice-{n}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(
+        self,
+        args: list[str],
+        timeout: float | None = None,
+        setup: Callable[[Path], None] | None = None,
+    ) -> Future:
+        """Queue soffice `args`; `setup(profile_dir)` runs on the worker first."""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SofficePool is closed")
+            self._jobs.put((future, list(args), timeout, setup))
+        return future
+
+    def run(
+        self,
+        args: list[str],
+        timeout: float | None = None,
+        setup: Callable[[Path], None] | None = None,
+    ) -> subprocess.CompletedProcess:
+        return self.submit(args, timeout, setup).result()
+
+    def convert(
+        self,
+        input_file: str | Path,
+        output_dir: str | Path,
+        fmt: str = "pdf",
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess:
+        return self.run(
+            ["--convert-to", fmt, "--outdir", str(output_dir), str(input_file)],
+            timeout,
+        )
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in self._threads:
+                self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        if self._owns_root:
+            shutil.rmtree(self._root, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _serve(self, worker: "_PoolWorker"):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, args, timeout, setup = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = worker.run(args, timeout, setup)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+class _PoolWorker:
+    def __init__(self, pool: SofficePool, profile: Path):
+        self.pool = pool
+        self.profile = profile
+        self.ready = False
+
+    def run(self, args, timeout, setup) -> subprocess.CompletedProcess:
+        if not self.ready:
+            self._init_profile()
+        if setup is not None:
+            setup(self.profile)
+
+        timeout = self.pool.timeout if timeout is None else timeout
+        try:
+            result = self._spawn(args, timeout)
+        except subprocess.TimeoutExpired:
+            # The profile survives a kill; only its lock file is left behind
+            (self.profile / "user" / ".lock").unlink(missing_ok=True)
+            raise
+
+        if result.returncode < 0:
+            self._reset_profile()
+        return result
+
+    def _spawn(self, args, timeout) -> subprocess.CompletedProcess:
+        cmd = [
+            self.pool.soffice,
+            "--headless",
+            f"-env:UserInstallation={self.profile.as_uri()}",
+            "--norestore",
+            *args,
+        ]
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=get_soffice_env(),
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # soffice forks soffice.bin; kill the whole session, not just the launcher
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.communicate()
+            raise
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+    def _init_profile(self):
+        self.profile.mkdir(parents=True, exist_ok=True)
+        try:
+            self._spawn(["--terminate_after_init"], self.pool.init_timeout)
+        except subprocess.TimeoutExpired:
+            (self.profile / "user" / ".lock").unlink(missing_ok=True)
+        self.ready = True
+
+    def _reset_profile(self):
+        shutil.rmtree(self.profile, ignore_errors=True)
+        self.ready = False
+        with self.pool._lock:
+            self.pool.restarts += 1
+
 
 _SHIM_SO = Path(tempfile.gettempdir()) / "lo_socket_shim.so"
 
 
+@functools.cache
+def _shim_preload() -> str | None:
+    if _needs_shim():
+        return str(_ensure_shim())
+    return None
+
+
 def _needs_shim() -> bool:
     try:
         s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
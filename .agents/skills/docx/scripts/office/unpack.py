@@ -1,6 +1,7 @@
 """Unpack Office files (DOCX, PPTX, XLSX) for editing.
 
-Extracts the ZIP archive, pretty-prints XML files, and optionally:
+Streams each ZIP member to disk once. XML parts are pretty-printed in memory
+before they are written, and optionally:
 - Merges adjacent runs with identical formatting (DOCX only)
 - Simplifies adjacent tracked changes from same author (DOCX only)
 
@@ -14,14 +15,21 @@ Examples:
 """
 
 import argparse
+import io
+import shutil
 import sys
+import time
 import zipfile
-from pathlib import Path
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
 
-import defusedxml.minidom
-
-from helpers.merge_runs import merge_runs as do_merge_runs
-from helpers.simplify_redlines import simplify_redlines as do_simplify_redlines
+from helpers.merge_runs import RunMerger
+from helpers.simplify_redlines import (
+    RedlineSimplifier,
+    RevisionIndex,
+    cache_docx_revision_index,
+)
+from helpers.xml_format import pretty_print_xml, write_xml
 
 SMART_QUOTE_REPLACEMENTS = {
     "\u201c": "&#x201C;",  
@@ -36,10 +44,12 @@ def unpack(
     output_directory: str,
     merge_runs: bool = True,
     simplify_redlines: bool = True,
+    timings: dict[str, float] | None = None,
 ) -> tuple[None, str]:
     input_path = Path(input_file)
     output_path = Path(output_directory)
     suffix = input_path.suffix.lower()
+    timings = {} if timings is None else timings
 
     if not input_path.exists():
         return None, f"Error: {input_file} does not exist"
@@ -50,27 +60,57 @@ def unpack(
     try:
         output_path.mkdir(parents=True, exist_ok=True)
 
+        xml_count = 0
+        simplify_count = 0
+        merge_count = 0
+
         with zipfile.ZipFile(input_path, "r") as zf:
-            zf.extractall(output_path)
+            for info in zf.infolist():
+                target = _member_path(output_path, info.filename)
+                if target is None:
+                    continue
+
+                if info.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+
+                if not info.filename.endswith((".xml", ".rels")):
+                    with _timed(timings, "copy"):
+                        with zf.open(info) as src, open(target, "wb") as dst:
+                            shutil.copyfileobj(src, dst)
+                    continue
+
+                xml_count += 1
 
-        xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-        for xml_file in xml_files:
-            _pretty_print_xml(xml_file)
+                with _timed(timings, "read"):
+                    content = zf.read(info)
 
-        message = f"Unpacked {input_file} ({len(xml_files)} XML files)"
+                with _timed(timings, "pretty_print"):
+                    content = _pretty_print_xml(content)
+
+                if suffix == ".docx" and info.filename == "word/document.xml":
+                    content, simplify_count, merge_count, index = _simplify_document(
+                        content, simplify_redlines, merge_runs, timings
+                    )
+                    if index is not None:
+                        cache_docx_revision_index(input_path, index)
+
+                with _timed(timings, "escape_smart_quotes"):
+                    content = _escape_smart_quotes(content)
+
+                with _timed(timings, "write"):
+                    target.write_bytes(content)
+
+        message = f"Unpacked {input_file} ({xml_count} XML files)"
 
         if suffix == ".docx":
             if simplify_redlines:
-                simplify_count, _ = do_simplify_redlines(str(output_path))
                 message += f", simplified {simplify_count} tracked changes"
 
             if merge_runs:
-                merge_count, _ = do_merge_runs(str(output_path))
                 message += f", merged {merge_count} runs"
 
-        for xml_file in xml_files:
-            _escape_smart_quotes(xml_file)
-
         return None, message
 
     except zipfile.BadZipFile:
@@ -79,23 +119,70 @@ def unpack(
         return None, f"Error unpacking: {e}"
 
 
-def _pretty_print_xml(xml_file: Path) -> None:
+@contextmanager
+def _timed(timings: dict[str, float], stage: str):
+    start = time.perf_counter()
     try:
-        content = xml_file.read_text(encoding="utf-8")
-        dom = defusedxml.minidom.parseString(content)
-        xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="utf-8"))
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+
+def _member_path(output_path: Path, member_name: str) -> Path | None:
+    parts = [
+        part
+        for part in PurePosixPath(member_name.replace("\\", "/")).parts
+        if part not in ("", "/", ".", "..")
+    ]
+    if not parts:
+        return None
+    return output_path.joinpath(*parts)
+
+
+def _simplify_document(
+    content: bytes,
+    simplify_redlines: bool,
+    merge_runs: bool,
+    timings: dict[str, float],
+) -> tuple[bytes, int, int, RevisionIndex | None]:
+    if not (simplify_redlines or merge_runs):
+        return content, 0, 0, None
+
+    simplifier = RedlineSimplifier() if simplify_redlines else None
+    merger = RunMerger() if merge_runs else None
+    filters = [f for f in (simplifier, merger) if f is not None]
+
+    try:
+        output = io.BytesIO()
+        with _timed(timings, "simplify_and_merge"):
+            write_xml(io.BytesIO(content), output, filters)
     except Exception:
-        pass  
+        return content, 0, 0, None
 
+    return (
+        output.getvalue(),
+        simplifier.merge_count if simplifier else 0,
+        merger.merge_count if merger else 0,
+        simplifier.index if simplifier else None,
+    )
 
-def _escape_smart_quotes(xml_file: Path) -> None:
+
+def _pretty_print_xml(content: bytes) -> bytes:
     try:
-        content = xml_file.read_text(encoding="utf-8")
-        for char, entity in SMART_QUOTE_REPLACEMENTS.items():
-            content = content.replace(char, entity)
-        xml_file.write_text(content, encoding="utf-8")
+        content.decode("utf-8")
+        return pretty_print_xml(content, indent="  ")
     except Exception:
-        pass
+        return content
+
+
+def _escape_smart_quotes(content: bytes) -> bytes:
+    try:
+        text = content.decode("utf-8")
+    except UnicodeDecodeError:
+        return content
+    for char, entity in SMART_QUOTE_REPLACEMENTS.items():
+        text = text.replace(char, entity)
+    return text.encode("utf-8")
 
 
 if __name__ == "__main__":
@@ -118,15 +205,27 @@ if __name__ == "__main__":
         metavar="true|false",
         help="Merge adjacent tracked changes from same author (DOCX only, default: true)",
     )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Print time spent in each pipeline stage",
+    )
     args = parser.parse_args()
 
+    timings: dict[str, float] = {}
     _, message = unpack(
         args.input_file,
         args.output_directory,
         merge_runs=args.merge_runs,
         simplify_redlines=args.simplify_redlines,
+        timings=timings,
     )
     print(message)
 
+    if args.verbose:
+        for stage, seconds in timings.items():
+            print(f"  {stage}: {seconds:.3f}s")
+
     if "Error" in message:
         sys.exit(1)
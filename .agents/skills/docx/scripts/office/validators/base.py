@@ -2,12 +2,64 @@
 Base validator with common validation logic for document files.
 """
 
+import hashlib
 import re
+import time
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import defusedxml.minidom
 import lxml.etree
 
+from helpers.opc import CONTENT_TYPES, PackageGraph, rels_part_for
+
+from .cache import MISS, ValidationCache, validator_fingerprint
+
+_COMPILED_SCHEMAS = {}
+
+
+def get_compiled_schema(schema_path):
+    schema_path = Path(schema_path).resolve()
+    mtime = schema_path.stat().st_mtime_ns
+
+    cached = _COMPILED_SCHEMAS.get(schema_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(schema_path, "rb") as xsd_file:
+        parser = lxml.etree.XMLParser()
+        xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=str(schema_path))
+    schema = lxml.etree.XMLSchema(xsd_doc)
+
+    _COMPILED_SCHEMAS[schema_path] = (mtime, schema)
+    return schema
+
+
+IdEntry = namedtuple("IdEntry", "file line tag attr scope value rid")
+
+_LOCAL_NAMES = {}
+
+
+def _local_name(qname):
+    name = _LOCAL_NAMES.get(qname)
+    if name is None:
+        name = _LOCAL_NAMES[qname] = qname.rpartition("}")[2].lower()
+    return name
+
+
+_WORKER_VALIDATOR = None
+
+
+def _init_xsd_worker(validator_class, unpacked_dir, original_file):
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = validator_class(unpacked_dir, original_file, cache=False)
+
+
+def _validate_file_in_worker(xml_file):
+    return _WORKER_VALIDATOR.validate_file_against_xsd(xml_file, verbose=False)
+
 
 class BaseSchemaValidator:
 
@@ -91,16 +143,36 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file=None, verbose=False):
+    def __init__(
+        self, unpacked_dir, original_file=None, verbose=False, jobs=1, cache=False
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file) if original_file else None
         self.verbose = verbose
+        self.jobs = max(1, jobs)
+
+        self._original_archive = None
+        self._original_errors = {}
+
+        self._xml_trees = {}
+        self._id_entries = {}
+        self._parse_stats = {"parses": 0, "parse_time": 0.0, "hits": 0, "saved": 0.0}
 
         self.schemas_dir = Path(__file__).parent.parent / "schemas"
 
-        patterns = ["*.xml", "*.rels"]
+        self._part_digests = {}
+        self._validation_cache = None
+        if cache:
+            self._validation_cache = ValidationCache(
+                self.unpacked_dir,
+                type(self).__name__,
+                validator_fingerprint(self.schemas_dir),
+            )
+
+        self.package = PackageGraph(self.unpacked_dir, parse=self._parse_xml)
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            f for suffix in (".xml", ".rels")
+            for f in self.package.files if f.name.endswith(suffix)
         ]
 
         if not self.xml_files:
@@ -112,10 +184,177 @@ class BaseSchemaValidator:
     def repair(self) -> int:
         return self.repair_whitespace_preservation()
 
+    def _parse_xml(self, xml_file):
+        xml_file = Path(xml_file)
+
+        cached = self._xml_trees.get(xml_file)
+        if cached is not None:
+            tree, elapsed = cached
+            self._parse_stats["hits"] += 1
+            self._parse_stats["saved"] += elapsed
+            return tree
+
+        start = time.perf_counter()
+        tree = lxml.etree.parse(str(xml_file))
+        elapsed = time.perf_counter() - start
+
+        self._xml_trees[xml_file] = (tree, elapsed)
+        self._parse_stats["parses"] += 1
+        self._parse_stats["parse_time"] += elapsed
+        return tree
+
+    def _invalidate_xml(self, xml_file):
+        self._xml_trees.pop(Path(xml_file), None)
+        self._id_entries.pop(Path(xml_file), None)
+        self._part_digests.pop(Path(xml_file), None)
+
+    def _part_digest(self, xml_file):
+        digest = self._part_digests.get(xml_file)
+        if digest is None:
+            digest = hashlib.sha256(xml_file.read_bytes()).hexdigest()
+            self._part_digests[xml_file] = digest
+        return digest
+
+    def _cache_key(self, check, xml_file):
+        key = self._part_digest(xml_file)
+        if check == "xsd":
+            key += ":" + self._original_part_key(xml_file)
+        return key
+
+    def _cache_get(self, check, xml_file):
+        if self._validation_cache is None:
+            return MISS
+        part_name = xml_file.relative_to(self.unpacked_dir).as_posix()
+        return self._validation_cache.get(
+            check, part_name, self._cache_key(check, xml_file)
+        )
+
+    def _cache_put(self, check, xml_file, value):
+        if self._validation_cache is None:
+            return
+        part_name = xml_file.relative_to(self.unpacked_dir).as_posix()
+        self._validation_cache.put(
+            check, part_name, self._cache_key(check, xml_file), value
+        )
+
+    def _cached_check(self, check, xml_file, compute):
+        xml_file = Path(xml_file)
+        value = self._cache_get(check, xml_file)
+        if value is MISS:
+            value = compute(xml_file)
+            self._cache_put(check, xml_file, value)
+        return value
+
+    def save_validation_cache(self):
+        if self._validation_cache is None:
+            return
+        self._validation_cache.save(
+            f.relative_to(self.unpacked_dir).as_posix() for f in self.xml_files
+        )
+        if self.verbose:
+            self._validation_cache.report()
+
+    def get_id_entries(self, xml_file):
+        xml_file = Path(xml_file)
+        entries = self._id_entries.get(xml_file)
+        if entries is None:
+            rows = self._cached_check("ids", xml_file, self._index_ids)
+            entries = self._id_entries[xml_file] = [IdEntry(*row) for row in rows]
+        return entries
+
+    def _index_ids(self, xml_file):
+        root = self._parse_xml(xml_file).getroot()
+        relative_path = str(xml_file.relative_to(self.unpacked_dir))
+        mc_tag = f"{{{self.MC_NAMESPACE}}}AlternateContent"
+        rid_attr = f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+
+        entries = []
+        walker = lxml.etree.iterwalk(root, events=("start",))
+        for _, elem in walker:
+            if not isinstance(elem.tag, str):
+                continue
+            if elem.tag == mc_tag and elem is not root:
+                walker.skip_subtree()
+                continue
+
+            tag = _local_name(elem.tag)
+            if tag in self.EXCLUDED_ID_CONTAINERS:
+                walker.skip_subtree()
+                continue
+
+            requirement = self.UNIQUE_ID_REQUIREMENTS.get(tag)
+            if requirement is None:
+                continue
+
+            attr_name, scope = requirement
+            id_value = None
+            for attr, value in elem.attrib.items():
+                if _local_name(attr) == attr_name:
+                    id_value = value
+                    break
+
+            entries.append(
+                (
+                    relative_path,
+                    elem.sourceline,
+                    tag,
+                    attr_name,
+                    scope,
+                    id_value,
+                    elem.get(rid_attr),
+                )
+            )
+
+        return entries
+
+    def report_parse_stats(self):
+        stats = self._parse_stats
+        print(
+            f"Parsed {stats['parses']} XML parts in {stats['parse_time']:.2f}s, "
+            f"reused {stats['hits']} times (saved ~{stats['saved']:.2f}s of parsing)"
+        )
+
+    def _repair_candidates(self, check, needs_repair):
+        """Parts that may need a repair, screened on the shared lxml tree.
+
+        needs_repair must return True for every part the DOM repair would
+        change (false positives only cost a DOM pass). Verdicts are cached
+        by part digest, so clean parts are not re-screened on later runs.
+        Parts that fail to screen are left to the DOM pass to decide.
+        """
+        candidates = []
+        for xml_file in self.xml_files:
+            try:
+                if self._cached_check(check, xml_file, needs_repair):
+                    candidates.append(xml_file)
+            except Exception:
+                candidates.append(xml_file)
+        return candidates
+
+    def _needs_whitespace_repair(self, xml_file):
+        # minidom splits text at CDATA sections, so its first text node
+        # can end in whitespace where lxml's merged .text does not
+        if b"<![CDATA[" in xml_file.read_bytes():
+            return True
+
+        xml_space = f"{{{self.XML_NAMESPACE}}}space"
+        for elem in self._parse_xml(xml_file).getroot().iter("{*}t"):
+            if elem.prefix is None or elem.get(xml_space) == "preserve":
+                continue
+            if len(elem) and elem.text is None:
+                return True
+            text = elem.text
+            if text and (text.startswith((" ", "\t")) or text.endswith((" ", "\t"))):
+                return True
+        return False
+
     def repair_whitespace_preservation(self) -> int:
         repairs = 0
 
-        for xml_file in self.xml_files:
+        candidates = self._repair_candidates(
+            "whitespace_repair", self._needs_whitespace_repair
+        )
+        for xml_file in candidates:
             try:
                 content = xml_file.read_text(encoding="utf-8")
                 dom = defusedxml.minidom.parseString(content)
@@ -134,6 +373,7 @@ class BaseSchemaValidator:
 
                 if modified:
                     xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
+                    self._invalidate_xml(xml_file)
 
             except Exception:
                 pass
@@ -145,7 +385,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                lxml.etree.parse(str(xml_file))
+                self._parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -172,7 +412,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  
 
                 for attr_val in [
@@ -202,79 +442,38 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  
-
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                for elem in root.iter():
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
-
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        in_excluded_container = any(
-                            ancestor.tag.split("}")[-1].lower() in self.EXCLUDED_ID_CONTAINERS
-                            for ancestor in elem.iterancestors()
-                        )
-                        if in_excluded_container:
-                            continue
-
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
+                entries = self.get_id_entries(xml_file)
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
                 )
+                continue
+
+            file_ids = {}  
+            for entry in entries:
+                if entry.value is None:
+                    continue
+
+                if entry.scope == "global":
+                    if entry.value in global_ids:
+                        prev_file, prev_line, prev_tag = global_ids[entry.value]
+                        errors.append(
+                            f"  {entry.file}: "
+                            f"Line {entry.line}: Global ID '{entry.value}' in <{entry.tag}> "
+                            f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                        )
+                    else:
+                        global_ids[entry.value] = (entry.file, entry.line, entry.tag)
+                elif entry.scope == "file":
+                    seen = file_ids.setdefault((entry.tag, entry.attr), {})
+                    if entry.value in seen:
+                        errors.append(
+                            f"  {entry.file}: "
+                            f"Line {entry.line}: Duplicate {entry.attr}='{entry.value}' in <{entry.tag}> "
+                            f"(first occurrence at line {seen[entry.value]})"
+                        )
+                    else:
+                        seen[entry.value] = entry.line
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -289,21 +488,18 @@ class BaseSchemaValidator:
     def validate_file_references(self):
         errors = []
 
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_files = self.package.rels_files()
 
         if not rels_files:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  
-                all_files.append(file_path.resolve())
+        all_files = [
+            part
+            for part, path in self.package.parts.items()
+            if path.name != CONTENT_TYPES and not path.name.endswith(".rels")
+        ]
 
         all_referenced_files = set()
 
@@ -313,57 +509,28 @@ class BaseSchemaValidator:
             )
 
         for rels_file in rels_files:
-            try:
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                rels_dir = rels_file.parent
-
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  
-                        if target.startswith("/"):
-                            target_path = self.unpacked_dir / target.lstrip("/")
-                        elif rels_file.name == ".rels":
-                            target_path = self.unpacked_dir / target
-                        else:
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
+            rel_path = rels_file.relative_to(self.unpacked_dir)
+            rels_part = rel_path.as_posix()
+            error = self.package.rels_error(rels_part)
+            if error is not None:
+                errors.append(f"  Error parsing {rel_path}: {error}")
+                continue
 
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+            for rel in self.package.rels_relationships(rels_part):
+                if rel.part is None:
+                    continue
+                if self.package.exists(rel.part):
+                    all_referenced_files.add(rel.part)
+                else:
+                    errors.append(
+                        f"  {rel_path}: Line {rel.line}: Broken reference to {rel.target}"
+                    )
 
         unreferenced_files = set(all_files) - all_referenced_files
 
         if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+            for unref_file in sorted(unreferenced_files, key=lambda p: p.split("/")):
+                errors.append(f"  Unreferenced file: {Path(unref_file)}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
@@ -391,34 +558,28 @@ class BaseSchemaValidator:
             if xml_file.suffix == ".rels":
                 continue
 
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
+            source = xml_file.relative_to(self.unpacked_dir).as_posix()
+            rels_part = rels_part_for(source)
 
-            if not rels_file.exists():
+            if not self.package.exists(rels_part):
                 continue
 
             try:
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                error = self.package.rels_error(rels_part)
+                if error is not None:
+                    raise error
                 rid_to_type = {}
 
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
+                for rel in self.package.rels_relationships(rels_part):
+                    if rel.id:
+                        if rel.id in rid_to_type:
                             errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                                f"  {Path(rels_part)}: Line {rel.line}: "
+                                f"Duplicate relationship ID '{rel.id}' (IDs must be unique)"
                             )
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
+                        rid_to_type[rel.id] = rel.type.split("/")[-1]
 
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._parse_xml(xml_file).getroot()
 
                 r_ns = self.OFFICE_RELATIONSHIPS_NAMESPACE
                 rid_attrs_to_check = ["id", "embed", "link"]
@@ -492,29 +653,13 @@ class BaseSchemaValidator:
     def validate_content_types(self):
         errors = []
 
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        if not self.package.exists(CONTENT_TYPES):
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            declared_parts = self.package.content_types.overrides
+            declared_extensions = self.package.content_types.defaults
 
             declarable_roots = {
                 "sld",
@@ -538,9 +683,6 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
-
             for xml_file in self.xml_files:
                 path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
                     "\\", "/"
@@ -553,7 +695,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._parse_xml(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -564,7 +706,7 @@ class BaseSchemaValidator:
                 except Exception:
                     continue  
 
-            for file_path in all_files:
+            for file_path in self.package.files:
                 if file_path.suffix.lower() in {".xml", ".rels"}:
                     continue
                 if file_path.name == "[Content_Types].xml":
@@ -622,7 +764,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -639,11 +781,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        for xml_file, (is_valid, new_file_errors) in zip(
+            self.xml_files, self._validate_files_against_xsd()
+        ):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -657,7 +798,7 @@ class BaseSchemaValidator:
                 continue
 
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  
+            for error in sorted(new_file_errors)[:3]:  
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -682,6 +823,40 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd(self):
+        results = [None] * len(self.xml_files)
+        pending = []
+        for index, xml_file in enumerate(self.xml_files):
+            cached = self._cache_get("xsd", xml_file)
+            if cached is MISS:
+                pending.append(index)
+            else:
+                results[index] = (cached[0], set(cached[1]))
+
+        pending_files = [self.xml_files[index] for index in pending]
+        for index, result in zip(pending, self._run_xsd_validation(pending_files)):
+            results[index] = result
+            self._cache_put("xsd", self.xml_files[index], [result[0], sorted(result[1])])
+
+        return results
+
+    def _run_xsd_validation(self, xml_files):
+        if self.jobs == 1 or len(xml_files) < 2:
+            return [
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in xml_files
+            ]
+
+        chunksize = max(1, len(xml_files) // (self.jobs * 4))
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_xsd_worker,
+            initargs=(type(self), self.unpacked_dir, self.original_file),
+        ) as executor:
+            return list(
+                executor.map(_validate_file_in_worker, xml_files, chunksize=chunksize)
+            )
+
     def _get_schema_path(self, xml_file):
         if xml_file.name in self.SCHEMA_MAPPINGS:
             return self.schemas_dir / self.SCHEMA_MAPPINGS[xml_file.name]
@@ -753,63 +928,99 @@ class BaseSchemaValidator:
             return None, None  
 
         try:
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            xml_doc = self._parse_xml(xml_file)
 
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            return self._validate_doc_against_schema(
+                xml_doc, schema_path, xml_file.relative_to(base_path)
+            )
+
+        except Exception as e:
+            return False, {str(e)}
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
-            xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
+    def _validate_doc_against_schema(self, xml_doc, schema_path, relative_path):
+        schema = get_compiled_schema(schema_path)
 
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+        xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
+        xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
-            if schema.validate(xml_doc):
-                return True, set()
-            else:
-                errors = set()
-                for error in schema.error_log:
-                    errors.add(error.message)
-                return False, errors
+        if (
+            relative_path.parts
+            and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+        ):
+            xml_doc = self._clean_ignorable_namespaces(xml_doc)
 
-        except Exception as e:
-            return False, {str(e)}
+        if schema.validate(xml_doc):
+            return True, set()
+        else:
+            errors = set()
+            for error in schema.error_log:
+                errors.add(error.message)
+            return False, errors
 
     def _get_original_file_errors(self, xml_file):
         if self.original_file is None:
             return set()
 
-        import tempfile
-        import zipfile
-
         xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
+        part_name = xml_file.relative_to(self.unpacked_dir.resolve()).as_posix()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        if part_name not in self._original_errors:
+            self._original_errors[part_name] = self._validate_original_part(
+                part_name
+            )
+        return self._original_errors[part_name]
 
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+    def _validate_original_part(self, part_name):
+        if not self._has_original_part(part_name):
+            return set()
 
-            original_xml_file = temp_path / relative_path
+        relative_path = Path(part_name)
+        schema_path = self._get_schema_path(relative_path)
+        if not schema_path:
+            return set()
 
-            if not original_xml_file.exists():
-                return set()
+        try:
+            with self._get_original_archive().open(part_name) as f:
+                xml_doc = lxml.etree.parse(f)
 
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+            _, errors = self._validate_doc_against_schema(
+                xml_doc, schema_path, relative_path
             )
-            return errors if errors else set()
+        except Exception as e:
+            errors = {str(e)}
+
+        return errors if errors else set()
+
+    def _original_part_key(self, xml_file):
+        archive = self._get_original_archive()
+        if archive is None:
+            return "none"
+        part_name = xml_file.relative_to(self.unpacked_dir).as_posix()
+        try:
+            info = archive.getinfo(part_name)
+        except KeyError:
+            return "none"
+        return f"{info.CRC:08x}-{info.file_size}"
+
+    def _get_original_archive(self):
+        if self._original_archive is None and self.original_file is not None:
+            self._original_archive = zipfile.ZipFile(self.original_file, "r")
+        return self._original_archive
+
+    def _has_original_part(self, part_name):
+        archive = self._get_original_archive()
+        if archive is None:
+            return False
+        try:
+            archive.getinfo(part_name)
+        except KeyError:
+            return False
+        return True
+
+    def read_original_part(self, part_name):
+        if not self._has_original_part(part_name):
+            return None
+        return self._get_original_archive().read(part_name)
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         warnings = []
@@ -0,0 +1,95 @@
+"""
+On-disk cache of per-part validation results, keyed by part content hash.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_FORMAT = 1
+
+MISS = object()
+
+_FINGERPRINTS = {}
+
+
+def _fingerprint_files(paths):
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def validator_fingerprint(schemas_dir):
+    schemas_dir = Path(schemas_dir).resolve()
+    if schemas_dir not in _FINGERPRINTS:
+        sources = list(Path(__file__).parent.glob("*.py"))
+        schemas = [p for p in schemas_dir.rglob("*") if p.is_file()]
+        _FINGERPRINTS[schemas_dir] = (
+            _fingerprint_files(sources) + ":" + _fingerprint_files(schemas)
+        )
+    return _FINGERPRINTS[schemas_dir]
+
+
+class ValidationCache:
+    def __init__(self, unpacked_dir, validator_name, fingerprint):
+        unpacked_dir = Path(unpacked_dir)
+        self.path = unpacked_dir.parent / f".{unpacked_dir.name}.validation-cache.json"
+        self.context = {
+            "format": CACHE_FORMAT,
+            "validator": validator_name,
+            "fingerprint": fingerprint,
+        }
+        self.hits = 0
+        self.misses = 0
+        self._checks = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get("context") == self.context:
+            self._checks = data.get("checks", {})
+
+    def get(self, check, part, key):
+        entry = self._checks.get(check, {}).get(part)
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return MISS
+
+    def put(self, check, part, key, value):
+        self._checks.setdefault(check, {})[part] = [key, value]
+        self._dirty = True
+
+    def save(self, parts):
+        if not self._dirty:
+            return
+
+        parts = set(parts)
+        checks = {
+            check: {part: entry for part, entry in entries.items() if part in parts}
+            for check, entries in self._checks.items()
+        }
+        temp_path = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"context": self.context, "checks": checks}, f)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            print(f"Warning: Could not write validation cache {self.path}: {e}")
+
+    def report(self):
+        print(
+            f"Validation cache: {self.hits} hits, {self.misses} misses ({self.path.name})"
+        )
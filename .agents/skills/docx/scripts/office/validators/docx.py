@@ -4,8 +4,6 @@ Validator for Word document XML files against XSD schemas.
 
 import random
 import re
-import tempfile
-import zipfile
 
 import defusedxml.minidom
 import lxml.etree
@@ -61,6 +59,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         self.compare_paragraph_counts()
 
+        self.save_validation_cache()
+        if self.verbose:
+            self.report_parse_stats()
+
         return all_valid
 
     def validate_whitespace_preservation(self):
@@ -71,29 +73,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        if re.search(r"^[ \t\n\r]", text) or re.search(
-                            r"[ \t\n\r]$", text
-                        ):
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
+                errors.extend(
+                    self._cached_check(
+                        "whitespace", xml_file, self._find_whitespace_errors
+                    )
+                )
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
@@ -109,6 +93,31 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All whitespace is properly preserved")
             return True
 
+    def _find_whitespace_errors(self, xml_file):
+        errors = []
+        root = self._parse_xml(xml_file).getroot()
+
+        for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
+            if elem.text:
+                text = elem.text
+                if re.search(r"^[ \t\n\r]", text) or re.search(r"[ \t\n\r]$", text):
+                    xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
+                    if (
+                        xml_space_attr not in elem.attrib
+                        or elem.attrib[xml_space_attr] != "preserve"
+                    ):
+                        text_preview = (
+                            repr(text)[:50] + "..."
+                            if len(repr(text)) > 50
+                            else repr(text)
+                        )
+                        errors.append(
+                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                            f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                        )
+
+        return errors
+
     def validate_deletions(self):
         errors = []
 
@@ -117,7 +126,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 for t_elem in root.xpath(".//w:del//w:t", namespaces=namespaces):
@@ -168,7 +177,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
             except Exception as e:
@@ -177,22 +186,17 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         return count
 
     def count_paragraphs_in_original(self):
-        original = self.original_file
-        if original is None:
+        if self.original_file is None:
             return 0
 
         count = 0
 
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with zipfile.ZipFile(original, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
+            content = self.read_original_part("word/document.xml")
+            root = lxml.etree.fromstring(content)
 
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -207,7 +211,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 invalid_elements = root.xpath(
@@ -253,39 +257,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
     def validate_id_constraints(self):
         errors = []
-        para_id_attr = f"{{{self.W14_NAMESPACE}}}paraId"
-        durable_id_attr = f"{{{self.W16CID_NAMESPACE}}}durableId"
 
         for xml_file in self.xml_files:
-            try:
-                for elem in lxml.etree.parse(str(xml_file)).iter():
-                    if val := elem.get(para_id_attr):
-                        if self._parse_id_value(val, base=16) >= 0x80000000:
-                            errors.append(
-                                f"  {xml_file.name}:{elem.sourceline}: paraId={val} >= 0x80000000"
-                            )
-
-                    if val := elem.get(durable_id_attr):
-                        if xml_file.name == "numbering.xml":
-                            try:
-                                if self._parse_id_value(val, base=10) >= 0x7FFFFFFF:
-                                    errors.append(
-                                        f"  {xml_file.name}:{elem.sourceline}: "
-                                        f"durableId={val} >= 0x7FFFFFFF"
-                                    )
-                            except ValueError:
-                                errors.append(
-                                    f"  {xml_file.name}:{elem.sourceline}: "
-                                    f"durableId={val} must be decimal in numbering.xml"
-                                )
-                        else:
-                            if self._parse_id_value(val, base=16) >= 0x7FFFFFFF:
-                                errors.append(
-                                    f"  {xml_file.name}:{elem.sourceline}: "
-                                    f"durableId={val} >= 0x7FFFFFFF"
-                                )
-            except Exception:
-                pass
+            errors.extend(
+                self._cached_check(
+                    "id_constraints", xml_file, self._find_id_constraint_errors
+                )
+            )
 
         if errors:
             print(f"FAILED - {len(errors)} ID constraint violations:")
@@ -295,6 +273,43 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             print("PASSED - All paraId/durableId values within constraints")
         return not errors
 
+    def _find_id_constraint_errors(self, xml_file):
+        errors = []
+        para_id_attr = f"{{{self.W14_NAMESPACE}}}paraId"
+        durable_id_attr = f"{{{self.W16CID_NAMESPACE}}}durableId"
+
+        try:
+            for elem in self._parse_xml(xml_file).iter():
+                if val := elem.get(para_id_attr):
+                    if self._parse_id_value(val, base=16) >= 0x80000000:
+                        errors.append(
+                            f"  {xml_file.name}:{elem.sourceline}: paraId={val} >= 0x80000000"
+                        )
+
+                if val := elem.get(durable_id_attr):
+                    if xml_file.name == "numbering.xml":
+                        try:
+                            if self._parse_id_value(val, base=10) >= 0x7FFFFFFF:
+                                errors.append(
+                                    f"  {xml_file.name}:{elem.sourceline}: "
+                                    f"durableId={val} >= 0x7FFFFFFF"
+                                )
+                        except ValueError:
+                            errors.append(
+                                f"  {xml_file.name}:{elem.sourceline}: "
+                                f"durableId={val} must be decimal in numbering.xml"
+                            )
+                    else:
+                        if self._parse_id_value(val, base=16) >= 0x7FFFFFFF:
+                            errors.append(
+                                f"  {xml_file.name}:{elem.sourceline}: "
+                                f"durableId={val} >= 0x7FFFFFFF"
+                            )
+        except Exception:
+            pass
+
+        return errors
+
     def validate_comment_markers(self):
         errors = []
 
@@ -312,7 +327,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             return True
 
         try:
-            doc_root = lxml.etree.parse(str(document_xml)).getroot()
+            doc_root = self._parse_xml(document_xml).getroot()
             namespaces = {"w": self.WORD_2006_NAMESPACE}
 
             range_starts = {
@@ -352,7 +367,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
             comment_ids = set()
             if comments_xml and comments_xml.exists():
-                comments_root = lxml.etree.parse(str(comments_xml)).getroot()
+                comments_root = self._parse_xml(comments_xml).getroot()
                 comment_ids = {
                     elem.get(f"{{{self.WORD_2006_NAMESPACE}}}id")
                     for elem in comments_root.xpath(
@@ -388,10 +403,27 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         repairs += self.repair_durableId()
         return repairs
 
+    def _durable_id_needs_repair(self, xml_file, durable_id) -> bool:
+        base = 10 if xml_file.name == "numbering.xml" else 16
+        try:
+            return self._parse_id_value(durable_id, base=base) >= 0x7FFFFFFF
+        except ValueError:
+            return True
+
+    def _needs_durable_id_repair(self, xml_file):
+        root = self._parse_xml(xml_file).getroot()
+        return any(
+            self._durable_id_needs_repair(xml_file, value)
+            for value in root.xpath("//@*[local-name()='durableId']")
+        )
+
     def repair_durableId(self) -> int:
         repairs = 0
 
-        for xml_file in self.xml_files:
+        candidates = self._repair_candidates(
+            "durable_id_repair", self._needs_durable_id_repair
+        )
+        for xml_file in candidates:
             try:
                 content = xml_file.read_text(encoding="utf-8")
                 dom = defusedxml.minidom.parseString(content)
@@ -402,24 +434,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                         continue
 
                     durable_id = elem.getAttribute("w16cid:durableId")
-                    needs_repair = False
-
-                    if xml_file.name == "numbering.xml":
-                        try:
-                            needs_repair = (
-                                self._parse_id_value(durable_id, base=10) >= 0x7FFFFFFF
-                            )
-                        except ValueError:
-                            needs_repair = True
-                    else:
-                        try:
-                            needs_repair = (
-                                self._parse_id_value(durable_id, base=16) >= 0x7FFFFFFF
-                            )
-                        except ValueError:
-                            needs_repair = True
-
-                    if needs_repair:
+                    if self._durable_id_needs_repair(xml_file, durable_id):
                         value = random.randint(1, 0x7FFFFFFE)
                         if xml_file.name == "numbering.xml":
                             new_id = str(value)  
@@ -435,6 +450,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
                 if modified:
                     xml_file.write_bytes(dom.toxml(encoding="UTF-8"))
+                    self._invalidate_xml(xml_file)
 
             except Exception:
                 pass
@@ -3,6 +3,9 @@ Validator for PowerPoint presentation XML files against XSD schemas.
 """
 
 import re
+from pathlib import Path
+
+from helpers.opc import rels_part_for
 
 from .base import BaseSchemaValidator
 
@@ -57,6 +60,10 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         if not self.validate_no_duplicate_slide_layouts():
             all_valid = False
 
+        self.save_validation_cache()
+        if self.verbose:
+            self.report_parse_stats()
+
         return all_valid
 
     def validate_uuid_ids(self):
@@ -69,7 +76,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
 
                 for elem in root.iter():
                     for attr, value in elem.attrib.items():
@@ -115,40 +122,38 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         for slide_master in slide_masters:
             try:
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                layout_entries = [
+                    entry
+                    for entry in self.get_id_entries(slide_master)
+                    if entry.tag == "sldlayoutid"
+                ]
 
-                rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
+                source = slide_master.relative_to(self.unpacked_dir).as_posix()
+                rels_part = rels_part_for(source)
 
-                if not rels_file.exists():
+                if not self.package.exists(rels_part):
                     errors.append(
                         f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        f"Missing relationships file: {Path(rels_part)}"
                     )
                     continue
 
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                valid_layout_rids = set()
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
-
-                for sld_layout_id in root.findall(
-                    f".//{{{self.PRESENTATIONML_NAMESPACE}}}sldLayoutId"
-                ):
-                    r_id = sld_layout_id.get(
-                        f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
-                    )
-                    layout_id = sld_layout_id.get("id")
+                error = self.package.rels_error(rels_part)
+                if error is not None:
+                    raise error
 
-                    if r_id and r_id not in valid_layout_rids:
+                valid_layout_rids = {
+                    rel.id
+                    for rel in self.package.rels_relationships(rels_part)
+                    if "slideLayout" in rel.type
+                }
+
+                for entry in layout_entries:
+                    if entry.rid and entry.rid not in valid_layout_rids:
                         errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
+                            f"  {entry.file}: "
+                            f"Line {entry.line}: sldLayoutId with id='{entry.value}' "
+                            f"references r:id='{entry.rid}' which is not found in slide layout relationships"
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
@@ -173,18 +178,14 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         import lxml.etree
 
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = self._slide_rels_files()
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
                 layout_rels = [
                     rel
-                    for rel in root.findall(
-                        f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                    )
-                    if "slideLayout" in rel.get("Type", "")
+                    for rel in self._slide_relationships(rels_file)
+                    if "slideLayout" in rel.type
                 ]
 
                 if len(layout_rels) > 1:
@@ -213,7 +214,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         errors = []
         notes_slide_references = {}  
 
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = self._slide_rels_files()
 
         if not slide_rels_files:
             if self.verbose:
@@ -222,14 +223,9 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
-                for rel in root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
+                for rel in self._slide_relationships(rels_file):
+                    if "notesSlide" in rel.type:
+                        target = rel.target
                         if target:
                             normalized_target = target.replace("../", "")
 
@@ -270,6 +266,21 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All notes slide references are unique")
             return True
 
+    def _slide_rels_files(self):
+        return [
+            f
+            for f in self.package.files
+            if f.name.endswith(".xml.rels")
+            and f.parent.relative_to(self.unpacked_dir).as_posix() == "ppt/slides/_rels"
+        ]
+
+    def _slide_relationships(self, rels_file):
+        rels_part = rels_file.relative_to(self.unpacked_dir).as_posix()
+        error = self.package.rels_error(rels_part)
+        if error is not None:
+            raise error
+        return self.package.rels_relationships(rels_part)
+
 
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
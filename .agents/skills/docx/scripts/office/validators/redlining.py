@@ -2,11 +2,15 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
 import zipfile
 from pathlib import Path
 
+import lxml.etree
+
+from helpers.simplify_redlines import revision_index
+
+from .text_diff import diff_paragraphs
+
 
 class RedliningValidator:
 
@@ -29,26 +33,7 @@ class RedliningValidator:
             return False
 
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            author_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == self.author
-            ]
-            author_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == self.author
-            ]
-
-            if not author_del_elements and not author_ins_elements:
+            if not revision_index(modified_file).count(self.author):
                 if self.verbose:
                     print(f"PASSED - No tracked changes by {self.author} found.")
                 return True
@@ -56,52 +41,40 @@ class RedliningValidator:
         except Exception:
             pass
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
+        try:
+            original_zip = zipfile.ZipFile(self.original_docx, "r")
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
 
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
+        with original_zip:
+            if "word/document.xml" not in original_zip.namelist():
+                print(f"FAILED - Original document.xml not found in {self.original_docx}")
                 return False
 
             try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
+                with original_zip.open("word/document.xml") as f:
+                    original_paragraphs = self._extract_paragraphs(f)
+                modified_paragraphs = self._extract_paragraphs(modified_file)
+            except lxml.etree.XMLSyntaxError as e:
                 print(f"FAILED - Error parsing XML files: {e}")
                 return False
-
-            self._remove_author_tracked_changes(original_root)
-            self._remove_author_tracked_changes(modified_root)
-
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
+            except zipfile.BadZipFile as e:
+                print(f"FAILED - Error unpacking original docx: {e}")
                 return False
 
-            if self.verbose:
-                print(f"PASSED - All changes by {self.author} are properly tracked")
-            return True
+        if modified_paragraphs != original_paragraphs:
+            error_message = self._generate_detailed_diff(
+                original_paragraphs, modified_paragraphs
+            )
+            print(error_message)
+            return False
+
+        if self.verbose:
+            print(f"PASSED - All changes by {self.author} are properly tracked")
+        return True
 
-    def _generate_detailed_diff(self, original_text, modified_text):
+    def _generate_detailed_diff(self, original_paragraphs, modified_paragraphs):
         error_parts = [
             f"FAILED - Document text doesn't match after removing {self.author}'s tracked changes",
             "",
@@ -116,131 +89,58 @@ class RedliningValidator:
             "",
         ]
 
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
-        else:
-            error_parts.append("Unable to generate word diff (git not available)")
+        diff_lines = diff_paragraphs(original_paragraphs, modified_paragraphs)
+        error_parts.extend(["Differences:", "============", *diff_lines])
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  
-                        "-U0",  
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            pass
-
-        return None
-
-    def _remove_author_tracked_changes(self, root):
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == self.author:
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == self.author:
-                    to_process.append((child, list(parent).index(child)))
-
-            for del_elem, del_index in reversed(to_process):
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
+    def _extract_paragraphs(self, source):
+        """Paragraph texts with the author's insertions dropped and deletions kept.
+
+        One walk over the tree: the author's w:ins subtrees are skipped and
+        w:delText inside the author's w:del counts as text, which is what
+        rejecting their changes would leave behind. Nothing is moved or
+        removed, so there are no sibling index lookups.
+        """
+        w = self.namespaces["w"]
+        p_tag = f"{{{w}}}p"
+        t_tag = f"{{{w}}}t"
+        ins_tag = f"{{{w}}}ins"
+        del_tag = f"{{{w}}}del"
+        deltext_tag = f"{{{w}}}delText"
+        author_attr = f"{{{w}}}author"
+
+        root = lxml.etree.parse(source).getroot()
         paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+        open_paragraphs = []
+        del_depth = 0
+
+        walker = lxml.etree.iterwalk(
+            root,
+            events=("start", "end"),
+            tag=(p_tag, t_tag, ins_tag, del_tag, deltext_tag),
+        )
+        for event, elem in walker:
+            tag = elem.tag
+
+            if tag == p_tag:
+                if event == "start":
+                    open_paragraphs.append((len(paragraphs), []))
+                    paragraphs.append("")
+                else:
+                    index, parts = open_paragraphs.pop()
+                    paragraphs[index] = "".join(parts)
+            elif tag == t_tag or (tag == deltext_tag and del_depth):
+                if event == "start" and elem.text:
+                    for _, parts in open_paragraphs:
+                        parts.append(elem.text)
+            elif elem.get(author_attr) == self.author:
+                if tag == ins_tag:
+                    walker.skip_subtree()
+                elif tag == del_tag:
+                    del_depth += 1 if event == "start" else -1
+
+        return [text for text in paragraphs if text]
 
 
 if __name__ == "__main__":
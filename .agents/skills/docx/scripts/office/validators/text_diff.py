@@ -0,0 +1,106 @@
+"""
+In-process word diff of document text, aligned on paragraphs.
+
+Paragraphs are matched first; only paragraphs that changed are diffed
+character by character. Output uses git's plain word-diff markers:
+[-removed-] and {+added+}.
+"""
+
+import difflib
+
+MAX_PARAGRAPHS = 50
+MAX_CHAR_DIFF = 4000
+CONTEXT_CHARS = 40
+
+
+def diff_paragraphs(
+    original: list[str],
+    modified: list[str],
+    max_paragraphs: int = MAX_PARAGRAPHS,
+    max_char_diff: int = MAX_CHAR_DIFF,
+) -> list[str]:
+    prefix = _common_prefix(original, modified)
+    suffix = _common_suffix(original[prefix:], modified[prefix:])
+    original = original[prefix : len(original) - suffix]
+    modified = modified[prefix : len(modified) - suffix]
+
+    lines = []
+    changed = 0
+    matcher = difflib.SequenceMatcher(None, original, modified, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+
+        old, new = original[i1:i2], modified[j1:j2]
+        for k in range(max(len(old), len(new))):
+            changed += 1
+            if len(lines) < max_paragraphs:
+                lines.append(
+                    _diff_line(
+                        old[k] if k < len(old) else None,
+                        new[k] if k < len(new) else None,
+                        max_char_diff,
+                    )
+                )
+
+    if changed > max_paragraphs:
+        lines.append(f"... {changed - max_paragraphs} more changed paragraph(s)")
+    return lines
+
+
+def _common_prefix(a, b) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix(a, b) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[-1 - i] == b[-1 - i]:
+        i += 1
+    return i
+
+
+def _diff_line(old: str | None, new: str | None, max_char_diff: int) -> str:
+    if old is None:
+        return f"{{+{new}+}}"
+    if new is None:
+        return f"[-{old}-]"
+
+    prefix = _common_prefix(old, new)
+    suffix = _common_suffix(old[prefix:], new[prefix:])
+    old_mid = old[prefix : len(old) - suffix]
+    new_mid = new[prefix : len(new) - suffix]
+
+    parts = [_context(old[:prefix], head=False)]
+    if len(old_mid) + len(new_mid) > max_char_diff:
+        parts.append(_change(_context(old_mid), _context(new_mid)))
+    else:
+        matcher = difflib.SequenceMatcher(None, old_mid, new_mid, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                parts.append(_context(old_mid[i1:i2]))
+            else:
+                parts.append(_change(old_mid[i1:i2], new_mid[j1:j2]))
+    parts.append(_context(old[len(old) - suffix :], tail=False))
+    return "".join(parts)
+
+
+def _change(removed: str, added: str) -> str:
+    parts = []
+    if removed:
+        parts.append(f"[-{removed}-]")
+    if added:
+        parts.append(f"{{+{added}+}}")
+    return "".join(parts)
+
+
+def _context(text: str, head: bool = True, tail: bool = True) -> str:
+    keep_head = CONTEXT_CHARS if head else 0
+    keep_tail = CONTEXT_CHARS if tail else 0
+    if len(text) <= keep_head + keep_tail + 3:
+        return text
+    return text[:keep_head] + "..." + text[len(text) - keep_tail :]
@@ -0,0 +1,193 @@
+"""Compare list-of-Finding analytics with the columnar FindingTable.
+
+The list path is the existing one: load_sarif, extract_findings, then the
+module-level count/group/filter/sort helpers. The table path streams the file
+into a FindingTable and runs the same operations on its columns, with NumPy
+if it is installed and with plain Python. Every operation must select the
+same findings in the same order.
+
+Usage:
+    python benchmark_findings.py [--input results.sarif] [--results 200000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import sarif_helpers as sh
+
+LEVELS = ("error", "warning", "note", "none")
+
+
+def generate_sarif(path: Path, results: int, rules: int = 200, files: int = 2000, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    driver = {
+        "name": "bench",
+        "rules": [{"id": f"R{i:04d}", "name": f"rule-{i}"} for i in range(rules)],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"version": "2.1.0", "runs": [{"tool": ')
+        json.dump({"driver": driver}, f)
+        f.write(', "results": [')
+        for n in range(results):
+            rule = rng.randrange(rules)
+            line = rng.randint(1, 5000)
+            result = {
+                "ruleId": f"R{rule:04d}",
+                "level": rng.choice(LEVELS),
+                "message": {"text": f"Finding for rule {rule} in function f{rng.randrange(50)}"},
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": f"src/pkg{rng.randrange(files) // 20}/mod{rng.randrange(files)}.py"},
+                            "region": {"startLine": line, "endLine": line + rng.randrange(5), "startColumn": rng.randint(1, 80)},
+                        }
+                    }
+                ],
+                "partialFingerprints": {"primaryLocationLineHash": f"{rng.getrandbits(64):016x}"},
+            }
+            if n:
+                f.write(",")
+            json.dump(result, f)
+        f.write("]}]}")
+
+
+def build_list(src: Path) -> list:
+    return sh.extract_findings(sh.load_sarif(src))
+
+
+def build_table(src: Path) -> sh.FindingTable:
+    return sh.FindingTable.from_file(src)
+
+
+def _measure_build(build, src: Path):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(src)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, retained, peak
+
+
+def list_operations(findings: list) -> dict:
+    return {
+        "count_by_level": lambda: sh.count_by_level(findings),
+        "count_by_rule": lambda: sh.count_by_rule(findings),
+        "group_by_rule": lambda: sh.group_by_rule(findings),
+        "group_by_file": lambda: sh.group_by_file(findings),
+        "filter_by_level": lambda: sh.filter_by_level(findings, "error", "warning"),
+        "sort_by_severity": lambda: sh.sort_by_severity(findings, reverse=True),
+    }
+
+
+def table_operations(table: sh.FindingTable) -> dict:
+    return {
+        "count_by_level": table.count_by_level,
+        "count_by_rule": table.count_by_rule,
+        "group_by_rule": table.group_by_rule,
+        "group_by_file": table.group_by_file,
+        "filter_by_level": lambda: table.filter_by_level("error", "warning"),
+        "sort_by_severity": lambda: table.sort_by_severity(reverse=True),
+    }
+
+
+def _as_rows(result, row_of: dict):
+    """Express a list-path result in row numbers so both paths compare."""
+    if isinstance(result, dict):
+        return {
+            key: [row_of[id(f)] for f in value] if isinstance(value, list) else value
+            for key, value in result.items()
+        }
+    return [row_of[id(f)] for f in result]
+
+
+def _normalise(result):
+    if isinstance(result, dict):
+        return {key: _normalise(value) for key, value in result.items()}
+    return [int(row) for row in result] if not isinstance(result, int) else result
+
+
+def _best_time(func, repeat: int):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_benchmark(src: Path, repeat: int) -> bool:
+    size_mb = src.stat().st_size / (1 << 20)
+    print(f"Input: {src} ({size_mb:.1f} MB)")
+
+    findings, list_build, list_memory, list_peak = _measure_build(build_list, src)
+    table, table_build, table_memory, table_peak = _measure_build(build_table, src)
+    print(f"  {len(findings)} findings")
+    print(f"  {'build':17s} {'list':>9s} {'table':>9s}")
+    print(f"  {'time':17s} {list_build:8.2f}s {table_build:8.2f}s")
+    print(f"  {'retained memory':17s} {list_memory / 1e6:7.1f}MB {table_memory / 1e6:7.1f}MB")
+    print(f"  {'peak memory':17s} {list_peak / 1e6:7.1f}MB {table_peak / 1e6:7.1f}MB")
+
+    modes = [False] + ([True] if sh.np is not None else [])
+    header = "".join(f"{'table+numpy' if mode else 'table':>18s}" for mode in modes)
+    print(f"\n  {'operation':17s} {'list':>9s}{header}")
+
+    row_of = {id(f): row for row, f in enumerate(findings)}
+    ok = True
+    for name, list_op in list_operations(findings).items():
+        list_time, list_result = _best_time(list_op, repeat)
+        expected = _as_rows(list_result, row_of)
+        cells = []
+        for mode in modes:
+            table.use_numpy = mode
+            table_time, table_result = _best_time(table_operations(table)[name], repeat)
+            if _normalise(table_result) != expected:
+                print(f"  MISMATCH: {name} (numpy={mode}) differs from the list path")
+                ok = False
+            cells.append(f"  {table_time:8.3f}s {list_time / table_time:5.1f}x")
+        print(f"  {name:17s} {list_time:8.3f}s" + "".join(cells))
+
+    sample = [0, len(table) // 2, len(table) - 1] if len(table) else []
+    materialised = list(table.findings(sample, raw=True))
+    if materialised != [findings[row] for row in sample]:
+        print("  MISMATCH: materialised findings differ from extract_findings")
+        ok = False
+    elif ok:
+        print("\n  All operations selected the same findings in the same order")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark FindingTable against lists of Finding objects"
+    )
+    parser.add_argument("--input", help="SARIF file to read (default: synthetic)")
+    parser.add_argument(
+        "--results",
+        type=int,
+        default=200000,
+        help="Results in the synthetic SARIF file (default: 200000)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per operation (default: 3)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.input:
+            src = Path(args.input)
+        else:
+            src = Path(temp_dir) / "results.sarif"
+            generate_sarif(src, args.results)
+        ok = run_benchmark(src, args.repeat)
+
+    sys.exit(0 if ok else 1)
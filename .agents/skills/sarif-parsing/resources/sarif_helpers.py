@@ -2,18 +2,29 @@
 SARIF Parsing Helper Functions
 
 Reusable utilities for working with SARIF files.
-No external dependencies beyond standard library.
+No external dependencies beyond standard library; FindingTable uses NumPy
+for its analytics when it is installed.
 """
 
+import functools
 import hashlib
 import json
-from collections import defaultdict
-from collections.abc import Iterator
+import os
+import re
+import sqlite3
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 from urllib.parse import unquote
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 @dataclass
 class Finding:
@@ -39,6 +50,190 @@ def load_sarif(path: str | Path) -> dict:
         return json.load(f)
 
 
+class _JsonStream:
+    """Pull reader for JSON documents too large to load at once.
+
+    Objects are walked with members() and arrays with items(); the caller
+    reads or skips each member/item value before advancing. Only the value
+    being decoded and the unread part of the current chunk are in memory.
+    """
+
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, f, chunk_size: int = 1 << 20):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        data = self._file.read(size)
+        self._buf = self._buf[self._pos :] + data
+        self._pos = 0
+        self._eof = not data
+        return bool(data)
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of input."""
+        while True:
+            self._pos = self._WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of {chars!r}", self._buf, self._pos
+            )
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill(size)
+            size *= 2
+
+    def skip(self) -> None:
+        """Consume a value, decoding arrays and objects one child at a time."""
+        char = self.peek()
+        if char == "[":
+            for _ in self.items():
+                self.value()
+        elif char == "{":
+            for _ in self.members():
+                self.value()
+        else:
+            self.value()
+
+    def members(self) -> Iterator[str]:
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self._buf, self._pos)
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
+
+    def items(self) -> Iterator[int]:
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self._expect(",]") == "]":
+                return
+
+
+class SarifRun(dict):
+    """A run's properties without its results; rules are indexed on first lookup."""
+
+    def __init__(self, *args, index: int | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.index = index
+        self._rules = None
+
+    def rule(self, rule_id: str) -> dict | None:
+        if self._rules is None:
+            self._rules = {
+                rule.get("id", ""): rule
+                for rule in safe_get(self, "tool", "driver", "rules", default=[])
+            }
+        return self._rules.get(rule_id)
+
+
+def iter_sarif_results(
+    path: str | Path, chunk_size: int = 1 << 20
+) -> Iterator[tuple[dict, SarifRun]]:
+    """Stream (result, run) pairs from a SARIF file with bounded memory.
+
+    Yields the same pairs as iter_results(load_sarif(path)), except that each
+    run is a SarifRun without its "results". A run that lists its results
+    before its tool has those results read a second time once the tool is known.
+    """
+    with open(path, encoding="utf-8") as f:
+        stream = _JsonStream(f, chunk_size)
+        for key in stream.members():
+            if key != "runs" or stream.peek() != "[":
+                stream.skip()
+                continue
+            for run_index in stream.items():
+                yield from _stream_run(stream, path, run_index, chunk_size)
+
+
+def _iter_positions(path, chunk_size: int = 1 << 20) -> Iterator[tuple[int, int, dict, SarifRun]]:
+    """Stream (run index, result index, result, run) from a SARIF file."""
+    last_run, index = None, 0
+    for result, run in iter_sarif_results(path, chunk_size):
+        # A run's results always arrive together, in order
+        index = index + 1 if run is last_run else 0
+        last_run = run
+        yield run.index, index, result, run
+
+
+def _stream_run(stream: _JsonStream, path, run_index: int, chunk_size: int):
+    run = SarifRun(index=run_index)
+    deferred = False
+    for key in stream.members():
+        if key != "results":
+            run[key] = stream.value()
+        elif stream.peek() != "[":
+            stream.value()
+        elif "tool" not in run:
+            deferred = True
+            stream.skip()
+        else:
+            for _ in stream.items():
+                yield stream.value(), run
+
+    if deferred:
+        for result in _reread_results(path, run_index, chunk_size):
+            yield result, run
+
+
+def _reread_results(path, run_index: int, chunk_size: int) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as f:
+        stream = _JsonStream(f, chunk_size)
+        for key in stream.members():
+            if key != "runs" or stream.peek() != "[":
+                stream.skip()
+                continue
+            for index in stream.items():
+                if index != run_index:
+                    stream.skip()
+                    continue
+                for run_key in stream.members():
+                    if run_key != "results" or stream.peek() != "[":
+                        stream.skip()
+                        continue
+                    for _ in stream.items():
+                        yield stream.value()
+                return
+
+
 def save_sarif(sarif: dict, path: str | Path, indent: int = 2) -> None:
     """Save SARIF data to file."""
     with open(path, "w") as f:
@@ -97,70 +292,86 @@ def extract_location(result: dict) -> tuple[str | None, int | None, int | None]:
 def iter_results(sarif: dict) -> Iterator[tuple[dict, dict]]:
     """Iterate over all results with their run context."""
     for run in sarif.get("runs", []):
-        for result in run.get("results", []):
+        for result in run.get("results") or []:
             yield result, run
 
 
+def _to_finding(result: dict, run: SarifRun) -> Finding:
+    tool_name = safe_get(run, "tool", "driver", "name")
+    file_path, start_line, end_line = extract_location(result)
+
+    loc = safe_get(result, "locations", 0, default={})
+    phys = loc.get("physicalLocation", {})
+    region = phys.get("region", {})
+
+    # Get fingerprint
+    fp = None
+    if result.get("partialFingerprints"):
+        fp = next(iter(result["partialFingerprints"].values()), None)
+    elif result.get("fingerprints"):
+        fp = next(iter(result["fingerprints"].values()), None)
+
+    rule_id = result.get("ruleId", "unknown")
+    rule = run.rule(rule_id)
+
+    return Finding(
+        rule_id=rule_id,
+        level=result.get("level", "warning"),
+        message=safe_get(result, "message", "text", default=""),
+        file_path=file_path,
+        start_line=start_line,
+        end_line=end_line,
+        start_column=region.get("startColumn"),
+        end_column=region.get("endColumn"),
+        fingerprint=fp,
+        tool_name=tool_name,
+        rule_name=rule.get("name") if rule else None,
+        raw=result,
+    )
+
+
 def extract_findings(sarif: dict) -> list[Finding]:
     """Extract all findings as structured objects."""
     findings = []
 
-    for result, run in iter_results(sarif):
-        tool_name = safe_get(run, "tool", "driver", "name")
-        file_path, start_line, end_line = extract_location(result)
-
-        loc = safe_get(result, "locations", 0, default={})
-        phys = loc.get("physicalLocation", {})
-        region = phys.get("region", {})
-
-        # Get fingerprint
-        fp = None
-        if result.get("partialFingerprints"):
-            fp = next(iter(result["partialFingerprints"].values()), None)
-        elif result.get("fingerprints"):
-            fp = next(iter(result["fingerprints"].values()), None)
-
-        findings.append(
-            Finding(
-                rule_id=result.get("ruleId", "unknown"),
-                level=result.get("level", "warning"),
-                message=safe_get(result, "message", "text", default=""),
-                file_path=file_path,
-                start_line=start_line,
-                end_line=end_line,
-                start_column=region.get("startColumn"),
-                end_column=region.get("endColumn"),
-                fingerprint=fp,
-                tool_name=tool_name,
-                raw=result,
-            )
-        )
+    for index, run in enumerate(sarif.get("runs", [])):
+        context = SarifRun(run, index=index)
+        for result in run.get("results") or []:
+            findings.append(_to_finding(result, context))
 
     return findings
 
 
-def filter_by_level(findings: list[Finding], *levels: str) -> list[Finding]:
+def stream_findings(path: str | Path, chunk_size: int = 1 << 20) -> Iterator[Finding]:
+    """Yield findings one at a time from a SARIF file of any size."""
+    for result, run in iter_sarif_results(path, chunk_size):
+        yield _to_finding(result, run)
+
+
+def filter_by_level(findings: Iterable[Finding], *levels: str) -> list[Finding]:
     """Filter findings by severity level(s)."""
     return [f for f in findings if f.level in levels]
 
 
-def filter_by_file(findings: list[Finding], pattern: str) -> list[Finding]:
+def filter_by_file(findings: Iterable[Finding], pattern: str) -> list[Finding]:
     """Filter findings by file path pattern (substring match)."""
     return [f for f in findings if f.file_path and pattern in f.file_path]
 
 
-def filter_by_rule(findings: list[Finding], *rule_ids: str) -> list[Finding]:
+def filter_by_rule(findings: Iterable[Finding], *rule_ids: str) -> list[Finding]:
     """Filter findings by rule ID(s)."""
     return [f for f in findings if f.rule_id in rule_ids]
 
 
+SEVERITY_ORDER = {"error": 0, "warning": 1, "note": 2, "none": 3}
+
+
 def sort_by_severity(findings: list[Finding], reverse: bool = False) -> list[Finding]:
     """Sort findings by severity (error > warning > note > none)."""
-    severity_order = {"error": 0, "warning": 1, "note": 2, "none": 3}
-    return sorted(findings, key=lambda f: severity_order.get(f.level, 99), reverse=reverse)
+    return sorted(findings, key=lambda f: SEVERITY_ORDER.get(f.level, 99), reverse=reverse)
 
 
-def group_by_file(findings: list[Finding]) -> dict[str, list[Finding]]:
+def group_by_file(findings: Iterable[Finding]) -> dict[str, list[Finding]]:
     """Group findings by file path."""
     grouped = defaultdict(list)
     for f in findings:
@@ -169,7 +380,7 @@ def group_by_file(findings: list[Finding]) -> dict[str, list[Finding]]:
     return dict(grouped)
 
 
-def group_by_rule(findings: list[Finding]) -> dict[str, list[Finding]]:
+def group_by_rule(findings: Iterable[Finding]) -> dict[str, list[Finding]]:
     """Group findings by rule ID."""
     grouped = defaultdict(list)
     for f in findings:
@@ -177,7 +388,7 @@ def group_by_rule(findings: list[Finding]) -> dict[str, list[Finding]]:
     return dict(grouped)
 
 
-def count_by_level(findings: list[Finding]) -> dict[str, int]:
+def count_by_level(findings: Iterable[Finding]) -> dict[str, int]:
     """Count findings by severity level."""
     counts = defaultdict(int)
     for f in findings:
@@ -185,7 +396,7 @@ def count_by_level(findings: list[Finding]) -> dict[str, int]:
     return dict(counts)
 
 
-def count_by_rule(findings: list[Finding]) -> dict[str, int]:
+def count_by_rule(findings: Iterable[Finding]) -> dict[str, int]:
     """Count findings by rule ID."""
     counts = defaultdict(int)
     for f in findings:
@@ -193,15 +404,133 @@ def count_by_rule(findings: list[Finding]) -> dict[str, int]:
     return dict(counts)
 
 
-def compute_fingerprint(result: dict, include_message: bool = True) -> str:
-    """Compute stable fingerprint from result data."""
+@functools.lru_cache(maxsize=1 << 16)
+def _file_name(file_path: str) -> str:
+    return Path(file_path).name
+
+
+FINGERPRINT_MODES = ("exact", "fuzzy")
+
+# Context window hashed for each line, in non-whitespace characters
+CONTEXT_WINDOW = 100
+
+_HASH_BASE = 37
+_HASH_MASK = (1 << 64) - 1
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+
+def _context_hashes(text: str) -> list[str]:
+    """One hash per line, of the CONTEXT_WINDOW non-whitespace characters from its start.
+
+    This is the scheme behind GitHub's primaryLocationLineHash: a polynomial
+    rolling hash over the text with whitespace removed, so edits elsewhere in
+    the file, blank lines and reindentation leave a line's hash unchanged.
+    Repeated hashes get an occurrence suffix (":1", ":2", ...) to keep
+    duplicated code distinct. Lines that are blank after stripping would
+    hash the same as the next non-blank line, so they get "" instead and do
+    not count as an occurrence.
+    """
+    starts = []
+    chars = []
+    for line in text.splitlines():
+        stripped = _WHITESPACE_RUN.sub("", line)
+        starts.append(len(chars) if stripped else None)
+        chars.extend(map(ord, stripped))
+
+    # hashes[p] = sum(chars[p + i] * BASE**i for i < CONTEXT_WINDOW), built from the end
+    drop = pow(_HASH_BASE, CONTEXT_WINDOW, 1 << 64)
+    hashes = [0] * (len(chars) + 1)
+    h = 0
+    for p in range(len(chars) - 1, -1, -1):
+        h = chars[p] + _HASH_BASE * h
+        if p + CONTEXT_WINDOW < len(chars):
+            h -= chars[p + CONTEXT_WINDOW] * drop
+        h &= _HASH_MASK
+        hashes[p] = h
+
+    seen = defaultdict(int)
+    line_hashes = []
+    for start in starts:
+        if start is None:
+            line_hashes.append("")
+            continue
+        h = hashes[start]
+        seen[h] += 1
+        line_hashes.append(f"{h:016x}:{seen[h]}")
+    return line_hashes
+
+
+class SourceCache:
+    """Per-line context hashes of source files, each file read once.
+
+    URIs are resolved with normalize_path() against root. Files that cannot be
+    read are remembered as missing, and their findings fall back to snippets.
+    """
+
+    def __init__(self, root: str | Path = "."):
+        self.root = str(root)
+        self._files: dict[str, list[str] | None] = {}
+
+    def line_hash(self, uri: str, line: int) -> str | None:
+        if uri not in self._files:
+            self._files[uri] = self._read(uri)
+        hashes = self._files[uri]
+        if hashes is None or type(line) is not int or not 1 <= line <= len(hashes):
+            return None
+        return hashes[line - 1]
+
+    def _read(self, uri: str) -> list[str] | None:
+        try:
+            text = Path(normalize_path(uri, self.root)).read_text(
+                encoding="utf-8", errors="replace"
+            )
+        except OSError:
+            return None
+        return _context_hashes(text)
+
+
+def _fuzzy_location(result: dict, file_path, start_line, sources: SourceCache | None):
+    if sources is not None and file_path and start_line:
+        line_hash = sources.line_hash(file_path, start_line)
+        if line_hash:
+            return line_hash
+
+    region = safe_get(result, "locations", 0, "physicalLocation", default={})
+    for key in ("region", "contextRegion"):
+        snippet = safe_get(region, key, "snippet", "text")
+        if isinstance(snippet, str) and snippet.strip():
+            return next(h for h in _context_hashes(snippet) if h)
+
+    return str(start_line) if start_line else None
+
+
+def compute_fingerprint(
+    result: dict,
+    include_message: bool = True,
+    mode: str = "exact",
+    sources: SourceCache | None = None,
+) -> str:
+    """Compute stable fingerprint from result data.
+
+    mode="exact" keys on the start line. mode="fuzzy" keys on a hash of the
+    code at the location instead, so findings keep their fingerprint when
+    the code around them moves: the source line's context hash when sources
+    can read the file, else the result's snippet, else the start line.
+    """
+    if mode not in FINGERPRINT_MODES:
+        raise ValueError(f"Unknown fingerprint mode: {mode!r}")
+
     components = [result.get("ruleId", "")]
 
     file_path, start_line, _ = extract_location(result)
     if file_path:
         # Use only filename, not full path (more stable across environments)
-        components.append(Path(file_path).name)
-    if start_line:
+        components.append(_file_name(file_path))
+    if mode == "fuzzy":
+        location = _fuzzy_location(result, file_path, start_line, sources)
+        if location:
+            components.append(location)
+    elif start_line:
         components.append(str(start_line))
     if include_message:
         msg = safe_get(result, "message", "text", default="")
@@ -211,13 +540,22 @@ def compute_fingerprint(result: dict, include_message: bool = True) -> str:
     return hashlib.sha256("|".join(components).encode()).hexdigest()[:16]
 
 
-def deduplicate(findings: list[Finding]) -> list[Finding]:
-    """Remove duplicate findings based on fingerprints."""
+def _finding_key(f: Finding, mode: str = "exact", sources: SourceCache | None = None) -> str:
+    # Tool fingerprints are usually line-based, so fuzzy mode always computes its own
+    if mode == "exact":
+        return f.fingerprint or compute_fingerprint(f.raw)
+    return compute_fingerprint(f.raw, mode=mode, sources=sources)
+
+
+def deduplicate(
+    findings: Iterable[Finding], mode: str = "exact", sources: SourceCache | None = None
+) -> list[Finding]:
+    """Remove duplicate findings based on fingerprints (see compute_fingerprint for mode)."""
     seen = set()
     unique = []
 
     for f in findings:
-        key = f.fingerprint or compute_fingerprint(f.raw)
+        key = _finding_key(f, mode, sources)
         if key not in seen:
             seen.add(key)
             unique.append(f)
@@ -241,30 +579,206 @@ def merge_sarif_files(*paths: str | Path) -> dict:
 
 
 def diff_findings(
-    baseline: list[Finding], current: list[Finding]
+    baseline: "Iterable[Finding] | BaselineIndex",
+    current: Iterable[Finding],
+    mode: str | None = None,
+    sources: SourceCache | None = None,
+    baseline_sources: SourceCache | None = None,
 ) -> tuple[list[Finding], list[Finding], list[Finding]]:
     """
     Compare two sets of findings.
 
+    mode is "exact" (the default) or "fuzzy", as for compute_fingerprint.
+    Fuzzy fingerprints read current findings' files through sources and
+    baseline findings' files through baseline_sources, which defaults to
+    sources; point them at the two checkouts when both are available.
+
+    The baseline may be a BaselineIndex, in which case current is streamed
+    against it and the baseline SARIF is never loaded. The index's own mode
+    applies, and baseline_sources is not used.
+
     Returns:
         - new: findings in current but not baseline
         - fixed: findings in baseline but not current
         - unchanged: findings in both
     """
-    baseline_fps = {f.fingerprint or compute_fingerprint(f.raw) for f in baseline}
-    current_fps = {f.fingerprint or compute_fingerprint(f.raw) for f in current}
-
-    new = [f for f in current if (f.fingerprint or compute_fingerprint(f.raw)) not in baseline_fps]
-    fixed = [
-        f for f in baseline if (f.fingerprint or compute_fingerprint(f.raw)) not in current_fps
-    ]
-    unchanged = [
-        f for f in current if (f.fingerprint or compute_fingerprint(f.raw)) in baseline_fps
-    ]
+    if isinstance(baseline, BaselineIndex):
+        if mode is not None and mode != baseline.mode:
+            raise ValueError(f"Baseline index uses {baseline.mode!r} fingerprints, not {mode!r}")
+        return baseline.diff(current, sources)
+
+    mode = mode or "exact"
+    if baseline_sources is None:
+        baseline_sources = sources
+    baseline = [(f, _finding_key(f, mode, baseline_sources)) for f in baseline]
+    current = [(f, _finding_key(f, mode, sources)) for f in current]
+    baseline_fps = {key for _, key in baseline}
+    current_fps = {key for _, key in current}
+
+    new = [f for f, key in current if key not in baseline_fps]
+    fixed = [f for f, key in baseline if key not in current_fps]
+    unchanged = [f for f, key in current if key in baseline_fps]
 
     return new, fixed, unchanged
 
 
+class BaselineIndex:
+    """Fingerprints of a baseline scan, persisted in SQLite for diffing later scans.
+
+    Build it once per main-branch scan, then diff each PR scan against it:
+    every current finding costs one indexed lookup, and fixed findings come
+    back from a single query, so neither side is held in memory as SARIF.
+
+        BaselineIndex.build("main.idx", stream_findings("main.sarif"))
+        with BaselineIndex("main.idx") as index:
+            new, fixed, unchanged = index.diff(stream_findings("pr.sarif"))
+
+    The fingerprint mode is chosen at build time and used for every diff.
+    Findings read back from the index (the fixed ones) have an empty raw.
+    """
+
+    FORMAT = 2
+
+    _COLUMNS = (
+        "rule_id",
+        "level",
+        "message",
+        "file_path",
+        "start_line",
+        "end_line",
+        "start_column",
+        "end_column",
+        "fingerprint",
+        "tool_name",
+        "rule_name",
+    )
+    _BATCH = 500
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Baseline index not found: {self.path}")
+        self._db = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        except sqlite3.DatabaseError:
+            version = None
+        if version != self.FORMAT:
+            self._db.close()
+            raise ValueError(f"Not a format {self.FORMAT} baseline index: {self.path}")
+        self.mode = self._db.execute("SELECT value FROM meta WHERE key = 'mode'").fetchone()[0]
+
+    @classmethod
+    def build(
+        cls,
+        path: str | Path,
+        findings: Iterable[Finding],
+        mode: str = "exact",
+        sources: SourceCache | None = None,
+    ) -> "BaselineIndex":
+        """Write the findings' fingerprints to path, replacing any previous index."""
+        if mode not in FINGERPRINT_MODES:
+            raise ValueError(f"Unknown fingerprint mode: {mode!r}")
+        path = Path(path)
+        temp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+        temp_path.unlink(missing_ok=True)
+        columns = ", ".join(cls._COLUMNS)
+        placeholders = ", ".join("?" * (len(cls._COLUMNS) + 1))
+        try:
+            db = sqlite3.connect(temp_path)
+            try:
+                db.execute(f"PRAGMA user_version = {cls.FORMAT}")
+                db.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                db.execute("INSERT INTO meta VALUES ('mode', ?)", (mode,))
+                db.execute(f"CREATE TABLE findings (key TEXT NOT NULL, {columns})")
+                db.executemany(
+                    f"INSERT INTO findings VALUES ({placeholders})",
+                    (
+                        (
+                            _finding_key(f, mode, sources),
+                            *(getattr(f, name) for name in cls._COLUMNS),
+                        )
+                        for f in findings
+                    ),
+                )
+                db.execute("CREATE INDEX findings_by_key ON findings (key)")
+                db.commit()
+            finally:
+                db.close()
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return cls(path)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "BaselineIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
+
+    def __contains__(self, fingerprint: str) -> bool:
+        row = self._db.execute(
+            "SELECT 1 FROM findings WHERE key = ? LIMIT 1", (fingerprint,)
+        ).fetchone()
+        return row is not None
+
+    def _known(self, keys: set[str]) -> set[str]:
+        placeholders = ", ".join("?" * len(keys))
+        rows = self._db.execute(
+            f"SELECT DISTINCT key FROM findings WHERE key IN ({placeholders})", tuple(keys)
+        )
+        return {key for (key,) in rows}
+
+    def diff(
+        self, current: Iterable[Finding], sources: SourceCache | None = None
+    ) -> tuple[list[Finding], list[Finding], list[Finding]]:
+        """(new, fixed, unchanged) for current, as diff_findings() returns them.
+
+        sources is the checkout current points into, for a fuzzy index.
+        """
+        new, unchanged = [], []
+        matched = set()
+        batch = []
+
+        def classify():
+            known = self._known({key for _, key in batch})
+            matched.update(known)
+            for f, key in batch:
+                (unchanged if key in known else new).append(f)
+            batch.clear()
+
+        for f in current:
+            batch.append((f, _finding_key(f, self.mode, sources)))
+            if len(batch) == self._BATCH:
+                classify()
+        if batch:
+            classify()
+
+        return new, self._fixed(matched), unchanged
+
+    def _fixed(self, matched: set[str]) -> list[Finding]:
+        """Baseline findings whose fingerprint was not seen, in build order."""
+        db = self._db
+        columns = ", ".join(self._COLUMNS)
+        try:
+            db.execute("CREATE TEMP TABLE IF NOT EXISTS matched (key TEXT PRIMARY KEY)")
+            db.executemany("INSERT INTO matched VALUES (?)", ((key,) for key in matched))
+            rows = db.execute(
+                f"SELECT {columns} FROM findings"
+                " WHERE key NOT IN (SELECT key FROM matched) ORDER BY rowid"
+            )
+            return [Finding(**dict(zip(self._COLUMNS, row))) for row in rows]
+        finally:
+            db.rollback()
+
+
 def get_rules(sarif: dict) -> dict[str, dict]:
     """Extract rule definitions from SARIF file."""
     rules = {}
@@ -274,33 +788,295 @@ def get_rules(sarif: dict) -> dict[str, dict]:
     return rules
 
 
-def to_csv_rows(findings: list[Finding]) -> list[list[str]]:
-    """Convert findings to CSV-ready rows."""
-    rows = [["rule_id", "level", "file", "line", "message"]]
+def iter_csv_rows(findings: Iterable[Finding]) -> Iterator[list[str]]:
+    """Yield a header row, then one CSV-ready row per finding."""
+    yield ["rule_id", "level", "file", "line", "message"]
     for f in findings:
-        rows.append(
-            [
-                f.rule_id,
-                f.level,
-                f.file_path or "",
-                str(f.start_line or ""),
-                f.message.replace("\n", " ")[:200],
-            ]
-        )
-    return rows
+        yield [
+            f.rule_id,
+            f.level,
+            f.file_path or "",
+            str(f.start_line or ""),
+            f.message.replace("\n", " ")[:200],
+        ]
+
+
+def to_csv_rows(findings: Iterable[Finding]) -> list[list[str]]:
+    """Convert findings to CSV-ready rows."""
+    return list(iter_csv_rows(findings))
+
 
+def summary(findings: Iterable[Finding]) -> dict:
+    """Generate summary statistics for findings in a single pass."""
+    total = 0
+    by_level = defaultdict(int)
+    by_rule = defaultdict(int)
+    files = set()
+    for f in findings:
+        total += 1
+        by_level[f.level] += 1
+        by_rule[f.rule_id] += 1
+        if f.file_path:
+            files.add(f.file_path)
 
-def summary(findings: list[Finding]) -> dict:
-    """Generate summary statistics for findings."""
     return {
-        "total": len(findings),
-        "by_level": count_by_level(findings),
-        "by_rule": count_by_rule(findings),
-        "files_affected": len(set(f.file_path for f in findings if f.file_path)),
-        "rules_triggered": len(set(f.rule_id for f in findings)),
+        "total": total,
+        "by_level": dict(by_level),
+        "by_rule": dict(by_rule),
+        "files_affected": len(files),
+        "rules_triggered": len(by_rule),
     }
 
 
+class _InternedColumn:
+    """Each distinct value stored once, with an array.array code per row."""
+
+    __slots__ = ("codes", "values", "_code_of")
+
+    def __init__(self):
+        self.codes = array("I")
+        self.values = []
+        self._code_of = {}
+
+    def append(self, value) -> None:
+        code = self._code_of.get(value)
+        if code is None:
+            code = self._code_of[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def code(self, value) -> int | None:
+        return self._code_of.get(value)
+
+    def __getitem__(self, row: int):
+        return self.values[self.codes[row]]
+
+
+class _IntColumn:
+    """Non-negative ints in an array.array; None and anything else kept aside."""
+
+    __slots__ = ("values", "other")
+
+    def __init__(self):
+        self.values = array("q")
+        self.other = {}
+
+    def append(self, value) -> None:
+        if type(value) is int and 0 <= value < 1 << 63:
+            self.values.append(value)
+            return
+        if value is not None:
+            self.other[len(self.values)] = value
+        self.values.append(-1)
+
+    def __getitem__(self, row: int):
+        value = self.values[row]
+        return value if value >= 0 else self.other.get(row)
+
+
+class FindingTable:
+    """Findings stored column by column, for analytics over millions of results.
+
+    Rule IDs, levels, messages, paths, tool and rule names are interned, so a
+    row costs a few array codes instead of a Finding, its __dict__ and its raw
+    result. Counts come back as dicts like count_by_level(); filters, groups
+    and sorts return row numbers (NumPy arrays when NumPy is installed, lists
+    otherwise). Finding objects are built only for the rows asked for, and raw
+    results are looked up in the source SARIF dict, or read again from the
+    file for tables built with from_file().
+    """
+
+    _INTERNED = ("rule_id", "level", "message", "file_path", "tool_name", "rule_name")
+    _INTS = ("start_line", "end_line", "start_column", "end_column")
+
+    def __init__(self, use_numpy: bool | None = None):
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True requires numpy")
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        self._columns = {name: _InternedColumn() for name in self._INTERNED}
+        self._columns.update((name, _IntColumn()) for name in self._INTS)
+        self._appends = [
+            (name, self._columns[name].append) for name in self._INTERNED + self._INTS
+        ]
+        self._fingerprints = []
+        self._runs = array("I")
+        self._indexes = array("I")
+        self._source = None
+
+    @classmethod
+    def from_sarif(cls, sarif: dict, use_numpy: bool | None = None) -> "FindingTable":
+        table = cls(use_numpy)
+        table._source = sarif
+        for run_index, run in enumerate(sarif.get("runs", [])):
+            context = SarifRun(run, index=run_index)
+            for index, result in enumerate(run.get("results") or []):
+                table._append(_to_finding(result, context), run_index, index)
+        return table
+
+    @classmethod
+    def from_file(
+        cls, path: str | Path, use_numpy: bool | None = None, chunk_size: int = 1 << 20
+    ) -> "FindingTable":
+        """Build a table by streaming the file; no result is kept in memory."""
+        table = cls(use_numpy)
+        table._source = Path(path)
+        for run_index, index, result, run in _iter_positions(path, chunk_size):
+            table._append(_to_finding(result, run), run_index, index)
+        return table
+
+    def _append(self, finding: Finding, run_index: int, index: int) -> None:
+        for name, append in self._appends:
+            append(getattr(finding, name))
+        self._fingerprints.append(finding.fingerprint)
+        self._runs.append(run_index)
+        self._indexes.append(index)
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def __iter__(self) -> Iterator[Finding]:
+        return self.findings()
+
+    def __getitem__(self, row: int) -> Finding:
+        return self.finding(row)
+
+    # ── Materialising rows ────────────────────────────────────────────────
+
+    def _row(self, row) -> int:
+        row = int(row)
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("FindingTable row out of range")
+        return row
+
+    def finding(self, row: int, raw: bool = False) -> Finding:
+        return next(self.findings([row], raw=raw))
+
+    def findings(self, rows: Iterable[int] | None = None, raw: bool = False) -> Iterator[Finding]:
+        """Build a Finding for each row (all rows by default), in the order given.
+
+        raw=False leaves Finding.raw empty; raw=True looks the results up
+        with a single raw() call.
+        """
+        rows = range(len(self)) if rows is None else [self._row(row) for row in rows]
+        raws = self.raw(rows) if raw else None
+        columns = self._columns
+        for i, row in enumerate(rows):
+            yield Finding(
+                **{name: columns[name][row] for name in self._INTERNED + self._INTS},
+                fingerprint=self._fingerprints[row],
+                raw=raws[i] if raws is not None else {},
+            )
+
+    def raw(self, rows: Iterable[int]) -> list[dict]:
+        """The SARIF result dict of each row, in the order given.
+
+        A table built with from_file() reads the file again on every call, so
+        ask for all the rows needed at once.
+        """
+        positions = [(self._runs[row], self._indexes[row]) for row in map(self._row, rows)]
+        if not isinstance(self._source, Path):
+            runs = self._source["runs"]
+            return [runs[run]["results"][index] for run, index in positions]
+
+        wanted = set(positions)
+        found = {}
+        if wanted:
+            for run_index, index, result, _ in _iter_positions(self._source):
+                if (run_index, index) in wanted:
+                    found[run_index, index] = result
+                    if len(found) == len(wanted):
+                        break
+        return [found[position] for position in positions]
+
+    # ── Analytics ─────────────────────────────────────────────────────────
+
+    def _codes(self, name: str):
+        codes = self._columns[name].codes
+        if self.use_numpy:
+            return np.frombuffer(codes, dtype=f"u{codes.itemsize}")
+        return codes
+
+    def _count(self, name: str) -> dict:
+        column = self._columns[name]
+        if self.use_numpy:
+            counts = np.bincount(self._codes(name), minlength=len(column.values)).tolist()
+        else:
+            counter = Counter(column.codes)
+            counts = [counter[code] for code in range(len(column.values))]
+        return dict(zip(column.values, counts))
+
+    def _group(self, name: str, key=None) -> dict:
+        column = self._columns[name]
+        if self.use_numpy:
+            codes = self._codes(name)
+            order = np.argsort(codes, kind="stable")
+            bounds = np.cumsum(np.bincount(codes, minlength=len(column.values)))[:-1]
+            groups = np.split(order, bounds)
+        else:
+            groups = [[] for _ in column.values]
+            for row, code in enumerate(column.codes):
+                groups[code].append(row)
+
+        grouped = {}
+        for value, rows in zip(column.values, groups):
+            value = key(value) if key else value
+            if value not in grouped:
+                grouped[value] = rows
+            elif self.use_numpy:
+                grouped[value] = np.sort(np.concatenate([grouped[value], rows]))
+            else:
+                grouped[value] = sorted(grouped[value] + rows)
+        return grouped
+
+    def _filter(self, name: str, values) -> Any:
+        column = self._columns[name]
+        wanted = [code for code in map(column.code, values) if code is not None]
+        if self.use_numpy:
+            return np.flatnonzero(np.isin(self._codes(name), wanted))
+        wanted = set(wanted)
+        return [row for row, code in enumerate(column.codes) if code in wanted]
+
+    def count_by_level(self) -> dict[str, int]:
+        return self._count("level")
+
+    def count_by_rule(self) -> dict[str, int]:
+        return self._count("rule_id")
+
+    def group_by_file(self) -> dict:
+        """Row numbers per file path, with findings without a path under "unknown"."""
+        return self._group("file_path", key=lambda path: path or "unknown")
+
+    def group_by_rule(self) -> dict:
+        return self._group("rule_id")
+
+    def filter_by_level(self, *levels: str):
+        return self._filter("level", levels)
+
+    def filter_by_rule(self, *rule_ids: str):
+        return self._filter("rule_id", rule_ids)
+
+    def sort_by_severity(self, reverse: bool = False):
+        """Row numbers in the order sort_by_severity() would put the findings."""
+        ranks = [SEVERITY_ORDER.get(level, 99) for level in self._columns["level"].values]
+        if self.use_numpy:
+            keys = np.asarray(ranks, dtype=np.int64)[self._codes("level")]
+            return np.argsort(-keys if reverse else keys, kind="stable")
+        keys = [ranks[code] for code in self._columns["level"].codes]
+        return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+
+    def summary(self) -> dict:
+        by_rule = self.count_by_rule()
+        return {
+            "total": len(self),
+            "by_level": self.count_by_level(),
+            "by_rule": by_rule,
+            "files_affected": sum(1 for path in self._columns["file_path"].values if path),
+            "rules_triggered": len(by_rule),
+        }
+
+
 # Example usage
 if __name__ == "__main__":
     import sys
@@ -12,18 +12,29 @@ OUTPUT_FILE (e.g., $OUTPUT_DIR/results/results.sarif) containing all
 findings merged and deduplicated.
 
 Attempts to use SARIF Multitool for merging if available, falls back to
-pure Python implementation.
+pure Python implementation. The fallback parses files on a process pool and
+writes results to OUTPUT_FILE as it goes, so it never holds the merged SARIF
+in memory.
 """
 
 from __future__ import annotations
 
+import itertools
 import json
+import os
 import shutil
 import subprocess
 import sys
 import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# Results sit at runs[0].results[i]: four levels deep at indent=2
+RESULT_INDENT = " " * 8
+
 
 def has_sarif_multitool() -> bool:
     """Check if SARIF Multitool is pre-installed via npx."""
@@ -87,60 +98,135 @@ def merge_with_multitool(sarif_files: list[Path]) -> dict | None:
         tmp_path.unlink(missing_ok=True)
 
 
-def merge_sarif_pure_python(sarif_files: list[Path]) -> dict:
-    """Pure Python SARIF merge (fallback)."""
-    merged = {
-        "version": "2.1.0",
-        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
-        "runs": [],
-    }
+def _parse_shard(sarif_file: Path) -> dict:
+    """Parse one SARIF file into what the merge needs from each run.
+
+    Runs in a worker process. Results come back already serialized at their
+    final indentation, with their dedup keys, so the parent only compares
+    keys and copies text.
+    """
+    try:
+        data = json.loads(sarif_file.read_text())
+    except json.JSONDecodeError as e:
+        return {"file": str(sarif_file), "error": str(e), "runs": []}
+
+    runs = []
+    for run in data.get("runs", []):
+        tool = run.get("tool")
+        driver = (tool or {}).get("driver", {})
+        if "rules" in driver:
+            # The merged tool gets the rule union; keep only the key's position
+            tool = {**tool, "driver": {**driver, "rules": []}}
+
+        results = []
+        for result in run.get("results", []):
+            rule_id = result.get("ruleId", "")
+            uri = ""
+            start_line = 0
+            locations = result.get("locations", [])
+            if locations:
+                phys = locations[0].get("physicalLocation", {})
+                uri = phys.get("artifactLocation", {}).get("uri", "")
+                start_line = phys.get("region", {}).get("startLine", 0)
+            text = json.dumps(result, indent=2).replace("\n", "\n" + RESULT_INDENT)
+            results.append(((rule_id, uri, start_line), text))
+
+        runs.append(
+            {"tool": tool, "rules": driver.get("rules", []), "results": results}
+        )
+
+    return {"file": str(sarif_file), "error": None, "runs": runs}
+
+
+def _parsed_shards(sarif_files: list[Path], jobs: int):
+    """Yield _parse_shard() for each file, in order, keeping a bounded backlog."""
+    if jobs <= 1 or len(sarif_files) < 2:
+        yield from map(_parse_shard, sarif_files)
+        return
+
+    files = iter(sarif_files)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque(
+            executor.submit(_parse_shard, f) for f in itertools.islice(files, jobs * 4)
+        )
+        while pending:
+            shard = pending.popleft().result()
+            next_file = next(files, None)
+            if next_file is not None:
+                pending.append(executor.submit(_parse_shard, next_file))
+            yield shard
+
+
+def merge_sarif_pure_python(
+    sarif_files: list[Path], output_file: Path, jobs: int | None = None
+) -> int:
+    """Pure Python SARIF merge (fallback). Writes output_file, returns the result count.
+
+    Files are merged in sorted order: the first run with a tool supplies the
+    tool, the first definition of each rule ID wins, and a result is dropped
+    if an earlier one had the same (rule_id, uri, start_line). Output is the
+    same as json.dumps(merged, indent=2).
+    """
+    jobs = jobs or os.cpu_count() or 1
+    sarif_files = sorted(sarif_files)
 
     seen_rules: dict[str, dict] = {}
-    all_results: list[dict] = []
     seen_results: set[tuple[str, str, int]] = set()
     tool_info: dict | None = None
     skipped_files: list[str] = []
-
-    for sarif_file in sorted(sarif_files):
-        try:
-            data = json.loads(sarif_file.read_text())
-        except json.JSONDecodeError as e:
-            print(f"Warning: Failed to parse {sarif_file}: {e}", file=sys.stderr)
-            skipped_files.append(str(sarif_file))
-            continue
-
-        for run in data.get("runs", []):
-            if tool_info is None and run.get("tool"):
-                tool_info = run["tool"]
-
-            driver = run.get("tool", {}).get("driver", {})
-            for rule in driver.get("rules", []):
-                rule_id = rule.get("id", "")
-                if rule_id and rule_id not in seen_rules:
-                    seen_rules[rule_id] = rule
-
-            for result in run.get("results", []):
-                rule_id = result.get("ruleId", "")
-                uri = ""
-                start_line = 0
-                locations = result.get("locations", [])
-                if locations:
-                    phys = locations[0].get("physicalLocation", {})
-                    uri = phys.get("artifactLocation", {}).get("uri", "")
-                    start_line = phys.get("region", {}).get("startLine", 0)
-                dedup_key = (rule_id, uri, start_line)
-                if dedup_key in seen_results:
-                    continue
-                seen_results.add(dedup_key)
-                all_results.append(result)
-
-    if all_results:
-        merged_run = {
-            "tool": tool_info or {"driver": {"name": "semgrep", "rules": []}},
-            "results": all_results,
-        }
-        merged_run["tool"]["driver"]["rules"] = list(seen_rules.values())
-        merged["runs"].append(merged_run)
+    result_count = 0
+
+    with tempfile.TemporaryFile("w+", dir=output_file.parent) as results_file:
+        for shard in _parsed_shards(sarif_files, jobs):
+            if shard["error"] is not None:
+                print(
+                    f"Warning: Failed to parse {shard['file']}: {shard['error']}",
+                    file=sys.stderr,
+                )
+                skipped_files.append(shard["file"])
+                continue
+
+            for run in shard["runs"]:
+                if tool_info is None and run["tool"]:
+                    tool_info = run["tool"]
+
+                for rule in run["rules"]:
+                    rule_id = rule.get("id", "")
+                    if rule_id and rule_id not in seen_rules:
+                        seen_rules[rule_id] = rule
+
+                for dedup_key, text in run["results"]:
+                    if dedup_key in seen_results:
+                        continue
+                    seen_results.add(dedup_key)
+                    if result_count:
+                        results_file.write(",\n")
+                    results_file.write(RESULT_INDENT + text)
+                    result_count += 1
+
+        merged = {"version": "2.1.0", "$schema": SARIF_SCHEMA, "runs": []}
+        placeholder = None
+        if result_count:
+            # Stand-in for the results, swapped for the spooled file on write
+            placeholder = "__merged_results__"
+            merged_run = {
+                "tool": tool_info or {"driver": {"name": "semgrep", "rules": []}},
+                "results": [placeholder],
+            }
+            merged_run["tool"]["driver"]["rules"] = list(seen_rules.values())
+            merged["runs"].append(merged_run)
+
+        text = json.dumps(merged, indent=2)
+        with open(output_file, "w") as out:
+            if placeholder is None:
+                out.write(text)
+            else:
+                # Results are the last thing in the document, so search from the end
+                head, tail = text.rsplit(RESULT_INDENT + json.dumps(placeholder), 1)
+                out.write(head)
+                results_file.seek(0)
+                shutil.copyfileobj(results_file, out)
+                out.write(tail)
 
     if skipped_files:
         print(
@@ -151,7 +237,7 @@ def merge_sarif_pure_python(sarif_files: list[Path]) -> dict:
         for sf in skipped_files:
             print(f"  Skipped: {sf}", file=sys.stderr)
 
-    return merged
+    return result_count
 
 
 def main() -> int:
@@ -187,13 +273,12 @@ def main() -> int:
 
     if merged is None:
         print("Using pure Python merge (SARIF Multitool not available or failed)")
-        merged = merge_sarif_pure_python(sarif_files)
+        result_count = merge_sarif_pure_python(sarif_files, output_file)
+    else:
+        result_count = sum(len(run.get("results", [])) for run in merged.get("runs", []))
+        output_file.write_text(json.dumps(merged, indent=2))
 
-    result_count = sum(len(run.get("results", [])) for run in merged.get("runs", []))
     print(f"Merged SARIF contains {result_count} findings")
-
-    # Write output
-    output_file.write_text(json.dumps(merged, indent=2))
     print(f"Written to {output_file}")
 
     return 0
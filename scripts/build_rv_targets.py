@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 """Build 50 RV-Targets for ursprung Remote Viewing trainer."""
-import json, os
+import argparse, os
 
-def sql_str(s):
-    if s is None: return 'NULL'
-    return "'" + str(s).replace("'", "''") + "'"
-def sql_array(items):
-    if not items: return "ARRAY[]::TEXT[]"
-    return "ARRAY[" + ",".join(sql_str(x) for x in items) + "]::TEXT[]"
+from seed_emitter import (
+    INTEGER, TEXT, TEXT_ARRAY, SeedManifest, SeedTable, add_emitter_arguments,
+    check_deletes, commit_manifest, emit, manifest_path,
+)
+
+parser = argparse.ArgumentParser(description="Build RV target seed SQL")
+add_emitter_arguments(parser)
+args = parser.parse_args()
 
 # (code, name, category, description, image_url, coords, difficulty, key_features)
 TARGETS = [
@@ -65,27 +67,32 @@ TARGETS = [
 
 assert len(TARGETS) == 50, f"Expected 50 targets, got {len(TARGETS)}"
 
-rows = []
-for code,name,cat,desc,img,coords,diff,feats in TARGETS:
-    row = "(" + ",".join([
-        sql_str(code), sql_str(name), sql_str(cat), sql_str(desc),
-        sql_str(img), sql_str(coords), str(diff), sql_array(feats)
-    ]) + ")"
-    rows.append(row)
-
-sql = (
-    "INSERT INTO public.rv_targets "
-    "(target_code, target_name, category, description, image_url, coordinates, difficulty, key_features) "
-    "VALUES\n" + ",\n".join(rows) +
-    "\nON CONFLICT (target_code) DO UPDATE SET "
-    "target_name=EXCLUDED.target_name, category=EXCLUDED.category, "
-    "description=EXCLUDED.description, image_url=EXCLUDED.image_url, "
-    "coordinates=EXCLUDED.coordinates, difficulty=EXCLUDED.difficulty, "
-    "key_features=EXCLUDED.key_features;"
+RV_TARGETS_TABLE = SeedTable(
+    "public.rv_targets",
+    [("target_code", TEXT), ("target_name", TEXT), ("category", TEXT),
+     ("description", TEXT), ("image_url", TEXT), ("coordinates", TEXT),
+     ("difficulty", INTEGER), ("key_features", TEXT_ARRAY)],
+    conflict_key="target_code",
+    cascades=("public.rv_sessions",),
 )
 
-os.makedirs("/tmp/ursprung_branches", exist_ok=True)
-out = "/tmp/ursprung_branches/rv_targets.json"
-with open(out, "w", encoding="utf-8") as f:
-    json.dump({"query": sql}, f, ensure_ascii=False)
-print(f"Wrote {out} ({os.path.getsize(out)} bytes) — {len(TARGETS)} targets")
+manifest = SeedManifest(manifest_path(args, RV_TARGETS_TABLE), RV_TARGETS_TABLE)
+if args.commit_manifest:
+    raise SystemExit(commit_manifest(manifest))
+
+delta = manifest.diff(TARGETS)
+print(delta.summary())
+if args.dry_run:
+    raise SystemExit(0)
+check_deletes(args, manifest, delta)
+
+rows = [t for t in TARGETS if args.full or RV_TARGETS_TABLE.key_of(t) in delta.pending]
+out, count = emit(RV_TARGETS_TABLE, rows, args.out_dir, "rv_targets",
+                  args.format, args.rows_per_statement, delta.deleted)
+if out:
+    print(f"Wrote {out} ({os.path.getsize(out)} bytes) — {count} targets, {len(delta.deleted)} deleted")
+    manifest.save_pending(delta)
+    print("After deploying, run again with --commit-manifest to record it")
+else:
+    manifest.discard_pending()
+    print("No changes since the last deploy — nothing to deploy")
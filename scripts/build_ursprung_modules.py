@@ -6,11 +6,28 @@ This script defines all 25 modules as Python dicts with full theory content
 proper escaping using json.dumps for the JSONB field and SQL-quote-doubling
 for all string fields.
 
-Output: /tmp/ursprung_modules_insert.json (ready to POST to Supabase Mgmt API)
+Output: scripts/supabase_deploy/seed/branch{1..5}.json (ready to POST to Supabase
+Mgmt API), or a COPY script with --format copy-csv/copy-binary. See
+seed_emitter.py for the formats and --rows-per-statement batching.
+
+Only modules added or changed since the last deploy are emitted (plus a
+DELETE for removed ones, with --allow-deletes), based on the row hash
+manifest in the output directory. Use --dry-run to preview the delta and
+--full to emit everything; after deploying, run with --commit-manifest.
 """
+import argparse
 import json
 import os
 
+from seed_emitter import (
+    BOOLEAN, INTEGER, JSONB, REAL, TEXT, TEXT_ARRAY, SeedManifest, SeedTable,
+    add_emitter_arguments, check_deletes, commit_manifest, emit, manifest_path,
+)
+
+parser = argparse.ArgumentParser(description="Build URSPRUNG module seed SQL")
+add_emitter_arguments(parser)
+args = parser.parse_args()
+
 CIA_URL_GATEWAY = "https://www.cia.gov/readingroom/docs/CIA-RDP96-00788R001700210016-5.pdf"
 CIA_URL_GATEWAY_MANUAL = "https://www.cia.gov/readingroom/docs/CIA-RDP96-00788R001700210023-7.pdf"
 CIA_URL_CRV = "https://www.cia.gov/readingroom/docs/CIA-RDP96-00788R001000400001-7.pdf"
@@ -3844,9 +3861,10 @@ Was hast du gelernt? Welche Stages waren stark? Welche schwach? Wie willst du RV
 print(f"Total modules defined: {len(MODULES)}")
 
 # Validate
-with open('/tmp/ursprung_modules_all.json', 'w', encoding='utf-8') as f:
-    json.dump(MODULES, f, ensure_ascii=False, indent=2)
-print(f"Wrote /tmp/ursprung_modules_all.json")
+if not args.dry_run:
+    with open('/tmp/ursprung_modules_all.json', 'w', encoding='utf-8') as f:
+        json.dump(MODULES, f, ensure_ascii=False, indent=2)
+    print(f"Wrote /tmp/ursprung_modules_all.json")
 
 # Check theory_content lengths
 short = 0
@@ -3863,83 +3881,104 @@ print(f"\nTotal: {len(MODULES)} modules, {short} SHORT (need ≥2000 chars)")
 # BUILD SQL INSERT and save as Supabase Management API payload
 # ══════════════════════════════════════════════════════════════════════
 
-def sql_str(s):
-    if s is None:
-        return 'NULL'
-    return "'" + s.replace("'", "''") + "'"
-
-def sql_array(items):
-    if not items:
-        return "ARRAY[]::TEXT[]"
-    return "ARRAY[" + ",".join(sql_str(x) for x in items) + "]::TEXT[]"
-
-def sql_real(v):
-    if v is None:
-        return "NULL"
-    return str(v)
+MODULES_TABLE = SeedTable(
+    "public.ursprung_modules",
+    [
+        ("module_code", TEXT),
+        ("branch", TEXT),
+        ("branch_order", INTEGER),
+        ("title", TEXT),
+        ("subtitle", TEXT),
+        ("theory_content", TEXT),
+        ("cia_source", TEXT),
+        ("cia_source_url", TEXT),
+        ("case_study", TEXT),
+        ("exercise_description", TEXT),
+        ("exercise_duration_minutes", INTEGER),
+        ("audio_frequency_hz", REAL),
+        ("test_questions", JSONB),
+        ("xp_reward", INTEGER),
+        ("is_boss_module", BOOLEAN),
+        ("prerequisites", TEXT_ARRAY),
+        ("youtube_search_query", TEXT),
+        ("gateway_wave", TEXT),
+        ("focus_level", TEXT),
+    ],
+    conflict_key="module_code",
+    update_columns=[
+        "title", "subtitle", "theory_content", "cia_source", "cia_source_url",
+        "case_study", "exercise_description", "exercise_duration_minutes",
+        "audio_frequency_hz", "test_questions", "xp_reward", "is_boss_module",
+        "prerequisites", "youtube_search_query", "gateway_wave", "focus_level",
+    ],
+    cascades=("public.user_ursprung_progress",),
+)
+
+def module_row(m):
+    return (
+        m['module_code'],
+        m['branch'],
+        m['branch_order'],
+        m['title'],
+        m['subtitle'],
+        m['theory_content'],
+        m.get('cia_source'),
+        m.get('cia_source_url'),
+        m.get('case_study'),
+        m['exercise_description'],
+        m.get('exercise_duration_minutes', 15),
+        m.get('audio_frequency_hz'),
+        m['test_questions'],
+        m['xp_reward'],
+        m['is_boss_module'],
+        m.get('prerequisites', []),
+        m.get('youtube_search_query'),
+        m.get('gateway_wave'),
+        m.get('focus_level'),
+    )
 
 
-# Build 5 branch INSERTs (5 modules each)
 branches = ['gateway_foundation', 'focus_levels', 'energy_tools',
             'patterning_manifestation', 'remote_viewing']
-for bidx, bname in enumerate(branches, 1):
-    bmods = [m for m in MODULES if m['branch'] == bname]
-    bmods.sort(key=lambda x: x['branch_order'])
-
-    tuples = []
-    for m in bmods:
-        tq_json = json.dumps(m['test_questions'], ensure_ascii=False)
-        tup = "(" + ",\n  ".join([
-            sql_str(m['module_code']),
-            sql_str(m['branch']),
-            str(m['branch_order']),
-            sql_str(m['title']),
-            sql_str(m['subtitle']),
-            sql_str(m['theory_content']),
-            sql_str(m.get('cia_source')),
-            sql_str(m.get('cia_source_url')),
-            sql_str(m.get('case_study')),
-            sql_str(m['exercise_description']),
-            str(m.get('exercise_duration_minutes', 15)),
-            sql_real(m.get('audio_frequency_hz')),
-            sql_str(tq_json) + "::jsonb",
-            str(m['xp_reward']),
-            str(m['is_boss_module']).lower(),
-            sql_array(m.get('prerequisites', [])),
-            sql_str(m.get('youtube_search_query')),
-            sql_str(m.get('gateway_wave')),
-            sql_str(m.get('focus_level')),
-        ]) + ")"
-        tuples.append(tup)
-
-    sql = ("INSERT INTO public.ursprung_modules\n"
-           "  (module_code, branch, branch_order, title, subtitle, theory_content,\n"
-           "   cia_source, cia_source_url, case_study, exercise_description,\n"
-           "   exercise_duration_minutes, audio_frequency_hz, test_questions,\n"
-           "   xp_reward, is_boss_module, prerequisites, youtube_search_query,\n"
-           "   gateway_wave, focus_level)\n"
-           "VALUES\n" + ",\n".join(tuples) +
-           "\nON CONFLICT (module_code) DO UPDATE SET\n"
-           "  title = EXCLUDED.title,\n"
-           "  subtitle = EXCLUDED.subtitle,\n"
-           "  theory_content = EXCLUDED.theory_content,\n"
-           "  cia_source = EXCLUDED.cia_source,\n"
-           "  cia_source_url = EXCLUDED.cia_source_url,\n"
-           "  case_study = EXCLUDED.case_study,\n"
-           "  exercise_description = EXCLUDED.exercise_description,\n"
-           "  exercise_duration_minutes = EXCLUDED.exercise_duration_minutes,\n"
-           "  audio_frequency_hz = EXCLUDED.audio_frequency_hz,\n"
-           "  test_questions = EXCLUDED.test_questions,\n"
-           "  xp_reward = EXCLUDED.xp_reward,\n"
-           "  is_boss_module = EXCLUDED.is_boss_module,\n"
-           "  prerequisites = EXCLUDED.prerequisites,\n"
-           "  youtube_search_query = EXCLUDED.youtube_search_query,\n"
-           "  gateway_wave = EXCLUDED.gateway_wave,\n"
-           "  focus_level = EXCLUDED.focus_level;\n")
-
-    os.makedirs('/tmp/ursprung_branches', exist_ok=True)
-    out_path = f"/tmp/ursprung_branches/branch{bidx}.json"
-    with open(out_path, 'w', encoding='utf-8') as f:
-        json.dump({"query": sql}, f, ensure_ascii=False)
-    size = os.path.getsize(out_path)
-    print(f"Branch {bidx} ({bname}): {[m['module_code'] for m in bmods]} → {out_path} ({size} bytes)")
+branch_rank = {b: i for i, b in enumerate(branches)}
+ordered = sorted(MODULES, key=lambda m: (branch_rank[m['branch']], m['branch_order']))
+
+manifest = SeedManifest(manifest_path(args, MODULES_TABLE), MODULES_TABLE)
+if args.commit_manifest:
+    raise SystemExit(commit_manifest(manifest))
+
+delta = manifest.diff(module_row(m) for m in ordered)
+print(delta.summary())
+if args.dry_run:
+    raise SystemExit(0)
+check_deletes(args, manifest, delta)
+
+pending = [m for m in ordered if args.full or m['module_code'] in delta.pending]
+
+if args.format == "query":
+    # Build 5 branch payloads (5 modules each) to stay under the API request size
+    for bidx, bname in enumerate(branches, 1):
+        bmods = [m for m in pending if m['branch'] == bname]
+        out_path, _ = emit(MODULES_TABLE, (module_row(m) for m in bmods),
+                           args.out_dir, f"branch{bidx}", args.format,
+                           args.rows_per_statement)
+        if out_path:
+            size = os.path.getsize(out_path)
+            print(f"Branch {bidx} ({bname}): {[m['module_code'] for m in bmods]} → {out_path} ({size} bytes)")
+    out_path, _ = emit(MODULES_TABLE, (), args.out_dir, "deletes", args.format,
+                       deleted_keys=delta.deleted)
+    if out_path:
+        print(f"Deletes: {delta.deleted} → {out_path}")
+else:
+    out_path, count = emit(MODULES_TABLE, (module_row(m) for m in pending),
+                           args.out_dir, "ursprung_modules", args.format,
+                           deleted_keys=delta.deleted)
+    if out_path:
+        print(f"Wrote {out_path} ({os.path.getsize(out_path)} bytes) — {count} modules, {len(delta.deleted)} deleted")
+
+if pending or delta.deleted:
+    manifest.save_pending(delta)
+    print("After deploying, run again with --commit-manifest to record it")
+else:
+    manifest.discard_pending()
+    print("No changes since the last deploy — nothing to deploy")
@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""Shared SQL seed emitter for the Supabase seed builders.
+
+Rows are written straight to the output file as they are produced, never
+assembled into one payload string. Three output formats:
+
+  query        Supabase Management API payload ({"query": "..."}) holding
+               multi-row INSERT ... ON CONFLICT DO UPDATE statements, batched
+               by rows_per_statement.
+  copy-csv     psql script: COPY ... FROM STDIN (FORMAT csv) into a temp
+               staging table, then one upsert into the real table.
+  copy-binary  PGCOPY binary data file plus a psql script that \\copy-loads it
+               into a staging table and upserts from there.
+
+COPY cannot take ON CONFLICT, hence the staging table for both COPY formats.
+
+A SeedManifest keeps one content hash per row (keyed by the table's conflict
+key) as of the last deploy, so builders can emit only inserted/changed rows
+plus a DELETE for rows that disappeared from the catalog. A build only writes
+a pending manifest next to it; running the builder with --commit-manifest
+after the payloads are deployed promotes it. Until then every build diffs
+against the last deployed state, so undeployed changes are emitted again
+rather than lost. Output a build does not rewrite is removed: whatever it
+held is either deployed already or superseded by the current catalog.
+"""
+import hashlib
+import itertools
+import json
+import os
+import struct
+import sys
+
+TEXT = "text"
+INTEGER = "integer"
+REAL = "real"
+BOOLEAN = "boolean"
+JSONB = "jsonb"
+TEXT_ARRAY = "text[]"
+
+FORMATS = ("query", "copy-csv", "copy-binary")
+
+PGCOPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+TEXT_OID = 25
+
+
+def sql_str(s):
+    if s is None:
+        return 'NULL'
+    return "'" + str(s).replace("'", "''") + "'"
+
+def sql_array(items):
+    if not items:
+        return "ARRAY[]::TEXT[]"
+    return "ARRAY[" + ",".join(sql_str(x) for x in items) + "]::TEXT[]"
+
+def sql_real(v):
+    if v is None:
+        return "NULL"
+    return str(v)
+
+
+class SeedTable:
+    """Target table: ordered (name, type) columns plus the upsert key."""
+
+    def __init__(self, name, columns, conflict_key, update_columns=None,
+                 cascades=()):
+        self.name = name
+        self.columns = list(columns)
+        self.column_names = [c for c, _ in self.columns]
+        self.types = [t for _, t in self.columns]
+        self.conflict_key = conflict_key
+        if update_columns is None:
+            update_columns = [c for c in self.column_names if c != conflict_key]
+        self.update_columns = list(update_columns)
+        # Tables whose rows a DELETE here removes through ON DELETE CASCADE
+        self.cascades = tuple(cascades)
+
+    @property
+    def staging_name(self):
+        return "_seed_" + self.name.split(".")[-1]
+
+    def key_of(self, row):
+        return row[self.column_names.index(self.conflict_key)]
+
+    def upsert_clause(self):
+        return (
+            f"ON CONFLICT ({self.conflict_key}) DO UPDATE SET\n"
+            + ",\n".join(f"  {c} = EXCLUDED.{c}" for c in self.update_columns)
+            + ";\n"
+        )
+
+
+# ── SQL literals ──────────────────────────────────────────────────────────
+
+def sql_literal(value, pg_type):
+    if pg_type == TEXT_ARRAY:
+        return sql_array(value)
+    if value is None:
+        return "NULL"
+    if pg_type == TEXT:
+        return sql_str(value)
+    if pg_type == BOOLEAN:
+        return "true" if value else "false"
+    if pg_type == JSONB:
+        return sql_str(json.dumps(value, ensure_ascii=False)) + "::jsonb"
+    if pg_type == REAL:
+        return sql_real(value)
+    return str(int(value))
+
+
+def write_upsert_statements(out, table, rows, rows_per_statement=None):
+    """Write batched multi-row upserts to out; returns (rows, statements)."""
+    header = (
+        f"INSERT INTO {table.name}\n"
+        f"  ({', '.join(table.column_names)})\n"
+        "VALUES\n"
+    )
+    row_count = 0
+    statements = 0
+    in_statement = 0
+
+    for row in rows:
+        if in_statement == 0:
+            if statements:
+                out.write("\n")
+            out.write(header)
+            statements += 1
+        else:
+            out.write(",\n")
+
+        out.write("(")
+        for i, (value, pg_type) in enumerate(zip(row, table.types)):
+            if i:
+                out.write(",\n  ")
+            out.write(sql_literal(value, pg_type))
+        out.write(")")
+
+        row_count += 1
+        in_statement += 1
+        if rows_per_statement and in_statement >= rows_per_statement:
+            out.write("\n" + table.upsert_clause())
+            in_statement = 0
+
+    if in_statement:
+        out.write("\n" + table.upsert_clause())
+    return row_count, statements
+
+
+def delete_statement(table, keys):
+    return (
+        f"DELETE FROM {table.name} WHERE {table.conflict_key} IN (\n  "
+        + ",\n  ".join(sql_str(k) for k in keys)
+        + ");\n"
+    )
+
+
+class QueryPayloadWriter:
+    """Streams a {"query": ...} Management API payload, escaping as it goes.
+
+    The bytes match json.dump({"query": sql}, f, ensure_ascii=False) for the
+    concatenation of everything written.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write('{"query": "')
+        return self
+
+    def write(self, chunk):
+        self._file.write(json.dumps(chunk, ensure_ascii=False)[1:-1])
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.write('"}')
+        self._file.close()
+        return False
+
+
+# ── COPY (CSV) ────────────────────────────────────────────────────────────
+
+def _csv_quote(text):
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _array_literal(items):
+    parts = []
+    for item in items:
+        if item is None:
+            parts.append("NULL")
+        else:
+            escaped = str(item).replace("\\", "\\\\").replace('"', '\\"')
+            parts.append(f'"{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def csv_field(value, pg_type):
+    if pg_type == TEXT_ARRAY:
+        return _csv_quote(_array_literal(value or []))
+    if value is None:
+        return ""
+    if pg_type == TEXT:
+        text = str(value)
+    elif pg_type == BOOLEAN:
+        text = "true" if value else "false"
+    elif pg_type == JSONB:
+        text = json.dumps(value, ensure_ascii=False)
+    elif pg_type == REAL:
+        text = str(value)
+    else:
+        text = str(int(value))
+    return _csv_quote(text)
+
+
+def _staging_prologue(table):
+    return (
+        "BEGIN;\n"
+        f"CREATE TEMP TABLE {table.staging_name} "
+        f"(LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP;\n"
+    )
+
+
+def _staging_epilogue(table, deleted_keys=()):
+    columns = ", ".join(table.column_names)
+    return (
+        f"INSERT INTO {table.name} ({columns})\n"
+        f"SELECT {columns} FROM {table.staging_name}\n"
+        + table.upsert_clause()
+        + (delete_statement(table, deleted_keys) if deleted_keys else "")
+        + "COMMIT;\n"
+    )
+
+
+def write_copy_csv_script(out, table, rows, deleted_keys=()):
+    """Write a psql script that COPYs rows from inline CSV; returns row count."""
+    out.write(_staging_prologue(table))
+    out.write(
+        f"COPY {table.staging_name} ({', '.join(table.column_names)}) "
+        "FROM STDIN WITH (FORMAT csv);\n"
+    )
+    row_count = 0
+    for row in rows:
+        line = ",".join(csv_field(v, t) for v, t in zip(row, table.types))
+        if "\n\\.\n" in f"\n{line}\n":
+            raise ValueError(
+                f"Row {row_count + 1} contains a bare '\\.' line, which ends inline COPY data"
+            )
+        out.write(line + "\n")
+        row_count += 1
+    out.write("\\.\n")
+    out.write(_staging_epilogue(table, deleted_keys))
+    return row_count
+
+
+# ── COPY (binary) ─────────────────────────────────────────────────────────
+
+def _binary_array(items):
+    items = list(items or [])
+    if not items:
+        return struct.pack("!iii", 0, 0, TEXT_OID)
+    has_null = any(item is None for item in items)
+    parts = [struct.pack("!iiiii", 1, int(has_null), TEXT_OID, len(items), 1)]
+    for item in items:
+        if item is None:
+            parts.append(struct.pack("!i", -1))
+        else:
+            data = str(item).encode("utf-8")
+            parts.append(struct.pack("!i", len(data)) + data)
+    return b"".join(parts)
+
+
+def binary_field(value, pg_type):
+    if pg_type == TEXT_ARRAY:
+        data = _binary_array(value)
+    elif value is None:
+        return struct.pack("!i", -1)
+    elif pg_type == TEXT:
+        data = str(value).encode("utf-8")
+    elif pg_type == BOOLEAN:
+        data = b"\x01" if value else b"\x00"
+    elif pg_type == JSONB:
+        data = b"\x01" + json.dumps(value, ensure_ascii=False).encode("utf-8")
+    elif pg_type == REAL:
+        data = struct.pack("!f", value)
+    else:
+        data = struct.pack("!i", int(value))
+    return struct.pack("!i", len(data)) + data
+
+
+def write_copy_binary(out, table, rows):
+    """Write PGCOPY binary tuples to a binary file object; returns row count."""
+    out.write(PGCOPY_SIGNATURE + struct.pack("!ii", 0, 0))
+    field_count = struct.pack("!h", len(table.columns))
+    row_count = 0
+    for row in rows:
+        out.write(
+            field_count
+            + b"".join(binary_field(v, t) for v, t in zip(row, table.types))
+        )
+        row_count += 1
+    out.write(struct.pack("!h", -1))
+    return row_count
+
+
+def write_copy_binary_script(out, table, data_path, deleted_keys=()):
+    out.write(_staging_prologue(table))
+    out.write(
+        f"\\copy {table.staging_name} ({', '.join(table.column_names)}) "
+        f"FROM {sql_str(os.path.abspath(data_path))} WITH (FORMAT binary)\n"
+    )
+    out.write(_staging_epilogue(table, deleted_keys))
+
+
+# ── Row manifest (delta emission) ─────────────────────────────────────────
+
+def row_digest(table, row):
+    payload = json.dumps(
+        dict(zip(table.column_names, row)),
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SeedDelta:
+    def __init__(self, label):
+        self.label = label
+        self.inserted = []
+        self.changed = []
+        self.unchanged = []
+        self.deleted = []
+        self.hashes = {}
+
+    @property
+    def pending(self):
+        return set(self.inserted) | set(self.changed)
+
+    def is_empty(self):
+        return not (self.inserted or self.changed or self.deleted)
+
+    def summary(self):
+        lines = [
+            f"{self.label}: {len(self.inserted)} inserted, {len(self.changed)} changed, "
+            f"{len(self.unchanged)} unchanged, {len(self.deleted)} deleted"
+        ]
+        for name, keys in (("insert", self.inserted), ("update", self.changed),
+                           ("delete", self.deleted)):
+            if keys:
+                lines.append(f"  {name}: {', '.join(str(k) for k in keys)}")
+        return "\n".join(lines)
+
+
+class SeedManifest:
+    """Per-row content hashes as of the last deploy, stored as JSON.
+
+    Builds write <name>.pending.json next to the manifest; commit() promotes
+    it once the payloads have been deployed.
+    """
+
+    def __init__(self, path, table):
+        self.path = path
+        self.table = table
+        self.rows = self._load(path) or {}
+
+    @property
+    def pending_path(self):
+        root, ext = os.path.splitext(self.path)
+        return f"{root}.pending{ext or '.json'}"
+
+    def _load(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("table") != self.table.name:
+            return None
+        return data.get("rows", {})
+
+    def diff(self, rows):
+        delta = SeedDelta(self.table.name)
+        for row in rows:
+            key = self.table.key_of(row)
+            digest = row_digest(self.table, row)
+            delta.hashes[key] = digest
+            previous = self.rows.get(key)
+            if previous is None:
+                delta.inserted.append(key)
+            elif previous != digest:
+                delta.changed.append(key)
+            else:
+                delta.unchanged.append(key)
+        delta.deleted = sorted(k for k in self.rows if k not in delta.hashes)
+        return delta
+
+    def withhold_deletes(self, delta):
+        """Drop delta's deletes, keeping those rows recorded as still deployed."""
+        withheld = delta.deleted
+        for key in withheld:
+            delta.hashes[key] = self.rows[key]
+        delta.deleted = []
+        return withheld
+
+    def has_pending(self):
+        return os.path.exists(self.pending_path)
+
+    def save_pending(self, delta):
+        """Record delta as emitted but not yet deployed."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.pending_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"table": self.table.name, "rows": delta.hashes}, f,
+                      ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.pending_path)
+
+    def discard_pending(self):
+        """Drop a pending manifest that no payload on disk corresponds to."""
+        if os.path.exists(self.pending_path):
+            os.remove(self.pending_path)
+
+    def commit(self):
+        """Promote the pending manifest after a deploy; False if there is none."""
+        rows = self._load(self.pending_path)
+        if rows is None:
+            return False
+        os.replace(self.pending_path, self.path)
+        self.rows = rows
+        return True
+
+
+def commit_manifest(manifest):
+    """--commit-manifest: record the last build as deployed; returns an exit code."""
+    if not manifest.commit():
+        print(f"No pending build for {manifest.table.name} at {manifest.pending_path}",
+              file=sys.stderr)
+        return 1
+    print(f"Recorded {len(manifest.rows)} {manifest.table.name} rows as deployed "
+          f"in {manifest.path}")
+    return 0
+
+
+def check_deletes(args, manifest, delta):
+    """Withhold cascading DELETEs unless --allow-deletes was given."""
+    if not delta.deleted or not manifest.table.cascades:
+        return
+    cascades = ", ".join(manifest.table.cascades)
+    if args.allow_deletes:
+        print(f"WARNING: deleting {len(delta.deleted)} {manifest.table.name} rows also "
+              f"deletes their rows in {cascades} (ON DELETE CASCADE)", file=sys.stderr)
+        return
+    withheld = manifest.withhold_deletes(delta)
+    print(f"WARNING: not emitting DELETE for {', '.join(str(k) for k in withheld)}: "
+          f"it would cascade to {cascades} and remove user data. "
+          "Re-run with --allow-deletes to emit it.", file=sys.stderr)
+
+
+# ── Entry point for builders ──────────────────────────────────────────────
+
+DEFAULT_OUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               "supabase_deploy", "seed")
+
+def add_emitter_arguments(parser):
+    parser.add_argument("--format", choices=FORMATS, default="query",
+                        help="Output format (default: query)")
+    parser.add_argument("--rows-per-statement", type=int, default=None,
+                        help="Rows per INSERT statement in query output (default: all rows in one)")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR,
+                        help="Output directory (default: scripts/supabase_deploy/seed)")
+    parser.add_argument("--manifest", default=None,
+                        help="Row hash manifest of the deployed state (default: <out-dir>/<table>.manifest.json)")
+    parser.add_argument("--commit-manifest", action="store_true",
+                        help="Record the last build as deployed, after its payloads were applied")
+    parser.add_argument("--allow-deletes", action="store_true",
+                        help="Emit DELETEs for removed rows even where they cascade to user data")
+    parser.add_argument("--full", action="store_true",
+                        help="Emit every row, not just rows changed since the manifest")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print the delta against the manifest without writing anything")
+
+
+def manifest_path(args, table):
+    if args.manifest:
+        return args.manifest
+    return os.path.join(args.out_dir, f"{table.name.split('.')[-1]}.manifest.json")
+
+
+def output_paths(out_dir, stem, fmt):
+    if fmt == "query":
+        return [os.path.join(out_dir, f"{stem}.json")]
+    paths = [os.path.join(out_dir, f"{stem}.copy.sql")]
+    if fmt == "copy-binary":
+        paths.append(os.path.join(out_dir, f"{stem}.pgcopy"))
+    return paths
+
+
+def remove_outputs(out_dir, stem):
+    """Delete every output file for stem, in all formats."""
+    for fmt in FORMATS:
+        for path in output_paths(out_dir, stem, fmt):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def emit(table, rows, out_dir, stem, fmt="query", rows_per_statement=None,
+         deleted_keys=()):
+    """Stream rows to out_dir/stem.* in the given format; returns (path, rows).
+
+    Output for the stem from an earlier build, in any format, is removed
+    first, so a deploy never replays a payload the current catalog no longer
+    wants. With no rows and no deleted_keys nothing is written and (None, 0)
+    is returned.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown seed format: {fmt}")
+
+    remove_outputs(out_dir, stem)
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None and not deleted_keys:
+        return None, 0
+    rows = itertools.chain([first], rows) if first is not None else iter(())
+
+    os.makedirs(out_dir, exist_ok=True)
+    path = output_paths(out_dir, stem, fmt)[0]
+
+    if fmt == "query":
+        with QueryPayloadWriter(path) as out:
+            count, statements = write_upsert_statements(
+                out, table, rows, rows_per_statement
+            )
+            if deleted_keys:
+                if statements:
+                    out.write("\n")
+                out.write(delete_statement(table, deleted_keys))
+    elif fmt == "copy-csv":
+        with open(path, "w", encoding="utf-8") as out:
+            count = write_copy_csv_script(out, table, rows, deleted_keys)
+    else:
+        data_path = output_paths(out_dir, stem, fmt)[1]
+        with open(data_path, "wb") as out:
+            count = write_copy_binary(out, table, rows)
+        with open(path, "w", encoding="utf-8") as out:
+            write_copy_binary_script(out, table, data_path, deleted_keys)
+
+    return path, count